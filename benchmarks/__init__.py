@@ -0,0 +1,7 @@
+"""
+This package provides the benchmarks of the news bot.
+
+Run a benchmark as a module from the repository root, e.g.:
+
+    python -m benchmarks.money_benchmark
+"""
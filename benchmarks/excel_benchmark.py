@@ -0,0 +1,166 @@
+"""
+This script benchmarks the Excel writers of the news bot on growing
+numbers of articles.
+
+It saves generated articles with StreamingExcel and with Excel (the
+default writer) and reports, for each number of articles, the time of
+the save and the growth of the peak memory (resident set size) of the
+process during it. Every save runs in a fresh process, so the peaks of
+the different saves do not hide each other. The peak memory of
+StreamingExcel must stay the same however many articles are saved: the
+script fails if it grows more than a few megabytes from the smallest to
+the largest number of articles.
+
+Dependencies:
+    - concurrent.futures
+    - multiprocessing
+    - os
+    - resource
+    - sys
+    - tempfile
+    - time
+    - datetime
+    - typing
+    - news_bot.handlers
+    - news_bot.models.Article
+
+Usage:
+    python -m benchmarks.excel_benchmark
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from news_bot.handlers import Excel, StreamingExcel
+from news_bot.models import Article
+
+WRITERS: dict[str, type] = {'streaming': StreamingExcel, 'default': Excel}
+SIZES: tuple[int, ...] = (100, 1_000, 10_000, 100_000)
+# The default writer holds every row in memory, so it is only run on the
+# smaller sizes
+MAX_DEFAULT_SIZE: int = 10_000
+# Tolerated growth of the peak memory of the streaming writer from the
+# smallest to the largest size, in megabytes
+MAX_PEAK_GROWTH_MB: float = 8.0
+
+
+def generate_articles(count: int) -> Iterator[Article]:
+    """
+    Generates articles one at a time, so they are not held in memory
+    by the benchmark.
+
+    Args:
+        count (int): The number of articles.
+
+    Yields:
+        Article: Articles with varied texts, dates and mentions of
+                 money, newest first.
+    """
+    newest_date: datetime = datetime(2024, 6, 30)
+    for index in range(count):
+        money_mentions: tuple = ()
+        if index % 3 == 0:
+            money_mentions = ((1_500_000.0 + index, '$'),)
+        yield Article(
+            f'City council article {index} approves new budget',
+            f'The plan {index} adds parks, roads and schools across the '
+            f'city over the next {index % 10 + 1} years.',
+            newest_date - timedelta(minutes=index),
+            f'https://example.com/images/{index}.jpg', f'{index}.jpg',
+            money_mentions, index % 4)
+
+
+def peak_memory_mb() -> float:
+    """
+    Returns the peak resident set size of the current process.
+
+    Returns:
+        float: The peak memory, in megabytes.
+    """
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        # Reported in bytes on macOS, in kilobytes elsewhere
+        return peak / 1024 / 1024
+    return peak / 1024
+
+
+def measure_writer(writer_name: str, size: int) -> tuple[float, float]:
+    """
+    Saves generated articles with a writer and measures the save.
+
+    Args:
+        writer_name (str): The name of the writer (see WRITERS).
+        size (int): The number of articles.
+
+    Returns:
+        tuple[float, float]: The time of the save, in seconds, and the
+                             growth of the peak memory of the process
+                             during it, in megabytes.
+    """
+    with tempfile.TemporaryDirectory() as output_dir:
+        excel_path: str = os.path.join(output_dir, 'articles.xlsx')
+        writer = WRITERS[writer_name]()
+        peak_before: float = peak_memory_mb()
+        started_at: float = time.perf_counter()
+        writer.save_articles_excel(generate_articles(size), excel_path)
+        seconds: float = time.perf_counter() - started_at
+        return seconds, peak_memory_mb() - peak_before
+
+
+def measure_in_new_process(writer_name: str,
+                           size: int) -> tuple[float, float]:
+    """
+    Runs measure_writer in a fresh process.
+
+    Args:
+        writer_name (str): The name of the writer (see WRITERS).
+        size (int): The number of articles.
+
+    Returns:
+        tuple[float, float]: The time of the save, in seconds, and the
+                             growth of the peak memory during it, in
+                             megabytes.
+    """
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure_writer, writer_name, size).result()
+
+
+def main() -> int:
+    """
+    Runs the benchmark and prints its results.
+
+    Returns:
+        int: The exit status, 1 if the peak memory of StreamingExcel
+             grew with the number of articles, 0 otherwise.
+    """
+    print('Excel writers (seconds, peak memory growth in MB)')
+    print(f'  {"articles":>8} {"streaming":>18} {"default":>18}')
+    streaming_peaks: list[float] = []
+    for size in SIZES:
+        seconds, peak = measure_in_new_process('streaming', size)
+        streaming_peaks.append(peak)
+        default_result: str = '-'
+        if size <= MAX_DEFAULT_SIZE:
+            default_seconds, default_peak = measure_in_new_process(
+                'default', size)
+            default_result = f'{default_seconds:.2f}s {default_peak:.1f}MB'
+        print(f'  {size:>8} {f"{seconds:.2f}s {peak:.1f}MB":>18} '
+              f'{default_result:>18}')
+    growth: float = streaming_peaks[-1] - streaming_peaks[0]
+    if growth > MAX_PEAK_GROWTH_MB:
+        print(f'The peak memory of StreamingExcel grew by {growth:.1f}MB.')
+        return 1
+    print('The peak memory of StreamingExcel stays constant.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""
+This module provides an offline stand-in for the LA Times website, used
+by the benchmarks.
+
+It generates search results pages with the same markup as the LA Times
+search (results menu, topic filters and next page link), and images
+served through an image resizing proxy path, and serves them from a
+local HTTP server. The content is generated from a seed, so every run
+of a benchmark scrapes exactly the same pages.
+
+Classes:
+    FixtureSite: Generates the search results pages and images.
+    FixtureServer: Serves a FixtureSite from a local HTTP server.
+
+Dependencies:
+    - hashlib
+    - html
+    - http.server
+    - random
+    - threading
+    - datetime
+    - typing
+    - urllib.parse
+"""
+
+import hashlib
+import html
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+from urllib.parse import parse_qs, quote, urlencode, urlparse
+
+TOPICS: dict[str, str] = {
+    'Politics': '00000168-8694-d4bc-a5fd-be94e48b0000',
+    'Business': '00000168-8694-d4bc-a5fd-be94e48b0001',
+    'Sports': '00000168-8694-d4bc-a5fd-be94e48b0002',
+    'California': '00000168-8694-d4bc-a5fd-be94e48b0003',
+}
+WORDS: tuple[str, ...] = (
+    'city', 'council', 'budget', 'plan', 'water', 'fire', 'housing',
+    'election', 'court', 'school', 'traffic', 'market', 'storm', 'park',
+    'report', 'officials', 'residents', 'project', 'state', 'county',
+)
+MONEY_MENTIONS: tuple[str, ...] = (
+    '$1.5 million', '$250', '$12,000,000.50', '40 dollars', '300 USD',
+)
+
+
+class FixtureSite:
+    """
+    Generator of the fixture search results pages and images.
+
+    The search returns `pages` results pages of `articles_per_page`
+    articles each, sorted newest first. The first articles are dated
+    with relative times (e.g. '3 hours ago') and the others with the
+    absolute date formats the LA Times uses, one day apart. Every
+    article has a distinct image of `image_size` bytes.
+
+    Attributes:
+        pages (int): The number of results pages.
+        articles_per_page (int): The number of articles on each page.
+        image_size (int): The size of each image, in bytes.
+    """
+
+    def __init__(self, pages: int = 10, articles_per_page: int = 10,
+                 image_size: int = 50_000, seed: int = 0,
+                 newest_date: datetime = datetime(2024, 6, 30)) -> None:
+        self.pages = pages
+        self.articles_per_page = articles_per_page
+        self.image_size = image_size
+        self.__seed = seed
+        self.__newest_date = newest_date
+
+    def search_page(self, base_url: str, page_number: int,
+                    query: str) -> str:
+        """
+        Renders a search results page.
+
+        Args:
+            base_url (str): The URL the site is served from, used to
+                            build the image URLs.
+            page_number (int): The number of the results page.
+            query (str): The query string of the request, kept in the
+                         next page link.
+
+        Returns:
+            str: The HTML of the page. Pages past the last one have no
+                 articles.
+        """
+        articles: list[str] = []
+        if 1 <= page_number <= self.pages:
+            first_index: int = (page_number - 1) * self.articles_per_page
+            articles = [
+                self.__article_html(base_url, index)
+                for index in range(first_index,
+                                   first_index + self.articles_per_page)
+                ]
+        topics: str = ''.join(
+            f'<li><label><input type="checkbox" name="f0" value="{value}">'
+            f'<span>{html.escape(title)}</span></label></li>'
+            for title, value in TOPICS.items()
+            )
+        next_page: str = ''
+        if page_number < self.pages:
+            params: dict[str, list[str]] = parse_qs(query)
+            params['p'] = [str(page_number + 1)]
+            next_page = (
+                '<div class="search-results-module-next-page">'
+                f'<a href="/search?{urlencode(params, doseq=True)}">Next</a>'
+                '</div>'
+                )
+        return (
+            '<!DOCTYPE html><html><head><title>Search</title></head><body>'
+            '<aside><div data-name="Topics"><ul>'
+            f'{topics}</ul></div></aside>'
+            '<ul class="search-results-module-results-menu">'
+            f"{''.join(articles)}</ul>{next_page}</body></html>"
+            )
+
+    def image(self, image_number: int) -> bytes:
+        """
+        Generates the content of an image.
+
+        Args:
+            image_number (int): The number of the image.
+
+        Returns:
+            bytes: The content of the image.
+        """
+        image_random = random.Random(f'{self.__seed}-image-{image_number}')
+        return image_random.randbytes(self.image_size)
+
+    def article_date(self, index: int) -> str:
+        """
+        Returns the date text of an article.
+
+        Args:
+            index (int): The position of the article in the results.
+
+        Returns:
+            str: The date text, relative for the first articles and
+                 absolute, one day apart, for the others.
+        """
+        if index < 3:
+            return f'{index + 1} hours ago'
+        date: datetime = self.__newest_date - timedelta(days=index)
+        if index % 3 == 0:
+            return f'{date:%B} {date.day}, {date.year}'
+        if index % 3 == 1:
+            return f'{date:%b}. {date.day}, {date.year}'
+        return f'{date.month}/{date.day}/{date.year}'
+
+    def __article_html(self, base_url: str, index: int) -> str:
+        """
+        Renders an article of the results menu.
+
+        Args:
+            base_url (str): The URL the site is served from.
+            index (int): The position of the article in the results.
+
+        Returns:
+            str: The HTML of the article.
+        """
+        article_random = random.Random(f'{self.__seed}-article-{index}')
+        title: str = ' '.join(article_random.choices(WORDS, k=8)).capitalize()
+        description: str = ' '.join(article_random.choices(WORDS, k=30))
+        if article_random.random() < 0.3:
+            description += f' costs {article_random.choice(MONEY_MENTIONS)}'
+        image_url: str = quote(f'{base_url}/images/{index}.jpg', safe='')
+        image_src: str = (
+            '/dims4/default/0a1b2c3/2147483647/strip/true/crop/2000x1333+0+0/'
+            f'resize/320x213!/quality/75/?url={image_url}'
+            )
+        return (
+            '<li><ps-promo class="promo">'
+            '<div class="promo-media"><a href="#">'
+            f'<img class="image" src="{html.escape(image_src)}" alt="">'
+            '</a></div>'
+            '<div class="promo-content">'
+            f'<h3 class="promo-title"><a href="#">{html.escape(title)}</a></h3>'
+            f'<p class="promo-description">{html.escape(description)}</p>'
+            f'<p class="promo-timestamp">{self.article_date(index)}</p>'
+            '</div></ps-promo></li>'
+            )
+
+class FixtureServer:
+    """
+    Local HTTP server of a FixtureSite.
+
+    It serves the search results pages at '/search' (the topic filter
+    and sort order are accepted but do not change the results), the
+    images at '/images/<number>.jpg', with an ETag so conditional
+    requests can be answered with '304 Not Modified', and the image
+    resizing proxy at '/dims4/...', which returns a tenth of the image.
+    The homepage is an empty page.
+
+    The server runs in a background thread and is used as a context
+    manager:
+
+        with FixtureServer(FixtureSite()) as server:
+            browser = LATimesHTTPBrowser(server.url)
+
+    Attributes:
+        site (FixtureSite): The served site.
+        url (str): The URL the site is served from, available once the
+                   server is started.
+    """
+
+    def __init__(self, site: FixtureSite) -> None:
+        self.site = site
+        self.url: Optional[str] = None
+        self.__server: Optional[ThreadingHTTPServer] = None
+        self.__thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'FixtureServer':
+        site: FixtureSite = self.site
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately, so without this
+            # every response on a kept-alive connection would wait for
+            # a delayed acknowledgement
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                request_url = urlparse(self.path)
+                base_url: str = f'http://{self.headers["Host"]}'
+                if request_url.path == '/search':
+                    page_number: int = int(
+                        parse_qs(request_url.query).get('p', ['1'])[0])
+                    self.__send(site.search_page(base_url, page_number,
+                                                 request_url.query).encode(),
+                                'text/html; charset=utf-8')
+                elif request_url.path.startswith('/images/'):
+                    image_number: int = int(
+                        request_url.path.rsplit('/', 1)[1].split('.')[0])
+                    image: bytes = site.image(image_number)
+                    etag: str = f'"{hashlib.sha1(image).hexdigest()}"'
+                    if self.headers.get('If-None-Match') == etag:
+                        self.send_response(304)
+                        self.send_header('ETag', etag)
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    self.__send(image, 'image/jpeg', etag)
+                elif request_url.path.startswith('/dims4/'):
+                    original_url: str = parse_qs(request_url.query)['url'][0]
+                    image_number = int(
+                        original_url.rsplit('/', 1)[1].split('.')[0])
+                    image = site.image(image_number)
+                    self.__send(image[:len(image) // 10], 'image/jpeg')
+                elif request_url.path == '/':
+                    self.__send(b'<!DOCTYPE html><html><body></body></html>',
+                                'text/html; charset=utf-8')
+                else:
+                    self.send_error(404)
+
+            def __send(self, body: bytes, content_type: str,
+                       etag: Optional[str] = None) -> None:
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                if etag is not None:
+                    self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                # Keep the benchmark output clean
+                pass
+
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.__server.daemon_threads = True
+        host, port = self.__server.server_address[:2]
+        self.url = f'http://{host}:{port}'
+        self.__thread = threading.Thread(target=self.__server.serve_forever,
+                                         name='fixture-server', daemon=True)
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
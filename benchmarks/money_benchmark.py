@@ -0,0 +1,142 @@
+"""
+This script benchmarks the detection of mentions of money in article 
+texts.
+
+It times MoneyUtil.find_money against the regular expression the news 
+bot used before it, both on typical article texts and on adversarial 
+inputs (long digit runs that are not money) of growing size. The time 
+of MoneyUtil.find_money must grow linearly with the input: the script 
+fails if it grows much faster than the input size.
+
+Dependencies:
+    - re
+    - sys
+    - timeit
+    - typing
+    - news_bot.utils.MoneyUtil
+
+Usage:
+    python -m benchmarks.money_benchmark
+"""
+
+import re
+import sys
+import timeit
+from typing import Optional
+
+from news_bot.utils import MoneyUtil
+
+LEGACY_MONEY_PATTERN: str = (
+    r'\$\d{1,3}((,?\d{3})|(\d*))*(\.\d{1,2})?'
+    r'|(\d{1,3}(,?\d{3})*(\.\d{1,2})? (dollars|USD))'
+)
+TYPICAL_TEXTS: list[str] = [
+    'City council approves $1.5 million budget for new parks | The '
+    'plan adds 20 parks by 2030.',
+    'Tech company fined 11,000 dollars over privacy breach | The fine '
+    'is the largest this year.',
+    'Weather: sunny skies expected all week | Temperatures will reach '
+    '85 degrees on Friday.',
+]
+ADVERSARIAL_INPUTS: dict[str, str] = {
+    'digit run': '1',
+    'comma groups': '1,234',
+    'digit run after sign': '$1',
+}
+SIZES: tuple[int, ...] = (1_000, 10_000, 100_000)
+# The former expression takes quadratic time, so it is only timed on the
+# smaller inputs
+MAX_LEGACY_SIZE: int = 10_000
+# Tolerated growth of the time per input character between two sizes
+MAX_GROWTH: float = 3.0
+
+
+def legacy_is_contains_money(text: str) -> bool:
+    """
+    Checks for a mention of money with the former regular expression.
+
+    Args:
+        text (str): The text to search for mentions of money.
+
+    Returns:
+        bool: True if the text contains a mention of money, False 
+              otherwise.
+    """
+    return re.search(LEGACY_MONEY_PATTERN, text.lower()) is not None
+
+
+def best_time(function, text: str, repeat: int = 5) -> float:
+    """
+    Times a function on a text.
+
+    Args:
+        function: The function to time.
+        text (str): The argument of the function.
+        repeat (int): The number of timings to take.
+
+    Returns:
+        float: The best of the timings, in seconds.
+    """
+    return min(timeit.repeat(lambda: function(text), number=1,
+                             repeat=repeat))
+
+
+def adversarial_text(unit: str, size: int) -> str:
+    """
+    Builds an adversarial input by repeating a unit up to a size and 
+    ending it with a character that makes every match attempt fail.
+
+    Args:
+        unit (str): The repeated unit.
+        size (int): The approximate size of the input.
+
+    Returns:
+        str: The adversarial input.
+    """
+    return unit * (size // len(unit)) + ' x'
+
+
+def main() -> int:
+    """
+    Runs the benchmark and prints its results.
+
+    Returns:
+        int: The exit status, 1 if the time of MoneyUtil.find_money 
+             grew faster than its input, 0 otherwise.
+    """
+    print('Typical texts (seconds per text)')
+    for function in (legacy_is_contains_money, MoneyUtil.find_money):
+        timings: list[float] = [best_time(function, text)
+                                for text in TYPICAL_TEXTS]
+        print(f'  {function.__qualname__:<28} '
+              f'{sum(timings) / len(timings):.2e}')
+    is_linear: bool = True
+    for name, unit in ADVERSARIAL_INPUTS.items():
+        print(f'Adversarial input: {name} (seconds)')
+        print(f'  {"size":>8} {"legacy":>10} {"find_money":>10}')
+        previous: Optional[tuple[int, float]] = None
+        for size in SIZES:
+            text: str = adversarial_text(unit, size)
+            legacy_time: str = '-'
+            if size <= MAX_LEGACY_SIZE:
+                legacy_time = (
+                    f'{best_time(legacy_is_contains_money, text, repeat=1):.2e}'
+                    )
+            new_time: float = best_time(MoneyUtil.find_money, text)
+            print(f'  {size:>8} {legacy_time:>10} {new_time:>10.2e}')
+            if previous is not None:
+                previous_size, previous_time = previous
+                growth: float = ((new_time / size)
+                                 / (previous_time / previous_size))
+                if growth > MAX_GROWTH:
+                    is_linear = False
+            previous = (size, new_time)
+    if not is_linear:
+        print('MoneyUtil.find_money does not run in linear time.')
+        return 1
+    print('MoneyUtil.find_money runs in linear time.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""
+This script benchmarks every stage of the news bot against an offline
+copy of the LA Times search.
+
+It serves generated search results pages and images from a local HTTP
+server (see benchmarks.fixtures) and times, with the HTTP backend:
+    - open_website, search, select_newest_articles and select_topic,
+    - get_page_articles, for each results page,
+    - DateUtil.date_to_datetime, for the date of every article,
+    - MoneyUtil.find_money, for the text of every article,
+    - Excel.save_articles_excel, for every article,
+    - ImageUtil.download_images, for the image of every article.
+
+Every stage is run several times and the results are written as JSON
+(with the revision of the code, so the results of different releases
+can be compared).
+
+Dependencies:
+    - argparse
+    - json
+    - logging
+    - os
+    - platform
+    - statistics
+    - subprocess
+    - sys
+    - tempfile
+    - time
+    - datetime
+    - typing
+    - benchmarks.fixtures
+    - news_bot.handlers.Excel
+    - news_bot.http_handlers.LATimesHTTPBrowser
+    - news_bot.utils
+
+Usage:
+    python -m benchmarks.stage_benchmark [--pages 10] [--repeat 5]
+                                         [--output stage_benchmark.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from benchmarks.fixtures import TOPICS, FixtureServer, FixtureSite
+from news_bot.handlers import Excel
+from news_bot.http_handlers import LATimesHTTPBrowser
+from news_bot.models import Article
+from news_bot.utils import DateUtil, ImageUtil, MoneyUtil
+
+PHRASE: str = 'city'
+TOPIC: str = next(iter(TOPICS))
+
+
+def time_runs(stage: Callable[[], None], repeat: int) -> list[float]:
+    """
+    Times several runs of a stage.
+
+    Args:
+        stage (Callable[[], None]): The stage to run.
+        repeat (int): The number of runs.
+
+    Returns:
+        list[float]: The duration of each run, in seconds.
+    """
+    durations: list[float] = []
+    for _ in range(repeat):
+        started_at: float = time.perf_counter()
+        stage()
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+def summarize(durations: list[float], items: int) -> dict:
+    """
+    Summarizes the durations of the runs of a stage.
+
+    Args:
+        durations (list[float]): The duration of each run, in seconds.
+        items (int): The number of items processed by each run.
+
+    Returns:
+        dict: The durations, their best and median, the number of items
+              and the median duration per item.
+    """
+    median: float = statistics.median(durations)
+    return {
+        'runs': durations,
+        'best_seconds': min(durations),
+        'median_seconds': median,
+        'items': items,
+        'median_seconds_per_item': median / items if items else None,
+    }
+
+
+def git_revision() -> Optional[str]:
+    """
+    Returns the revision of the benchmarked code.
+
+    Returns:
+        Optional[str]: The hash of the current git commit, or None if it
+                       is not available.
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def open_browser(url: str) -> LATimesHTTPBrowser:
+    """
+    Opens the HTTP backend on the fixture site and performs the search,
+    sort and topic selection.
+
+    Args:
+        url (str): The URL of the fixture site.
+
+    Returns:
+        LATimesHTTPBrowser: The browser, on the first results page.
+    """
+    browser = LATimesHTTPBrowser(url)
+    browser.open_website()
+    browser.search(PHRASE)
+    browser.select_newest_articles()
+    browser.select_topic(TOPIC)
+    return browser
+
+
+def run_benchmark(pages: int, articles_per_page: int, image_size: int,
+                  image_workers: int, repeat: int) -> dict:
+    """
+    Runs the benchmark of every stage.
+
+    Args:
+        pages (int): The number of results pages of the fixture search.
+        articles_per_page (int): The number of articles on each page.
+        image_size (int): The size of each image, in bytes.
+        image_workers (int): The number of concurrent image downloads.
+        repeat (int): The number of runs of each stage.
+
+    Returns:
+        dict: The parameters and the results of the benchmark.
+    """
+    site = FixtureSite(pages, articles_per_page, image_size)
+    stages: dict[str, dict] = {}
+    with FixtureServer(site) as server, \
+            tempfile.TemporaryDirectory() as output_dir:
+        stages['open_search_topic'] = summarize(
+            time_runs(lambda: open_browser(server.url).close_browser(),
+                      repeat), 1)
+
+        browser: LATimesHTTPBrowser = open_browser(server.url)
+        page_durations: list[list[float]] = []
+        articles: list[Article] = []
+        for page_number in range(1, pages + 1):
+            page_durations.append(time_runs(
+                lambda: browser.get_page_articles_at(page_number, PHRASE),
+                repeat))
+            articles.extend(browser.get_page_articles_at(page_number, PHRASE))
+        browser.close_browser()
+        stages['get_page_articles'] = summarize(
+            [sum(durations) for durations in zip(*page_durations)], pages)
+        stages['get_page_articles']['pages'] = [
+            summarize(durations, articles_per_page)
+            for durations in page_durations
+            ]
+
+        date_texts: list[str] = [site.article_date(index)
+                                 for index in range(len(articles))]
+        stages['date_to_datetime'] = summarize(
+            time_runs(lambda: [DateUtil.date_to_datetime(date_text)
+                               for date_text in date_texts], repeat),
+            len(date_texts))
+
+        article_texts: list[str] = [
+            f'{article.title} | {article.description}'
+            for article in articles
+            ]
+        stages['find_money'] = summarize(
+            time_runs(lambda: [MoneyUtil.find_money(article_text)
+                               for article_text in article_texts], repeat),
+            len(article_texts))
+
+        excel_path: str = os.path.join(output_dir, 'articles.xlsx')
+        stages['save_articles_excel'] = summarize(
+            time_runs(lambda: Excel().save_articles_excel(articles,
+                                                          excel_path),
+                      repeat), len(articles))
+
+        image_srcs: list[str] = [article.image_src for article in articles]
+        reports: list[dict] = []
+
+        def download_images() -> None:
+            images_dir: str = tempfile.mkdtemp(dir=output_dir)
+            reports.append(ImageUtil(workers=image_workers).download_images(
+                image_srcs, images_dir))
+
+        stages['download_images'] = summarize(
+            time_runs(download_images, repeat), len(image_srcs))
+        stages['download_images']['reports'] = reports
+    return {
+        'benchmark': 'stages',
+        'created_at': datetime.now().isoformat(),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {
+            'pages': pages,
+            'articles_per_page': articles_per_page,
+            'image_size': image_size,
+            'image_workers': image_workers,
+            'repeat': repeat,
+        },
+        'stages': stages,
+    }
+
+
+def main() -> int:
+    """
+    Parses the command line, runs the benchmark and writes its results.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark every stage of the news bot offline.')
+    parser.add_argument('--pages', type=int, default=10,
+                        help='number of results pages (default: 10)')
+    parser.add_argument('--articles-per-page', type=int, default=10,
+                        help='number of articles on each page (default: 10)')
+    parser.add_argument('--image-size', type=int, default=50_000,
+                        help='size of each image in bytes (default: 50000)')
+    parser.add_argument('--image-workers', type=int, default=8,
+                        help='number of concurrent image downloads '
+                             '(default: 8)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs of each stage (default: 5)')
+    parser.add_argument('--output', default='stage_benchmark.json',
+                        help='path of the JSON results '
+                             '(default: stage_benchmark.json)')
+    args = parser.parse_args()
+    # Only report problems, not the progress of every stage
+    logging.getLogger().setLevel(logging.WARNING)
+    results: dict = run_benchmark(args.pages, args.articles_per_page,
+                                  args.image_size, args.image_workers,
+                                  args.repeat)
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(results, output_file, indent=2)
+    for name, stage in results['stages'].items():
+        print(f'{name:<22} median {stage["median_seconds"]:.4f} s '
+              f'({stage["items"]} items)')
+    print(f'Results written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
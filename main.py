@@ -2,31 +2,86 @@
 This script uses the LATimesNewsBot to scrape articles from the LA 
 Times website.
 
-The script retrieves input parameters (phrase, topic, number_of_months) 
-from work items, initializes the news bot, and scrapes articles based 
-on the given parameters. The results are saved to an Excel file and 
-images are downloaded to the specified artifacts directory.
+The script retrieves input parameters (phrase, topic, number_of_months 
+and, optionally, the scraping backend, number of workers, incremental 
+scraping, resumable scraping, deep links, lean browser, image cache, 
+image rendition and profiling options) from work items, initializes 
+the news bot, and scrapes articles based on the given parameters. The 
+results are saved to an Excel file and images are downloaded to the 
+specified artifacts directory, together with the metrics (and, if 
+requested, the profile) of the run.
 
 Dependencies:
+    - argparse
+    - concurrent.futures
     - datetime
     - calendar
+    - itertools
+    - logging
+    - multiprocessing
+    - os
+    - socket
+    - sys
+    - threading
+    - time
+    - typing
     - dateutil.relativedelta
     - RPA.Robocorp.WorkItems
     - news_bot.LATimesNewsBot
+    - news_bot.daemon.NewsBotDaemon
+    - news_bot.handlers.BrowserProfile
+    - news_bot.handlers.LATimesBrowser
+    - news_bot.http_handlers.LATimesHTTPBrowser
+    - news_bot.profiling.Profiler
+    - news_bot.queues
 
 Usage:
     The script is designed to be run as a standalone program.
     It retrieves work item variables and uses them to perform the 
-    scraping.
+    scraping. With --batch, it runs the query of every input work item 
+    in a pool of worker processes (--processes) and creates an output 
+    work item for each of them. With --queue <path> --enqueue, it adds 
+    the query of every input work item to a job queue shared by several 
+    hosts, and with --queue <path>, it runs worker processes that 
+    process the jobs of the queue until it is drained. With 
+    --serve <socket>, it runs a daemon that keeps a warm browser, and 
+    with --connect <socket>, it runs the query of every input work item 
+    with that daemon. With --batch --session, it runs the queries one 
+    after another in one browser session instead of a pool of processes.
 """
 
+import argparse
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from datetime import datetime
 import calendar
+import itertools
+import logging
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Iterator, Optional
 from dateutil.relativedelta import relativedelta
 
-from RPA.Robocorp.WorkItems import WorkItems
+from RPA.Robocorp.WorkItems import WorkItem, WorkItems
 
 from news_bot import LATimesNewsBot
+from news_bot.daemon import NewsBotDaemon
+from news_bot.handlers import BrowserProfile, LATimesBrowser
+from news_bot.http_handlers import LATimesHTTPBrowser
+from news_bot.profiling import Profiler
+from news_bot.queues import LeaseKeeper, SQLiteJobQueue
+
+logger = logging.getLogger(__name__)
+ARTIFACTS_DIR: str = 'output'
+STATE_DIR: str = 'state'
+TOPIC_FILTERS_PATH: str = f'{STATE_DIR}/topic_filters.json'
+# How often queue workers renew the lease of their job and look for new
+# jobs, in seconds
+HEARTBEAT_SECONDS: float = 60
+POLL_SECONDS: float = 10
 
 def month_start_end_dates(months_count: int) -> tuple[datetime, datetime]:
     """
@@ -59,18 +114,543 @@ def month_start_end_dates(months_count: int) -> tuple[datetime, datetime]:
 
     return start, end
 
-if __name__ == '__main__':
-    # Get input work item variables
-    work_items: WorkItems = WorkItems()
-    work_items.get_input_work_item()
-    phrase: str = work_items.get_work_item_variable('phrase')
-    topic: str = work_items.get_work_item_variable('topic')
-    number_of_months: int = work_items.get_work_item_variable('number_of_months')
+def to_list(value) -> list[str]:
+    """
+    Converts a work item variable holding several values, either a list 
+    or a comma-separated string, to a list.
+
+    Args:
+        value: The value of the variable.
+
+    Returns:
+        list[str]: The values, without surrounding spaces.
+    """
+    if isinstance(value, str):
+        value = value.split(',')
+    return [item.strip() for item in value if item.strip()]
+
+def create_browser_profile(variables: dict) -> Optional[BrowserProfile]:
+    """
+    Creates the lean profile of the Selenium browser from the variables 
+    of a work item: 'lean_browser' (defaults to true), 'blocked_domains' 
+    (added to the default deny list) and 'allowed_domains'.
+
+    Args:
+        variables (dict): The variables of the input work item.
+
+    Returns:
+        Optional[BrowserProfile]: The profile, or None if the browser 
+                                  must be opened with the defaults.
+    """
+    if not variables.get('lean_browser', True):
+        return None
+    return BrowserProfile(
+        blocked_domains=(BrowserProfile.DEFAULT_BLOCKED_DOMAINS
+                         + tuple(to_list(variables.get('blocked_domains',
+                                                       [])))),
+        allowed_domains=to_list(variables.get('allowed_domains', [])))
+
+def run_query(variables: dict, artifacts_dir: str, browser=None,
+              stop_event: Optional[threading.Event] = None) -> str:
+    """
+    Runs the news bot for the query of a work item.
+
+    Args:
+        variables (dict): The variables of the input work item (phrase, 
+                          topic, number_of_months and the optional 
+                          parameters).
+        artifacts_dir (str): The directory where the Excel file, the 
+                             images, the metrics and the profile of the 
+                             run are saved.
+        browser: An open browser (LATimesBrowser or LATimesHTTPBrowser) 
+                 to reuse, e.g. the warm browser of the daemon. Defaults 
+                 to None (the run launches its own).
+        stop_event (Optional[threading.Event]): Stops the scrape once 
+                                                set, e.g. when the 
+                                                lease of a job is lost. 
+                                                Defaults to None.
+
+    Returns:
+        str: The path of the Excel file with the scraped articles.
+    """
+    phrase: str = variables['phrase']
+    topic: str = variables['topic']
+    number_of_months: int = variables['number_of_months']
+    backend: str = variables.get('backend', 'selenium')
+    workers: int = int(variables.get('workers', 1))
+    incremental: bool = variables.get('incremental', False)
+    only_new: bool = variables.get('only_new', False)
+    resume: bool = variables.get('resume', False)
+    image_cache: bool = variables.get('image_cache', False)
+    image_max_width: Optional[int] = variables.get('image_max_width')
+    image_quality: Optional[int] = variables.get('image_quality')
+    profile: Optional[str] = variables.get('profile')
+    deep_link: bool = variables.get('deep_link', True)
+    prefetch_pages: bool = variables.get('prefetch_pages', False)
+    streaming_excel: bool = variables.get('streaming_excel', False)
+    user_agent: str = variables.get('user_agent',
+                                    LATimesHTTPBrowser.USER_AGENT)
+    browser_profile: Optional[BrowserProfile] = create_browser_profile(
+        variables)
     # Get additional news bot parameters
     start_date, end_date = month_start_end_dates(number_of_months)
-    ARTIFACTS_DIR: str = 'output'
-    excel_dir: str = f"{ARTIFACTS_DIR}/{datetime.now().strftime('%m-%d-%Y_%H-%M')}.xlsx"
-    IMAGES_DIR: str = ARTIFACTS_DIR
+    os.makedirs(artifacts_dir, exist_ok=True)
+    excel_dir: str = f"{artifacts_dir}/{datetime.now().strftime('%m-%d-%Y_%H-%M')}.xlsx"
+    store_path: Optional[str] = None
+    if incremental:
+        store_path = f'{STATE_DIR}/articles.sqlite3'
+    journal_path: Optional[str] = None
+    if resume:
+        journal_path = f'{STATE_DIR}/journal.sqlite3'
+    if image_max_width is not None:
+        image_max_width = int(image_max_width)
+    if image_quality is not None:
+        image_quality = int(image_quality)
+    image_cache_dir: Optional[str] = None
+    if image_cache:
+        image_cache_dir = f'{STATE_DIR}/image_cache'
     # Initialize and run the news bot
-    news_bot: LATimesNewsBot = LATimesNewsBot(excel_dir, IMAGES_DIR)
-    news_bot.run(phrase, start_date, end_date, topic)
+    news_bot: LATimesNewsBot = LATimesNewsBot(excel_dir, artifacts_dir,
+                                              backend, workers, store_path,
+                                              only_new, image_cache_dir,
+                                              image_max_width, image_quality,
+                                              metrics_dir=artifacts_dir,
+                                              journal_path=journal_path,
+                                              browser=browser,
+                                              deep_link=deep_link,
+                                              topic_filters_path=(
+                                                  TOPIC_FILTERS_PATH),
+                                              browser_profile=browser_profile,
+                                              prefetch_pages=prefetch_pages,
+                                              streaming_excel=streaming_excel,
+                                              stop_event=stop_event,
+                                              user_agent=user_agent)
+    if profile:
+        with Profiler(profile, artifacts_dir):
+            news_bot.run(phrase, start_date, end_date, topic)
+    else:
+        news_bot.run(phrase, start_date, end_date, topic)
+    return excel_dir
+
+def save_output_work_item(work_items: WorkItems, variables: dict,
+                          artifacts_dir: str,
+                          excel_dir: Optional[str] = None,
+                          error: Optional[str] = None,
+                          input_work_item: Optional[WorkItem] = None
+                          ) -> None:
+    """
+    Creates the output work item of a query, with the variables of the 
+    query, its artifacts directory, its status ('done' or 'failed', 
+    with the error) and its Excel file.
+
+    Args:
+        work_items (WorkItems): The work items library.
+        variables (dict): The variables of the query.
+        artifacts_dir (str): The artifacts directory of the query.
+        excel_dir (Optional[str]): The Excel file of the query, if it 
+                                   succeeded.
+        error (Optional[str]): The error of the query, if it failed.
+        input_work_item (Optional[WorkItem]): The input work item of 
+                                              the query, if it is no 
+                                              longer the reserved one.
+
+    Returns:
+        None
+    """
+    output: dict = {**variables, 'artifacts_dir': artifacts_dir}
+    files: list[str] = []
+    if error is None:
+        output.update(status='done', excel_file=excel_dir)
+        files.append(excel_dir)
+    else:
+        output.update(status='failed', error=error)
+    if input_work_item is None:
+        work_items.create_output_work_item(variables=output, files=files,
+                                           save=True)
+        return
+    # create_output_work_item only creates the output work item of the
+    # reserved input work item, so it is created the same way under the
+    # input work item of the query
+    output_work_item: WorkItem = WorkItem(item_id=None,
+                                          parent_id=input_work_item.id,
+                                          adapter=work_items.adapter)
+    output_work_item.payload = output
+    for file in files:
+        output_work_item.add_file(file)
+    output_work_item.save()
+    work_items.outputs.append(output_work_item)
+
+def run_batch(work_items: WorkItems, processes: int) -> bool:
+    """
+    Runs the news bot for the query of every input work item, several 
+    queries at a time.
+
+    The queries of the input work items are read first, then each query 
+    is run in one of a pool of worker processes. Each process owns its 
+    own browser and runs one query at a time. Every query saves its 
+    artifacts to its own directory ('output/query_<number>') and gets an 
+    output work item under its own input work item, with its variables, 
+    its status ('done' or 'failed', with the error) and its Excel file.
+
+    Args:
+        work_items (WorkItems): The work items library.
+        processes (int): The number of worker processes.
+
+    Returns:
+        bool: True if every query succeeded, False otherwise.
+    """
+    # Each query keeps its input work item, which its output work item
+    # is created under
+    queries: list[tuple[WorkItem, dict]] = (
+        work_items.for_each_input_work_item(
+            lambda: (work_items.active_input,
+                     work_items.get_work_item_variables())))
+    logger.info('Running %d queries with %d processes...', len(queries),
+                processes)
+    is_successful: bool = True
+    # Browsers and their driver threads do not survive a fork
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=processes,
+                             mp_context=context) as executor:
+        futures: dict[Future, tuple[WorkItem, dict, str]] = {}
+        for query_number, (input_work_item, variables) in enumerate(
+                queries, start=1):
+            artifacts_dir: str = f'{ARTIFACTS_DIR}/query_{query_number}'
+            future: Future = executor.submit(run_query, variables,
+                                             artifacts_dir)
+            futures[future] = (input_work_item, variables, artifacts_dir)
+        for future in as_completed(futures):
+            input_work_item, variables, artifacts_dir = futures[future]
+            try:
+                excel_dir: str = future.result()
+            # The news bot exits when the website cannot be scraped
+            except (Exception, SystemExit) as e:
+                logger.error('Query %s failed: %r', artifacts_dir, e)
+                is_successful = False
+                save_output_work_item(work_items, variables, artifacts_dir,
+                                      error=repr(e),
+                                      input_work_item=input_work_item)
+            else:
+                save_output_work_item(work_items, variables, artifacts_dir,
+                                      excel_dir=excel_dir,
+                                      input_work_item=input_work_item)
+    logger.info('Finished running %d queries.', len(queries))
+    return is_successful
+
+def create_session_browser(backend: str, variables: dict):
+    """
+    Creates the browser shared by the queries of a session (the daemon 
+    or a session batch) with the browser options of a query: its lean 
+    profile (see create_browser_profile) and 'prefetch_pages', for the 
+    Selenium browser, or 'user_agent', for the HTTP browser.
+
+    Args:
+        backend (str): The scraping backend, either 'selenium' or 
+                       'http'.
+        variables (dict): The variables of the query.
+
+    Returns:
+        LATimesBrowser | LATimesHTTPBrowser: The browser, not yet 
+                                             opened.
+    """
+    if backend == 'http':
+        return LATimesHTTPBrowser(user_agent=variables.get(
+            'user_agent', LATimesHTTPBrowser.USER_AGENT))
+    return LATimesBrowser(create_browser_profile(variables),
+                          variables.get('prefetch_pages', False))
+
+def fits_session_browser(browser, variables: dict) -> bool:
+    """
+    Checks whether the browser of a session was created with the 
+    browser options of a query (see create_session_browser).
+
+    Args:
+        browser (LATimesBrowser | LATimesHTTPBrowser): The browser.
+        variables (dict): The variables of the query.
+
+    Returns:
+        bool: True if the query can run with the browser, False if the 
+              browser must be relaunched with the options of the query.
+    """
+    if isinstance(browser, LATimesHTTPBrowser):
+        return browser.user_agent == variables.get(
+            'user_agent', LATimesHTTPBrowser.USER_AGENT)
+    return (browser.profile == create_browser_profile(variables)
+            and browser.prefetch_pages == variables.get('prefetch_pages',
+                                                        False))
+
+def run_session(work_items: WorkItems, backend: str) -> bool:
+    """
+    Runs the news bot for the query of every input work item, one after 
+    another, in a single browser session.
+
+    The browser is launched and opens the homepage once, and every 
+    query reuses it: its results page is loaded directly from its 
+    deep link, so a query only costs the pages of its own results, and 
+    the topic filters read by one query are reused by the next ones. A 
+    browser that stops responding is relaunched before the next query, 
+    and so is a browser created with other browser options than the 
+    ones of the next query (see create_session_browser). 
+    Every query saves its artifacts to its own directory 
+    ('output/query_<number>') and gets its own output work item, as in 
+    run_batch.
+
+    Args:
+        work_items (WorkItems): The work items library.
+        backend (str): The scraping backend of the session. It replaces 
+                       the backend of the queries.
+
+    Returns:
+        bool: True if every query succeeded, False otherwise.
+    """
+    query_numbers: Iterator[int] = itertools.count(1)
+    browser = None
+
+    def run_input_work_item() -> bool:
+        nonlocal browser
+        variables: dict = work_items.get_work_item_variables()
+        artifacts_dir: str = f'{ARTIFACTS_DIR}/query_{next(query_numbers)}'
+        try:
+            if browser is not None and not browser.is_healthy():
+                logger.warning('Relaunching browser...')
+                browser.close_browser()
+                browser = None
+            elif (browser is not None
+                  and not fits_session_browser(browser, variables)):
+                logger.info('Relaunching browser with the options of query '
+                            '%s...', artifacts_dir)
+                browser.close_browser()
+                browser = None
+            if browser is None:
+                browser = create_session_browser(backend, variables)
+                browser.open_website()
+            excel_dir: str = run_query(variables, artifacts_dir, browser)
+        # The news bot exits when the website cannot be scraped
+        except (Exception, SystemExit) as e:
+            logger.error('Query %s failed: %r', artifacts_dir, e)
+            save_output_work_item(work_items, variables, artifacts_dir,
+                                  error=repr(e))
+            return False
+        save_output_work_item(work_items, variables, artifacts_dir,
+                              excel_dir=excel_dir)
+        return True
+
+    logger.info('Running queries in one browser session...')
+    try:
+        results: list[bool] = work_items.for_each_input_work_item(
+            run_input_work_item)
+    finally:
+        if browser is not None:
+            browser.close_browser()
+    logger.info('Finished running %d queries.', len(results))
+    return all(results)
+
+def serve(socket_path: str, backend: str) -> None:
+    """
+    Runs the news bot daemon, which keeps a warm browser of the given 
+    backend and runs the queries sent to its socket until it is shut 
+    down. The browser is launched with the default browser options and 
+    relaunched for a query that needs other ones (see 
+    create_session_browser).
+
+    Args:
+        socket_path (str): The path of the unix socket of the daemon.
+        backend (str): The scraping backend of the warm browser, either 
+                       'selenium' or 'http'. It replaces the backend of 
+                       the queries.
+
+    Returns:
+        None
+    """
+    NewsBotDaemon(socket_path, run_query,
+                  lambda query: create_session_browser(backend, query),
+                  fits_session_browser).serve_forever()
+
+def run_with_daemon(work_items: WorkItems, socket_path: str) -> bool:
+    """
+    Sends the query of every input work item to a running news bot 
+    daemon, one at a time, and creates an output work item for each of 
+    them. Each query saves its artifacts to its own directory 
+    ('output/query_<number>').
+
+    Args:
+        work_items (WorkItems): The work items library.
+        socket_path (str): The path of the unix socket of the daemon.
+
+    Returns:
+        bool: True if every query succeeded, False otherwise.
+    """
+    query_numbers: Iterator[int] = itertools.count(1)
+
+    def run_input_work_item() -> bool:
+        variables: dict = work_items.get_work_item_variables()
+        artifacts_dir: str = f'{ARTIFACTS_DIR}/query_{next(query_numbers)}'
+        # The daemon may run from another working directory
+        response: dict = NewsBotDaemon.send(
+            socket_path, {'command': 'run', 'query': variables,
+                          'artifacts_dir': os.path.abspath(artifacts_dir)})
+        if response['status'] != 'done':
+            logger.error('Query %s failed: %s', artifacts_dir,
+                         response['error'])
+            save_output_work_item(work_items, variables, artifacts_dir,
+                                  error=response['error'])
+            return False
+        logger.info('Query %s took %.1fs.', artifacts_dir,
+                    response['seconds'])
+        save_output_work_item(work_items, variables, artifacts_dir,
+                              excel_dir=response['excel_file'])
+        return True
+
+    return all(work_items.for_each_input_work_item(run_input_work_item))
+
+def enqueue_work_items(work_items: WorkItems, queue_path: str) -> None:
+    """
+    Adds the query of every input work item to the job queue.
+
+    Args:
+        work_items (WorkItems): The work items library.
+        queue_path (str): The path of the job queue.
+
+    Returns:
+        None
+    """
+    queue: SQLiteJobQueue = SQLiteJobQueue(queue_path)
+    try:
+        for variables in work_items.for_each_input_work_item(
+                work_items.get_work_item_variables):
+            job_id: int = queue.put(variables)
+            logger.info('Queued job %d.', job_id)
+    finally:
+        queue.close()
+
+def run_queue_worker(queue_path: str) -> int:
+    """
+    Processes the jobs of the job queue until it is drained.
+
+    The worker claims the oldest available job, runs its query while a 
+    LeaseKeeper renews the lease of the job, and acknowledges it (or 
+    reports the failed attempt, which is retried). If the lease is lost, 
+    the query is stopped and its result dropped, since another worker 
+    owns the job. When no job is 
+    available but other workers still hold some, it waits for them, 
+    since their jobs are retried if they fail or their lease expires. 
+    Each job saves its artifacts to 'output/job_<id>'.
+
+    Args:
+        queue_path (str): The path of the job queue.
+
+    Returns:
+        int: The number of job attempts made by the worker.
+    """
+    worker_id: str = f'{socket.gethostname()}:{os.getpid()}'
+    queue: SQLiteJobQueue = SQLiteJobQueue(queue_path)
+    jobs_count: int = 0
+    try:
+        while True:
+            job: Optional[dict] = queue.claim(worker_id)
+            if job is None:
+                if queue.is_drained():
+                    break
+                time.sleep(POLL_SECONDS)
+                continue
+            logger.info('Worker %s claimed job %d (attempt %d).', worker_id,
+                        job['id'], job['attempts'])
+            artifacts_dir: str = f"{ARTIFACTS_DIR}/job_{job['id']}"
+            error: Optional[str] = None
+            with LeaseKeeper(lambda: SQLiteJobQueue(queue_path), job['id'],
+                             worker_id, HEARTBEAT_SECONDS) as lease:
+                try:
+                    excel_dir: str = run_query(job['query'], artifacts_dir,
+                                               stop_event=lease.lost)
+                # The news bot exits when the website cannot be scraped
+                except (Exception, SystemExit) as e:
+                    logger.error('Job %d failed: %r', job['id'], e)
+                    error = repr(e)
+            jobs_count += 1
+            if lease.is_lost:
+                # Another worker owns the job now
+                continue
+            if error is None:
+                queue.complete(job['id'], worker_id,
+                               {'artifacts_dir': artifacts_dir,
+                                'excel_file': excel_dir})
+            else:
+                queue.fail(job['id'], worker_id, error)
+    finally:
+        queue.close()
+    return jobs_count
+
+def run_queue(queue_path: str, processes: int) -> None:
+    """
+    Runs several queue workers, each in its own process, until the job 
+    queue is drained.
+
+    Args:
+        queue_path (str): The path of the job queue.
+        processes (int): The number of worker processes.
+
+    Returns:
+        None
+    """
+    logger.info('Processing job queue %s with %d processes...', queue_path,
+                processes)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=processes,
+                             mp_context=context) as executor:
+        jobs_count: int = sum(executor.map(run_queue_worker,
+                                           [queue_path] * processes))
+    queue: SQLiteJobQueue = SQLiteJobQueue(queue_path)
+    logger.info('Made %d job attempts, job queue: %s.', jobs_count,
+                queue.counts())
+    queue.close()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scrape LA Times articles.')
+    parser.add_argument('--batch', action='store_true',
+                        help='run the query of every input work item')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help='number of queries run at the same time in '
+                             'batch and queue modes (default: number of '
+                             'CPUs)')
+    parser.add_argument('--session', action='store_true',
+                        help='with --batch, run the queries one after '
+                             'another in one browser session')
+    parser.add_argument('--serve', metavar='PATH',
+                        help='run the news bot daemon, which keeps a warm '
+                             'browser, on the unix socket at PATH')
+    parser.add_argument('--backend', choices=LATimesNewsBot.BACKENDS,
+                        default='selenium',
+                        help='scraping backend of the daemon and of the '
+                             'session (default: selenium)')
+    parser.add_argument('--connect', metavar='PATH',
+                        help='run the query of every input work item with '
+                             'the news bot daemon on the unix socket at '
+                             'PATH')
+    parser.add_argument('--queue', metavar='PATH',
+                        help='process the jobs of the job queue at PATH '
+                             '(e.g. on a shared file system)')
+    parser.add_argument('--enqueue', action='store_true',
+                        help='with --queue, add the query of every input '
+                             'work item to the job queue')
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve, args.backend)
+        sys.exit(0)
+    work_items: WorkItems = WorkItems()
+    if args.connect:
+        if not run_with_daemon(work_items, args.connect):
+            sys.exit(1)
+    elif args.queue and args.enqueue:
+        enqueue_work_items(work_items, args.queue)
+    elif args.queue:
+        run_queue(args.queue, max(1, args.processes))
+    elif args.batch and args.session:
+        if not run_session(work_items, args.backend):
+            sys.exit(1)
+    elif args.batch:
+        if not run_batch(work_items, max(1, args.processes)):
+            sys.exit(1)
+    else:
+        # Get input work item variables
+        work_items.get_input_work_item()
+        run_query(work_items.get_work_item_variables(), ARTIFACTS_DIR)
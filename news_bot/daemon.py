@@ -0,0 +1,364 @@
+"""
+This module provides a long-running news bot service that keeps a warm
+browser between queries.
+
+Classes:
+    NewsBotDaemon: Runs the queries it receives on a local (unix)
+                   socket with a browser that is launched once, reset
+                   between queries and relaunched only when it fails a
+                   health check or a query needs other browser
+                   options.
+
+Dependencies:
+    - json
+    - logging
+    - os
+    - socket
+    - socketserver
+    - threading
+    - time
+    - typing
+
+Usage:
+    daemon = NewsBotDaemon('state/news_bot.sock', run_query,
+                           lambda query: LATimesBrowser())
+    daemon.serve_forever()
+
+    # From another process
+    NewsBotDaemon.send('state/news_bot.sock',
+                       {'command': 'run', 'query': {...},
+                        'artifacts_dir': '/path/to/output'})
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class NewsBotDaemon:
+    """
+    Service that runs news bot queries with a warm browser.
+
+    A cold run pays for the interpreter and library imports, the
+    browser launch and the first load of the LA Times homepage before
+    it scrapes its first article. The daemon pays for them once: it
+    launches the browser when it starts and, between queries, only
+    navigates it back to the homepage. The browser is closed when the
+    daemon shuts down, or relaunched when it fails a health check,
+    which runs before and after every query and periodically while the
+    daemon is idle (so an expired session is noticed before the next
+    query arrives). After a failed query, the browser is reset, or
+    relaunched if it cannot be reset. The browser is created with the
+    browser options of a query: the daemon starts it with the default
+    ones (those of an empty query) and relaunches it for a query that
+    needs other ones.
+
+    Requests are JSON objects, one per line, on a unix socket, and get
+    a JSON object in response:
+      - {"command": "run", "query": {...}, "artifacts_dir": "..."}
+        runs the query (the variables of an input work item) and saves
+        its artifacts to the given directory. The response has the
+        'status' ('done' or 'failed'), the 'excel_file' or the 'error',
+        and the 'seconds' the query took.
+      - {"command": "ping"} responds {"status": "ok"}.
+      - {"command": "shutdown"} stops the daemon.
+
+    The browser runs one query at a time (LATimesBrowser is one per
+    process), so queries received at the same time wait for each other.
+    For several warm browsers, run several daemons.
+
+    Attributes:
+        __socket_path (str): The path of the unix socket.
+        __run_query (Callable[[dict, str, object], str]): Runs a query
+            with the browser and saves its artifacts to the given
+            directory, returning the path of the Excel file.
+        __create_browser (Callable[[dict], object]): Creates the
+            browser for a query.
+        __fits_browser (Callable[[object, dict], bool]): Checks whether
+            a query can run with the browser.
+        __browser_query (dict): The query the browser was created
+                                for.
+        __health_check_interval (float): How often the browser is
+                                         checked while the daemon is
+                                         idle, in seconds.
+        __browser: The warm browser, or None before it is launched.
+        __lock (threading.Lock): Serializes the use of the browser.
+        __stop (threading.Event): Stops the idle health checks.
+        __server (Optional[socketserver.ThreadingUnixStreamServer]):
+            The server of the socket.
+    """
+
+    def __init__(self, socket_path: str,
+                 run_query: Callable[[dict, str, object], str],
+                 create_browser: Callable[[dict], object],
+                 fits_browser: Callable[[object, dict], bool] = (
+                     lambda browser, query: True),
+                 health_check_interval: float = 60) -> None:
+        self.__socket_path = socket_path
+        self.__run_query = run_query
+        self.__create_browser = create_browser
+        self.__fits_browser = fits_browser
+        self.__browser_query: dict = {}
+        self.__health_check_interval = health_check_interval
+        self.__browser = None
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__server: Optional[socketserver.ThreadingUnixStreamServer] = (
+            None)
+
+    def serve_forever(self) -> None:
+        """
+        Launches the browser and serves requests until the daemon is
+        shut down (by a 'shutdown' request or an interrupt), then
+        closes the browser.
+
+        Returns:
+            None
+        """
+        logger.info('Starting news bot daemon on %s...', self.__socket_path)
+        with self.__lock:
+            self.__launch_browser()
+        directory: str = os.path.dirname(self.__socket_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.__socket_path):
+            # Left by a daemon that did not shut down cleanly
+            os.remove(self.__socket_path)
+        daemon: NewsBotDaemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    try:
+                        request: dict = json.loads(line)
+                    except ValueError:
+                        response: dict = {'status': 'failed',
+                                          'error': 'Invalid request'}
+                    else:
+                        response = daemon.handle_request(request)
+                    self.wfile.write(json.dumps(response).encode('utf-8')
+                                     + b'\n')
+                    self.wfile.flush()
+
+        self.__server = socketserver.ThreadingUnixStreamServer(
+            self.__socket_path, Handler)
+        self.__server.daemon_threads = True
+        health_checker = threading.Thread(target=self.__check_health_when_idle,
+                                          name='health-checker', daemon=True)
+        health_checker.start()
+        logger.info('News bot daemon ready.')
+        try:
+            self.__server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info('News bot daemon interrupted.')
+        finally:
+            self.__stop.set()
+            health_checker.join()
+            self.__server.server_close()
+            os.remove(self.__socket_path)
+            with self.__lock:
+                self.__close_browser()
+        logger.info('Stopped news bot daemon.')
+
+    def handle_request(self, request: dict) -> dict:
+        """
+        Handles a request received by the daemon. A request that is not
+        a JSON object, or a 'run' request without a query object and an
+        artifacts directory, gets a failed response.
+
+        Args:
+            request (dict): The request (see the class description).
+
+        Returns:
+            dict: The response.
+        """
+        if not isinstance(request, dict):
+            return {'status': 'failed', 'error': 'Invalid request'}
+        command: Optional[str] = request.get('command')
+        if command == 'ping':
+            return {'status': 'ok'}
+        if command == 'shutdown':
+            # The server waits for its requests, so it must be shut
+            # down from another thread
+            threading.Thread(target=self.__server.shutdown).start()
+            return {'status': 'ok'}
+        if command == 'run':
+            query = request.get('query')
+            artifacts_dir = request.get('artifacts_dir')
+            if not isinstance(query, dict):
+                return {'status': 'failed',
+                        'error': 'Invalid request: the query must be an '
+                                 'object'}
+            if not isinstance(artifacts_dir, str) or not artifacts_dir:
+                return {'status': 'failed',
+                        'error': 'Invalid request: the artifacts directory '
+                                 'must be a path'}
+            return self.__run(query, artifacts_dir)
+        return {'status': 'failed', 'error': f'Unknown command: {command}'}
+
+    @staticmethod
+    def send(socket_path: str, request: dict,
+             timeout: Optional[float] = None) -> dict:
+        """
+        Sends a request to a running daemon and waits for its response.
+
+        Args:
+            socket_path (str): The path of the unix socket of the
+                               daemon.
+            request (dict): The request.
+            timeout (Optional[float]): How long to wait for the
+                                       response, in seconds. Defaults to
+                                       None (no limit).
+
+        Returns:
+            dict: The response.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(socket_path)
+            with client.makefile('rwb') as stream:
+                stream.write(json.dumps(request).encode('utf-8') + b'\n')
+                stream.flush()
+                return json.loads(stream.readline())
+
+    def __run(self, query: dict, artifacts_dir: str) -> dict:
+        """
+        Runs a query with the warm browser.
+
+        Args:
+            query (dict): The query.
+            artifacts_dir (str): The directory where the artifacts of
+                                 the query are saved.
+
+        Returns:
+            dict: The status of the query, its Excel file or error, and
+                  how long it took.
+        """
+        with self.__lock:
+            if not self.__is_browser_healthy():
+                self.__relaunch_browser()
+            elif not self.__fits_browser(self.__browser, query):
+                self.__relaunch_browser(query)
+            if self.__browser is None:
+                return {'status': 'failed',
+                        'error': 'The browser could not be launched'}
+            started_at: float = time.perf_counter()
+            try:
+                excel_dir: str = self.__run_query(query, artifacts_dir,
+                                                  self.__browser)
+            # The news bot exits when the website cannot be scraped
+            except (Exception, SystemExit) as e:
+                logger.error('Query failed: %r', e)
+                response: dict = {'status': 'failed', 'error': repr(e)}
+            else:
+                response = {'status': 'done', 'excel_file': excel_dir}
+            response['seconds'] = time.perf_counter() - started_at
+            if not self.__is_browser_healthy():
+                self.__relaunch_browser()
+            elif response['status'] == 'failed':
+                self.__reset_browser()
+        return response
+
+    def __check_health_when_idle(self) -> None:
+        """
+        Checks the browser at a fixed interval, relaunching it if it
+        fails, until the daemon stops. Checks are skipped while a query
+        runs.
+
+        Returns:
+            None
+        """
+        while not self.__stop.wait(self.__health_check_interval):
+            if not self.__lock.acquire(blocking=False):
+                continue
+            try:
+                if not self.__is_browser_healthy():
+                    self.__relaunch_browser()
+            finally:
+                self.__lock.release()
+
+    def __is_browser_healthy(self) -> bool:
+        """
+        Checks whether the browser is launched and still responds.
+
+        Returns:
+            bool: True if the browser is healthy, False otherwise.
+        """
+        return self.__browser is not None and self.__browser.is_healthy()
+
+    def __launch_browser(self, query: Optional[dict] = None) -> None:
+        """
+        Launches the browser for a query and opens the LA Times
+        homepage.
+
+        Args:
+            query (Optional[dict]): The query. Defaults to None (the
+                                    query of the previous browser).
+
+        Returns:
+            None
+        """
+        if query is not None:
+            self.__browser_query = query
+        self.__browser = self.__create_browser(self.__browser_query)
+        self.__browser.open_website()
+
+    def __relaunch_browser(self, query: Optional[dict] = None) -> None:
+        """
+        Replaces a browser that failed a health check, or that does not
+        fit a query. If the new browser cannot be launched, the daemon
+        is left without one until the next attempt.
+
+        Args:
+            query (Optional[dict]): The query. Defaults to None (the
+                                    query of the previous browser).
+
+        Returns:
+            None
+        """
+        logger.warning('Relaunching browser...')
+        self.__close_browser()
+        try:
+            self.__launch_browser(query)
+        except Exception as e:
+            # Tried again by the next health check or query
+            logger.error('Could not relaunch browser: %s', e)
+            self.__browser = None
+
+    def __reset_browser(self) -> None:
+        """
+        Resets the browser after a failed query, which can leave it on
+        any page, with a half-done search or with dialogs open. If the
+        reset fails, the browser is relaunched.
+
+        Returns:
+            None
+        """
+        try:
+            self.__browser.reset()
+        except Exception as e:
+            logger.error('Could not reset browser: %s', e)
+            self.__relaunch_browser()
+
+    def __close_browser(self) -> None:
+        """
+        Closes the browser, ignoring the errors of a browser that
+        already crashed.
+
+        Returns:
+            None
+        """
+        if self.__browser is None:
+            return
+        try:
+            self.__browser.close_browser()
+        except Exception as e:
+            logger.warning('Could not close browser: %s', e)
+        self.__browser = None
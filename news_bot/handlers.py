@@ -5,32 +5,48 @@ file.
 
 Classes:
     Excel: Handles creation and manipulation of Excel files.
+    StreamingExcel: Writes Excel files row by row, in constant memory.
+    BrowserProfile: The lean profile of the scraping browser.
     LATimesBrowser: Interacts with the LA Times website, searches for 
                     articles, and extracts article details.
     Scraper: Scrapes articles based on a given date range and search phrase.
 
 Dependencies:
     - RPA.Excel.Files
+    - openpyxl
     - RPA.Browser.Selenium
     - SeleniumLibrary.errors
+    - selenium.common.exceptions
+    - json
     - logging
     - sys
+    - threading
+    - time
+    - concurrent.futures
     - datetime
     - typing
-    - re
 """
 
-import re
+import json
 import logging
 import sys
+import threading
+import time
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 from RPA.Excel.Files import Files
+from openpyxl import Workbook
 from RPA.Browser.Selenium import Selenium
 from SeleniumLibrary.errors import ElementNotFound
+from selenium.common.exceptions import StaleElementReferenceException
 
-from news_bot.utils import DateUtil, ImageUtil
+from news_bot.metrics import Metrics
+from news_bot.models import Article
+from news_bot.storage import ArticleStore, ScrapeJournal, TopicFilterCache
+from news_bot.utils import ArticleUtil, SearchUtil
 
 logger = logging.getLogger(__name__)
 
@@ -46,21 +62,22 @@ class Excel:
     def __init__(self) -> None:
         self.excel: Files = Files()
 
-    def save_articles_excel(self, articles: list[dict],
+    def save_articles_excel(self, articles: Iterable[Article],
                          excel_dir: str) -> None:
         """
-        Saves a list of articles to an Excel file.
+        Saves articles to an Excel file.
 
-        This method takes a list of articles, each represented as a 
-        dictionary, and saves them into an Excel file. It creates a 
-        workbook, adds the articles to the specified worksheet, and then
-        saves and closes the workbook. If the list of articles is empty,
-        a warning is logged and no Excel file is created.
+        This method takes the articles and saves them into an Excel 
+        file, one row (see Article.to_row) per article. The articles can 
+        be any iterable (e.g. a list, or a generator fed while the 
+        articles are still being scraped): the workbook is created when 
+        the first article arrives, with a header made of the columns of 
+        the rows, and every article is appended as it arrives. The 
+        workbook is then saved and closed. If there are no articles, a 
+        warning is logged and no Excel file is created.
 
         Args:
-            articles (list[dict]): A list of articles to be saved, where
-                                   each article is represented as a 
-                                   dictionary.
+            articles (Iterable[Article]): The articles to be saved.
             excel_dir (str): The directory where the Excel file will be 
                              saved.
 
@@ -68,22 +85,190 @@ class Excel:
             None
         """
         logger.info('Saving articles to Excel...')
+        metrics: Metrics = Metrics()
+        started_at: float = time.perf_counter()
         worksheet_name: str = 'search_results'
-        if len(articles) == 0:
+        is_workbook_created: bool = False
+        for article in articles:
+            if not is_workbook_created:
+                self.excel.create_workbook(excel_dir,
+                                           sheet_name=worksheet_name)
+                header: list[str] = list(Article.COLUMNS)
+                self.excel.append_rows_to_worksheet([header], worksheet_name)
+                is_workbook_created = True
+            with metrics.span('excel_row'):
+                self.excel.append_rows_to_worksheet(
+                    [article.to_row()], worksheet_name)
+        if not is_workbook_created:
             warning_message: str = (
                 'No articles were found. Excel file will not be created.'
                 )
             logger.warning(warning_message)
             return
-        self.excel.create_workbook(excel_dir, sheet_name=worksheet_name)
-        header: list[str] = list(articles[0].keys())
-        self.excel.append_rows_to_worksheet([header], worksheet_name)
-        self.excel.append_rows_to_worksheet(articles, worksheet_name)
-        self.excel.save_workbook()
-        self.excel.close_workbook()
+        with metrics.span('excel_save'):
+            self.excel.save_workbook()
+            self.excel.close_workbook()
+        metrics.record('excel_write', time.perf_counter() - started_at)
         logger.info('Finished saving articles to Excel.')
 
 
+class StreamingExcel:
+    """
+    A class to write Excel files row by row, in constant memory.
+
+    Excel keeps every row of the workbook in memory until it is saved, 
+    so its memory and save time grow with the number of articles. This 
+    class writes the same file (the same worksheet, header and rows) 
+    through a write-only openpyxl workbook instead: each row is 
+    serialized to a temporary file on disk as soon as its article 
+    arrives, and the workbook is only assembled from it when it is 
+    saved.
+    """
+
+    def save_articles_excel(self, articles: Iterable[Article],
+                            excel_dir: str) -> None:
+        """
+        Saves articles to an Excel file, writing each article as it 
+        arrives.
+
+        The workbook is created when the first article arrives, with a 
+        header made of the columns of the rows (see Article.to_row), and 
+        saved once the articles run out. If there are no articles, a 
+        warning is logged and no Excel file is created.
+
+        Args:
+            articles (Iterable[Article]): The articles to be saved.
+            excel_dir (str): The directory where the Excel file will be 
+                             saved.
+
+        Returns:
+            None
+        """
+        logger.info('Saving articles to Excel...')
+        metrics: Metrics = Metrics()
+        started_at: float = time.perf_counter()
+        worksheet_name: str = 'search_results'
+        workbook: Optional[Workbook] = None
+        for article in articles:
+            if workbook is None:
+                workbook = Workbook(write_only=True)
+                worksheet = workbook.create_sheet(worksheet_name)
+                worksheet.append(list(Article.COLUMNS))
+            with metrics.span('excel_row'):
+                row: dict = article.to_row()
+                worksheet.append([row[column] for column in Article.COLUMNS])
+        if workbook is None:
+            warning_message: str = (
+                'No articles were found. Excel file will not be created.'
+                )
+            logger.warning(warning_message)
+            return
+        with metrics.span('excel_save'):
+            workbook.save(excel_dir)
+        metrics.record('excel_write', time.perf_counter() - started_at)
+        logger.info('Finished saving articles to Excel.')
+
+
+class BrowserProfile:
+    """
+    Lean profile of the browser used to scrape the LA Times website.
+
+    The scraper only reads the text of the results and the source of 
+    their images, so the profile keeps the browser from loading what it 
+    does not need: it runs headless, with image loading turned off, and 
+    blocks the requests to the given third-party domains (ads, trackers 
+    and analytics by default) and to the given URL patterns (fonts and 
+    media by default). A domain of the allow list is never blocked, 
+    even if it is in the deny list.
+
+    Attributes:
+        headless (bool): Whether the browser runs headless.
+        load_images (bool): Whether the browser loads images.
+        blocked_domains (tuple[str, ...]): The deny list of domains, 
+                                           whose subdomains are blocked 
+                                           too.
+        allowed_domains (tuple[str, ...]): The allow list of domains.
+        blocked_patterns (tuple[str, ...]): The URL patterns to block, 
+                                            where '*' matches any text.
+    """
+
+    DEFAULT_BLOCKED_DOMAINS: tuple[str, ...] = (
+        'doubleclick.net', 'googlesyndication.com', 'googleadservices.com',
+        'google-analytics.com', 'googletagmanager.com',
+        'googletagservices.com', 'amazon-adsystem.com', 'adnxs.com',
+        'adsafeprotected.com', 'moatads.com', 'scorecardresearch.com',
+        'chartbeat.com', 'chartbeat.net', 'facebook.net', 'facebook.com',
+        'twitter.com', 'taboola.com', 'outbrain.com', 'krxd.net',
+        'permutive.com', 'permutive.app', 'rubiconproject.com',
+        'pubmatic.com', 'criteo.com', 'criteo.net', 'casalemedia.com',
+        'openx.net', 'quantserve.com', 'newrelic.com', 'nr-data.net',
+        'hotjar.com', 'brightcove.net', 'jwplayer.com',
+    )
+    # Patterns match the whole URL, so they end with '*' to match the
+    # URLs with a query string too
+    DEFAULT_BLOCKED_PATTERNS: tuple[str, ...] = (
+        '*.woff*', '*.ttf*', '*.otf*', '*.eot*', '*.mp4*', '*.webm*',
+        '*.m3u8*', '*.mp3*',
+    )
+
+    def __init__(self, headless: bool = True, load_images: bool = False,
+                 blocked_domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+                 allowed_domains: Iterable[str] = (),
+                 blocked_patterns: Iterable[str] = DEFAULT_BLOCKED_PATTERNS
+                 ) -> None:
+        self.headless = headless
+        self.load_images = load_images
+        self.blocked_domains = tuple(blocked_domains)
+        self.allowed_domains = tuple(allowed_domains)
+        self.blocked_patterns = tuple(blocked_patterns)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares the profile with another one, e.g. to tell whether a 
+        running browser was opened with the profile a query needs.
+
+        Args:
+            other (object): The other profile.
+
+        Returns:
+            bool: True if both profiles have the same settings, False 
+                  otherwise.
+        """
+        if not isinstance(other, BrowserProfile):
+            return NotImplemented
+        return vars(self) == vars(other)
+
+    def get_blocked_urls(self) -> list[str]:
+        """
+        Builds the URL patterns of the requests to block.
+
+        Returns:
+            list[str]: The patterns of the blocked domains (except the 
+                       allowed ones) and the blocked URL patterns.
+        """
+        allowed_domains: set[str] = {domain.lower()
+                                     for domain in self.allowed_domains}
+        blocked_urls: list[str] = []
+        for domain in self.blocked_domains:
+            if domain.lower() in allowed_domains:
+                continue
+            blocked_urls.extend((f'*://{domain}/*', f'*://*.{domain}/*'))
+        blocked_urls.extend(self.blocked_patterns)
+        return blocked_urls
+
+    def get_preferences(self) -> dict:
+        """
+        Builds the preferences of the browser.
+
+        Returns:
+            dict: The preferences (image loading turned off, unless 
+                  images are loaded).
+        """
+        if self.load_images:
+            return {}
+        return {'profile.managed_default_content_settings.images': 2}
+
+
 class LATimesBrowser:
     """
     Singleton class for interacting with the LA Times website using 
@@ -93,8 +278,128 @@ class LATimesBrowser:
     articles, selecting topics, navigating pages, and extracting 
     article details. It ensures only one instance of the browser is 
     created and maintained throughout the usage of the class.
+
+    With a BrowserProfile, the browser is opened with the lean profile 
+    (Chrome only) and the requests it makes, the bytes it receives and 
+    the requests it blocks are counted in the metrics 
+    ('browser_requests', 'browser_bytes' and 'browser_blocked_requests').
     """
     _instance = None
+    # Reads every article of the results page in one round trip. Returns
+    # null when the article section is not on the page.
+    __ARTICLES_SCRIPT: str = """
+        const section = document.querySelector(
+            '.search-results-module-results-menu');
+        if (section === null) {
+            return null;
+        }
+        const text = (item, className) => {
+            const element = item.querySelector('.' + className);
+            return element === null ? null : element.innerText;
+        };
+        return Array.from(section.querySelectorAll('li'), (item) => {
+            const image = item.querySelector('.image');
+            return {
+                title: text(item, 'promo-title'),
+                description: text(item, 'promo-description'),
+                timestamp: text(item, 'promo-timestamp'),
+                image_src: image === null ? null : image.src
+            };
+        });
+    """
+
+    # Reads the title and the filter parameter (name and value of the
+    # checkbox) of every topic of the results page, including the ones
+    # hidden behind the see all button. Returns null when the topic
+    # section is not on the page.
+    __TOPIC_FILTERS_SCRIPT: str = """
+        const section = document.querySelector("[data-name='Topics']");
+        if (section === null) {
+            return null;
+        }
+        const filters = [];
+        for (const item of section.querySelectorAll('li')) {
+            const title = item.querySelector('span');
+            const checkbox = item.querySelector('input');
+            if (title !== null && checkbox !== null) {
+                filters.push(
+                    [title.textContent.trim(), checkbox.name, checkbox.value]);
+            }
+        }
+        return filters;
+    """
+    # Marks the first article of the current results, so they can be
+    # told from the reloaded ones (which are new elements, in the same
+    # section or in a new document)
+    __MARK_STALE_SCRIPT: str = """
+        const article = document.querySelector(
+            '.search-results-module-results-menu li');
+        if (article !== null) {
+            article.dataset.newsBotStale = 'true';
+        }
+    """
+    # Resolves with true as soon as results that are not marked stale
+    # are rendered, or with false after the given number of milliseconds
+    __RESULTS_READY_SCRIPT: str = """
+        const timeout = arguments[0];
+        const done = arguments[arguments.length - 1];
+        const isReady = () => {
+            if (document.readyState === 'loading') {
+                return false;
+            }
+            const article = document.querySelector(
+                '.search-results-module-results-menu li');
+            return article !== null && !article.dataset.newsBotStale;
+        };
+        if (isReady()) {
+            done(true);
+            return;
+        }
+        let isDone = false;
+        const finish = (result) => {
+            if (!isDone) {
+                isDone = true;
+                observer.disconnect();
+                clearTimeout(timer);
+                done(result);
+            }
+        };
+        const observer = new MutationObserver(() => {
+            if (isReady()) {
+                finish(true);
+            }
+        });
+        observer.observe(document, {childList: true, subtree: true});
+        document.addEventListener('readystatechange', () => {
+            if (isReady()) {
+                finish(true);
+            }
+        });
+        const timer = setTimeout(() => finish(false), timeout);
+    """
+    # Returns the URL of the next results page, or null when the page
+    # has no next page link
+    __NEXT_PAGE_URL_SCRIPT: str = """
+        const link = document.querySelector(
+            '.search-results-module-next-page a');
+        return link === null ? null : link.href;
+    """
+    # Marks the results of the tab as stale and starts loading the given
+    # URL, without waiting for it
+    __PREFETCH_SCRIPT: str = """
+        const article = document.querySelector(
+            '.search-results-module-results-menu li');
+        if (article !== null) {
+            article.dataset.newsBotStale = 'true';
+        }
+        window.setTimeout(() => window.location.assign(arguments[0]), 0);
+    """
+    # Checks whether the checkbox of a topic filter is ticked
+    __IS_FILTERED_SCRIPT: str = """
+        const checkbox = document.querySelector(
+            'input[name="' + arguments[0] + '"][value="' + arguments[1] + '"]');
+        return checkbox !== null && checkbox.checked;
+    """
 
     def __new__(cls, *args, **kwargs):
         """
@@ -114,10 +419,12 @@ class LATimesBrowser:
         """
         if cls._instance is None:
             super_class = super(LATimesBrowser, cls)
-            cls._instance = super_class.__new__(cls, *args, **kwargs)
+            # The arguments are for __init__, object does not take them
+            cls._instance = super_class.__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
+    def __init__(self, profile: Optional[BrowserProfile] = None,
+                 prefetch_pages: bool = False) -> None:
         """
         Initializes the LATimesBrowser instance.
 
@@ -125,11 +432,24 @@ class LATimesBrowser:
         URL for the LA Times website. It ensures that the 
         initialization is performed only once, even if the constructor 
         is called multiple times.
+
+        Args:
+            profile (Optional[BrowserProfile]): The lean profile of the 
+                                                browser, or None to 
+                                                open the browser with 
+                                                the defaults.
+            prefetch_pages (bool): Whether to load the next results 
+                                   page in a second tab while the 
+                                   current one is read (see 
+                                   next_page). Defaults to False.
         """
         if not hasattr(self, 'initialized'):
             self.browser: Selenium = Selenium()
             self.initialized = True
             self.url = 'https://www.latimes.com/'
+            self.profile = profile
+            self.prefetch_pages = prefetch_pages
+            self.__clear_prefetch()
 
     def open_website(self) -> None:
         """
@@ -143,9 +463,77 @@ class LATimesBrowser:
             None
         """
         logger.info('Opening website...')
-        self.browser.open_available_browser(self.url)
+        # The tabs of a previous browser are gone
+        self.__clear_prefetch()
+        if self.profile is None:
+            self.browser.open_available_browser(self.url)
+        else:
+            # Chrome only keeps the network events of the performance log
+            # if asked to
+            self.browser.open_available_browser(
+                headless=self.profile.headless,
+                browser_selection='Chrome',
+                preferences=self.profile.get_preferences(),
+                options={'capabilities': {
+                    'goog:loggingPrefs': {'performance': 'ALL'}
+                    }})
+            self.__block_urls(self.profile.get_blocked_urls())
+            self.browser.go_to(self.url)
         logger.info('Finished opening website.')
 
+    def __block_urls(self, blocked_urls: list[str]) -> None:
+        """
+        Blocks the requests of the browser to the given URL patterns 
+        with the Chrome DevTools protocol.
+
+        Args:
+            blocked_urls (list[str]): The URL patterns to block.
+
+        Returns:
+            None
+        """
+        try:
+            self.browser.driver.execute_cdp_cmd('Network.enable', {})
+            self.browser.driver.execute_cdp_cmd('Network.setBlockedURLs',
+                                                {'urls': blocked_urls})
+        except Exception as e:
+            logger.warning('Could not block browser requests: %s', e)
+
+    def __record_network(self) -> None:
+        """
+        Counts the requests made, the bytes received and the requests 
+        blocked by the browser since the last call, from the network 
+        events of its performance log.
+
+        Returns:
+            None
+        """
+        if self.profile is None:
+            return
+        try:
+            entries: list[dict] = self.browser.driver.get_log('performance')
+        except Exception as e:
+            logger.debug('Could not read the performance log: %s', e)
+            return
+        requests_count: int = 0
+        bytes_count: float = 0
+        blocked_count: int = 0
+        for entry in entries:
+            message: dict = json.loads(entry['message'])['message']
+            method: str = message.get('method', '')
+            params: dict = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                requests_count += 1
+            elif method == 'Network.loadingFinished':
+                bytes_count += params.get('encodedDataLength', 0)
+            elif method == 'Network.loadingFailed' and (
+                    params.get('blockedReason')):
+                blocked_count += 1
+        metrics: Metrics = Metrics()
+        metrics.increment('browser_requests', requests_count)
+        metrics.increment('browser_bytes', bytes_count)
+        metrics.increment('browser_blocked_requests', blocked_count)
+
     def search(self, phrase: str) -> None:
         """
         Searches for articles using the given search phrase on the LA 
@@ -166,6 +554,7 @@ class LATimesBrowser:
             None
         """
         logger.info('Searching for articles...')
+        self.__clear_prefetch(keep_tab=True)
         search_button: str = "//*[@data-element='search-button']"
         self.browser.click_element_when_clickable(search_button, timeout=30)
         try:
@@ -190,6 +579,64 @@ class LATimesBrowser:
         self.browser.click_element_when_clickable(submit_button, timeout=30)
         logger.info('Finished searching for articles.')
 
+    def open_search_results(self, phrase: str, topic: str,
+                            topic_filters: TopicFilterCache) -> bool:
+        """
+        Loads the results page of a search sorted by newest first and 
+        filtered by topic directly from its URL, instead of going 
+        through the search form, the sort dropdown and the topic list.
+
+        The filter of the topic is taken from the cache. If it is not 
+        cached, the unfiltered results page is loaded first and the 
+        filters of all its topics are cached. If the filtered page does 
+        not show the topic as selected (e.g. the id of the topic 
+        changed), the filter is removed from the cache.
+
+        Args:
+            phrase (str): The search phrase.
+            topic (str): The topic to filter the results by.
+            topic_filters (TopicFilterCache): The cache of the topic 
+                                              filters.
+
+        Returns:
+            bool: True if the filtered results page was loaded, False if 
+                  the search must go through the search form instead.
+        """
+        logger.info('Opening search results...')
+        self.__clear_prefetch(keep_tab=True)
+        articles_section: str = 'class:search-results-module-results-menu'
+        topic_filter: Optional[Tuple[str, str]] = topic_filters.get(topic)
+        try:
+            if topic_filter is None:
+                self.browser.go_to(SearchUtil.build_search_url(self.url,
+                                                               phrase))
+                self.browser.wait_until_element_is_visible(articles_section,
+                                                           timeout=30)
+                filters: Optional[list] = self.browser.execute_javascript(
+                    self.__TOPIC_FILTERS_SCRIPT)
+                if filters:
+                    topic_filters.update({title: (name, value)
+                                          for title, name, value in filters})
+                topic_filter = topic_filters.get(topic)
+                if topic_filter is None:
+                    logger.warning('Topic filter not found: %s', topic)
+                    return False
+            self.browser.go_to(SearchUtil.build_search_url(
+                self.url, phrase, topic_filter=topic_filter))
+            self.browser.wait_until_element_is_visible(articles_section,
+                                                       timeout=30)
+            is_filtered: bool = self.browser.execute_javascript(
+                self.__IS_FILTERED_SCRIPT, 'ARGUMENTS', *topic_filter)
+        except Exception as e:
+            logger.warning('Could not open search results: %s', e)
+            return False
+        if not is_filtered:
+            logger.warning('Cached topic filter no longer applies: %s', topic)
+            topic_filters.remove(topic)
+            return False
+        logger.info('Finished opening search results.')
+        return True
+
     def select_newest_articles(self) -> None:
         """
         Selects the newest articles on the LA Times website.
@@ -208,55 +655,136 @@ class LATimesBrowser:
         sort_by_dropdown: str = "//select[@name='s']"
         self.browser.wait_until_element_is_visible(sort_by_dropdown,
                                                    timeout=30)
+        self.__mark_articles_stale()
         self.browser.select_from_list_by_label(sort_by_dropdown, 'Newest')
-        self.__wait_for_articles_to_load()
+        self.__wait_for_articles_to_load('sort')
         logger.info('Finished selecting newest articles.')
 
-    def __wait_for_articles_to_load(self):
+    def __mark_articles_stale(self) -> None:
         """
-        Waits for the articles section to start and finish loading on 
-        the LA Times website.
+        Marks the first article of the results as stale before an 
+        action that reloads the results (sorting, filtering 
+        or moving to the next page), so the wait that follows the 
+        action can tell the reloaded results from the current ones.
 
-        This method first waits for the articles section to become not 
-        visible, indicating that loading has started. If an exception 
-        occurs during this wait, it checks if the exception is because 
-        the articles were already visible, in which case it does 
-        nothing and proceeds. If any other exception occurs, it logs a 
-        critical error and exits the program. After ensuring that 
-        loading has started, it waits for the articles section to 
-        become visible again, indicating that loading has finished.
+        Returns:
+            None
+        """
+        self.browser.execute_javascript(self.__MARK_STALE_SCRIPT)
+
+    def __clear_prefetch(self, keep_tab: bool = False) -> None:
+        """
+        Forgets the page being prefetched, e.g. when a new search starts 
+        from the first results page.
+
+        Args:
+            keep_tab (bool): Whether to keep the prefetch tab, which can 
+                             be reused by the next prefetch. Defaults to 
+                             False (e.g. when the browser is reopened 
+                             and its tabs are gone).
+
+        Returns:
+            None
+        """
+        self.__page_number: int = 1
+        self.__prefetched_page: Optional[int] = None
+        if not keep_tab:
+            self.__prefetch_tab: Optional[str] = None
+
+    def __prefetch_next_page(self) -> None:
+        """
+        Starts loading the next results page in the prefetch tab, 
+        without waiting for it, and switches back to the current tab.
+
+        The results still on the prefetch tab (two pages back) are 
+        marked stale first, so the wait for the prefetched page cannot 
+        mistake them for it. Nothing is prefetched past the 10th page 
+        or if the current page has no next page link.
 
-        Raises:
-            SystemExit: If an unexpected error occurs while waiting for 
-                        articles to load.
-        
         Returns:
             None
         """
+        if self.__page_number >= 10:
+            return
+        next_page_url: Optional[str] = self.browser.execute_javascript(
+            self.__NEXT_PAGE_URL_SCRIPT)
+        if next_page_url is None:
+            return
+        driver = self.browser.driver
+        current_tab: str = driver.current_window_handle
         try:
-            # Wait for the article section to start loading
-            articles_section = 'class:search-results-module-results-menu'
-            self.browser.wait_until_element_is_not_visible(articles_section,
-                                                           timeout=1)
-        except Exception as e:
-            if 'still visible after' in str(e):
-                # Case where articles finished loading before the
-                # wait_until_element_is_not_visible command in the try
-                # block was executed
-                pass
-            elif 'stale element reference' in str(e):
-                # Case where articles are loading and the element
-                # reference becomes stale
-                pass
+            if self.__prefetch_tab is None:
+                driver.switch_to.new_window('tab')
+                self.__prefetch_tab = driver.current_window_handle
             else:
-                critical_message = (
-                    'An error occurred while waiting for articles to load: %s'
-                    )
-                logger.critical(critical_message, e)
-                sys.exit(1)
-        # Check if articles finished loading
-        self.browser.wait_until_element_is_visible(articles_section,
-                                                   timeout=30)
+                driver.switch_to.window(self.__prefetch_tab)
+            self.browser.execute_javascript(self.__PREFETCH_SCRIPT,
+                                            'ARGUMENTS', next_page_url)
+        except Exception as e:
+            # The next page is then loaded by clicking its link
+            logger.warning('Could not prefetch the next page: %s', e)
+            self.__prefetch_tab = None
+            driver.switch_to.window(current_tab)
+            return
+        driver.switch_to.window(current_tab)
+        self.__prefetched_page = self.__page_number + 1
+
+    def __switch_to_prefetched_page(self) -> None:
+        """
+        Swaps the tabs, so the prefetched page becomes the current one 
+        and the tab of the current page is used by the next prefetch, 
+        and waits for the prefetched page to be rendered.
+
+        Returns:
+            None
+        """
+        driver = self.browser.driver
+        current_tab: str = driver.current_window_handle
+        driver.switch_to.window(self.__prefetch_tab)
+        self.__prefetch_tab = current_tab
+        self.__page_number = self.__prefetched_page
+        self.__prefetched_page = None
+        self.__wait_for_articles_to_load('prefetched_page')
+
+    def __wait_for_articles_to_load(self, reason: str) -> None:
+        """
+        Waits for the results reloaded by an action to be rendered on 
+        the LA Times website.
+
+        The results must be marked stale (see __mark_articles_stale) 
+        before the action. This method injects a script that watches 
+        the page with a MutationObserver and resolves as soon as the 
+        first article of the results is one that is not marked stale, 
+        whether the action reloaded the whole page or only replaced 
+        the results. The script gives up after a few seconds 
+        (so it stays within the script timeout of Selenium) and is 
+        injected again, into the new document if the page navigated 
+        meanwhile, until the results are ready or 30 seconds passed. 
+        If they are still not reloaded then, it logs a warning and 
+        proceeds with the results on the page. The wall time of every 
+        wait is recorded as a 'results_wait' span.
+
+        Args:
+            reason (str): The action that reloads the results (e.g. 
+                          'sort', 'topic' or 'page'), used to label the 
+                          recorded wait.
+
+        Returns:
+            None
+        """
+        with Metrics().span('results_wait', reason=reason):
+            deadline: float = time.monotonic() + 30
+            while time.monotonic() < deadline:
+                try:
+                    is_ready: bool = self.browser.execute_async_javascript(
+                        self.__RESULTS_READY_SCRIPT, 'ARGUMENTS', 4000)
+                except Exception as e:
+                    # The page navigated while the script was waiting
+                    logger.debug('Results wait interrupted: %s', e)
+                    continue
+                if is_ready:
+                    return
+            logger.warning('Results did not reload after %s.', reason)
 
     def select_topic(self, search_topic: str) -> None:
         """
@@ -354,6 +882,7 @@ class LATimesBrowser:
             logger.warning('Topic is already selected.')
             return
         # Select the topic (if not already selected)
+        self.__mark_articles_stale()
         self.browser.click_element_when_clickable(checkbox, timeout=30)
         # Make sure the topic is filtered
         try:
@@ -364,6 +893,7 @@ class LATimesBrowser:
                                                        timeout=30)
         except Exception as e:
             if 'not visible' in str(e):
+                self.__mark_articles_stale()
                 self.browser.click_element_when_clickable(checkbox, timeout=30)
             else:
                 critical_message: str = (
@@ -372,32 +902,92 @@ class LATimesBrowser:
                     )
                 logger.critical(critical_message, e)
                 sys.exit(1)
-        self.__wait_for_articles_to_load()
+        self.__wait_for_articles_to_load('topic')
 
-    def get_page_articles(self, phrase: str) -> list[dict]:
+    def get_page_articles(self, phrase: str,
+                          batch: bool = True) -> list[Article]:
         """
-        Retrieves articles from the current page and converts them to a 
-        list of dictionaries.
+        Retrieves the articles of the current page.
 
-        This method finds all article elements on the current page, 
-        converts each article element to a dictionary using a helper 
-        method, and returns a list of these dictionaries.
+        By default this method extracts every article on the page in a 
+        single JavaScript call, which avoids one WebDriver round trip 
+        per field of every article. When batch is False, it finds all 
+        article elements on the current page and converts each of them 
+        to an article using a helper method. If an element goes stale 
+        while being read, the whole list of elements is fetched again 
+        and the conversion restarts.
 
         Args:
             phrase (str): The search phrase to be used in article 
             conversion.
+            batch (bool): Whether to extract the articles with a single 
+                          JavaScript call. Defaults to True.
 
         Returns:
-            list[dict]: A list of dictionaries, each representing an 
-            article found on the page.
+            list[Article]: The articles found on the page.
         """
-        article_elements = self.__get_article_elements()
-        articles: list = []
-        for article_element in article_elements:
-            article: dict = self.__article_element_to_dict(article_element,
-                                                           phrase)
-            articles.append(article)
-        return articles
+        self.__record_network()
+        if self.prefetch_pages:
+            self.__prefetch_next_page()
+        if batch:
+            return self.__get_page_articles_batch(phrase)
+        max_attempts: int = 3
+        for attempt in range(1, max_attempts + 1):
+            article_elements = self.__get_article_elements()
+            try:
+                articles: list[Article] = []
+                for article_element in article_elements:
+                    with Metrics().span('article_extraction'):
+                        article: Article = self.__article_element_to_article(
+                            article_element, phrase)
+                    articles.append(article)
+                return articles
+            except StaleElementReferenceException:
+                warning_message: str = (
+                    'Article elements went stale (attempt %d of %d). '
+                    'Fetching them again.'
+                    )
+                logger.warning(warning_message, attempt, max_attempts)
+        logger.critical('Article elements kept going stale.')
+        sys.exit(1)
+
+    def __get_page_articles_batch(self, phrase: str) -> list[Article]:
+        """
+        Retrieves all articles from the current page with a single 
+        JavaScript call.
+
+        This method waits for the article section to become visible and 
+        then runs a script in the browser that reads the title, 
+        description, timestamp and image source of every article at 
+        once, returning plain data instead of web elements. If the 
+        article section is replaced while the script runs (e.g. the 
+        page is still reloading), the extraction is retried. If it 
+        keeps failing, it logs an error and exits the program.
+
+        Args:
+            phrase (str): The search phrase to be used in article 
+                          conversion.
+
+        Returns:
+            list[Article]: The articles found on the page.
+        """
+        article_section: str = 'class:search-results-module-results-menu'
+        max_attempts: int = 3
+        for attempt in range(1, max_attempts + 1):
+            self.browser.wait_until_element_is_visible(article_section,
+                                                       timeout=30)
+            raw_articles: Optional[list[dict]] = (
+                self.browser.execute_javascript(self.__ARTICLES_SCRIPT)
+                )
+            if raw_articles is not None:
+                return ArticleUtil.build_articles(raw_articles, phrase)
+            warning_message: str = (
+                'Article section not found while extracting articles '
+                '(attempt %d of %d). Retrying...'
+                )
+            logger.warning(warning_message, attempt, max_attempts)
+        logger.error('Article section element not found.')
+        sys.exit(1)
 
     def __get_article_elements(self):
         """
@@ -425,17 +1015,14 @@ class LATimesBrowser:
             articles, parent=article_section_element)
         return article_elements
 
-    def __article_element_to_dict(self, article_web_element,
-                                  phrase:str) -> dict:
+    def __article_element_to_article(self, article_web_element,
+                                     phrase:str) -> Article:
         """
-        Converts a web element representing an article into a 
-        dictionary.
+        Converts a web element representing an article into an article.
 
         This method extracts various details from the given article web 
-        element,such as the title, description, date, and image source. 
-        It also checks if the article text contains any mention of 
-        money and counts how many times the search phrase appears in 
-        the article.
+        element,such as the title, description, date, and image source, 
+        and builds the article from them.
 
         Args:
             article_web_element: The web element representing the 
@@ -444,205 +1031,68 @@ class LATimesBrowser:
                           occurrences in the article.
 
         Returns:
-            dict: A dictionary containing the article details, 
-                  including title, description, date, image source, 
-                  whether the text contains a mention of money, and the 
-                  count of the search phrase.
-        """
-        title: str = self.__get_article_title(article_web_element)
-        description: str = self.__get_article_description(article_web_element)
-        date: str = self.__get_article_date(article_web_element)
-        image_src: str = self.__get_article_image_src(article_web_element)
-        image_file_name: str = self.__get_image_file_name(image_src)
-        article_text: str = title + ' | ' + description
-        text_contains_money: bool = self.__is_contains_money(article_text)
-        phrase_count: int = article_text.count(phrase.lower())
-        article: dict = {
-            'title': title,
-            'description': description,
-            'date': date,
-            'image_src': image_src,
-            'image_file_name': image_file_name,
-            'text_contains_money': text_contains_money,
-            'search_phrase_count': phrase_count
-        }
-        return article
-
-    def __get_article_title(self, article_web_element) -> str:
+            Article: The article, including its title, description, 
+                     date, image source, the mentions of money in its 
+                     text, and the count of the search phrase.
         """
-        Extracts the title of an article from the given article web 
-        element.
-
-        This method finds the title element within the given article 
-        element and returns the text content of that element. If the 
-        title element is not found, it logs an error and returns a 
-        placeholder string.
-
-        Args:
-            article_element: The web element representing the article.
-
-        Returns:
-            str: The title of the article or a placeholder string.
+        title_locator: str = 'class:promo-title'
+        description_locator: str = 'class:promo-description'
+        date_locator: str = 'class:promo-timestamp'
+        title: Optional[str] = self.__get_element_text(title_locator,
+                                                       article_web_element)
+        description: Optional[str] = self.__get_element_text(
+            description_locator, article_web_element)
+        unconverted_date: Optional[str] = self.__get_element_text(
+            date_locator, article_web_element)
+        image_src: Optional[str] = self.__get_article_image_src(
+            article_web_element)
+        return ArticleUtil.build_article(title, description,
+                                         unconverted_date, image_src, phrase)
+
+    def __get_element_text(self, locator: str,
+                           article_web_element) -> Optional[str]:
         """
-        try:
-            title_locator: str = 'class:promo-title'
-            title: str = self.browser.find_element(
-                title_locator, parent=article_web_element
-                ).text
-        except ElementNotFound:
-            title: str = 'Title not found'
-            error_message: str = (
-                'Title element not found. Returned %s placeholder '
-                'instead.'
-                )
-            logger.error(error_message, title)
-        return title
-
-    def __get_article_description(self, article_web_element) -> str:
-        """
-        Extracts the description of an article from the given article 
-        web element.
-
-        This method finds the description element within the given 
-        article element and returns the text content of that element. If 
-        the description element is not found, it logs an error and 
-        returns a placeholder string.
-
-        Args:
-            article_element: The web element representing the article.
-
-        Returns:
-            str: The description of the article or a placeholder string.
-        """
-        try:
-            description_locator: str = 'class:promo-description'
-            description: str = self.browser.find_element(
-                description_locator, parent=article_web_element
-                ).text
-        except ElementNotFound:
-            description: str = 'Description not found'
-            error_message: str = (
-                'Description element not found. Returned %s placeholder '
-                'instead.'
-                )
-            logger.error(error_message, description)
-        return description
-
-    def __get_article_date(self, article_web_element) -> str:
-        """
-        Extracts the date of an article from the given article web 
+        Extracts the text of a child element of the given article web 
         element.
 
-        This method finds the date element within the given article 
-        element and returns the text content of that element. If the 
-        date element is not found, it logs an error and returns a 
-        placeholder string.
-
         Args:
-            article_element: The web element representing the article.
+            locator (str): The locator of the child element.
+            article_web_element: The web element representing the 
+                                 article.
 
         Returns:
-            str: The date of the article or a placeholder string.
+            Optional[str]: The text of the child element, or None if it 
+                           was not found.
         """
         try:
-            date_locator: str = 'class:promo-timestamp'
-            unconverted_date: str = self.browser.find_element(
-                date_locator, parent=article_web_element
-                ).text
-            date: Optional[datetime] = DateUtil.date_to_datetime(
-                unconverted_date
-                )
-            if date is None:
-                formatted_date: str = 'Date found but is empty'
-                error_message: str = (
-                    'Date element found but contains empty string. Returned '
-                    '%s placeholder instead.'
-                    )
-                logger.error(error_message, formatted_date)
-            else:
-                formatted_date: str = date.strftime('%m/%d/%Y')
+            return self.browser.find_element(locator,
+                                             parent=article_web_element).text
         except ElementNotFound:
-            date: str = 'Date not found'
-            error_message: str = (
-                'Date element not found. Returned %s placeholder instead.'
-                )
-            logger.error(error_message, date)
-        return formatted_date
+            return None
 
-    def __get_article_image_src(self, article_web_element) -> str:
+    def __get_article_image_src(self, article_web_element) -> Optional[str]:
         """
         Extracts the image source URL of an article from the given 
         article web element.
 
         This method finds the image element within the given article 
         element and returns the value of the 'src' attribute of that 
-        element. If the image element is not found or does not have a 
-        'src' attribute, it logs an error and returns a placeholder 
-        string.
+        element.
 
         Args:
             article_element: The web element representing the article.
 
         Returns:
-            str: The image source URL of the article or a placeholder 
-                 string.
+            Optional[str]: The image source URL of the article, or None 
+                           if the image element was not found.
         """
         try:
             image_locator: str = 'class:image'
-            image_src: str = self.browser.find_element(
+            return self.browser.find_element(
                 image_locator, parent=article_web_element
                 ).get_attribute('src')
         except ElementNotFound:
-            image_src: str = 'Image not found'
-            error_message: str = (
-                'Image element not found. Returned %s placeholder instead.'
-                )
-            logger.error(error_message, image_src)
-        return image_src
-
-    def __get_image_file_name(self, image_src: str) -> str:
-        """
-        Extracts the image file name from the given image source URL.
-
-        This method extracts the file name from the image source URL by 
-        splitting the URL and returning the last part of the split. If 
-        the image source URL is not valid, it logs an error and returns 
-        a placeholder string.
-
-        Args:
-            image_src (str): The image source URL.
-
-        Returns:
-            str: The image file name or a placeholder string.
-        """
-        if image_src == 'Image not found':
-            image_file_name: str = 'Image not found'
-        else:
-            image_file_name: str = ImageUtil.extract_image_name(image_src)
-        return image_file_name
-
-    def __is_contains_money(self, article_text: str):
-        """
-        Checks if the given article text contains a mention of money.
-
-        This method uses a regular expression pattern to search for 
-        money-related terms in the given text. If a match is found, it 
-        returns True; otherwise, it returns False.
-
-        Args:
-            text (str): The text to search for money-related terms.
-
-        Returns:
-            bool: True if the text contains a mention of money, False 
-                  otherwise.
-        """
-        money_pattern = (
-            r'\$\d{1,3}((,?\d{3})|(\d*))*(\.\d{1,2})?'
-            r'|(\d{1,3}(,?\d{3})*(\.\d{1,2})? (dollars|USD))'
-        )
-        if re.search(money_pattern, article_text.lower()):
-            return True
-        return False
+            return None
 
     def next_page(self, page_number: int) -> bool:
         """
@@ -653,8 +1103,16 @@ class LATimesBrowser:
         are only 10 pages of results and returns False. It waits for 
         the next button to be visible and clickable. If the next button 
         or its parent element is not found, it logs an error and 
-        returns False. If successful, it clicks the next button and 
-        returns True.
+        returns False. If successful, it clicks the next button, waits 
+        for the results of the next page to be rendered and returns
+        True.
+
+        With prefetch_pages, the next page is already loading in the
+        prefetch tab (started by get_page_articles), so this method
+        switches to that tab and only waits for the rest of its load.
+        Selenium drives one tab at a time, so the prefetch tab is
+        started with a non-blocking navigation and left to load while
+        the current page is read.
 
         Args:
             page_number (int): The current page number.
@@ -670,6 +1128,10 @@ class LATimesBrowser:
             )
             logger.warning(warning_message, page_number + 1)
             return False
+        if self.__prefetched_page == page_number + 1:
+            self.__switch_to_prefetched_page()
+            return True
+        self.__page_number = page_number + 1
         next_button_parent: str = 'class:search-results-module-next-page'
         self.browser.wait_until_element_is_visible(next_button_parent,
                                                    timeout=30)
@@ -686,8 +1148,42 @@ class LATimesBrowser:
         except ElementNotFound:
             logger.error('Next button element not found.')
             return False
+        self.__mark_articles_stale()
         self.browser.click_element_when_clickable(next_button_element,
                                                   timeout=30)
+        self.__wait_for_articles_to_load('page')
+        return True
+
+    def reset(self) -> None:
+        """
+        Prepares an open browser for a new search by navigating back to 
+        the LA Times homepage.
+
+        The browser is not relaunched, so its session, cookies and 
+        cached resources are kept between searches.
+
+        Returns:
+            None
+        """
+        logger.info('Resetting browser...')
+        self.__clear_prefetch(keep_tab=True)
+        self.browser.go_to(self.url)
+        logger.info('Finished resetting browser.')
+
+    def is_healthy(self) -> bool:
+        """
+        Checks whether the browser still responds.
+
+        Returns:
+            bool: True if the browser can run scripts on the current 
+                  page, False otherwise (e.g. it crashed or its session 
+                  expired).
+        """
+        try:
+            self.browser.execute_javascript('return document.readyState')
+        except Exception as e:
+            logger.warning('Browser health check failed: %s', e)
+            return False
         return True
 
     def close_browser(self) -> None:
@@ -702,8 +1198,10 @@ class LATimesBrowser:
             None
         """
         logger.info('Closing browser...')
+        self.__record_network()
         self.browser.close_browser()
-        self._instance = None
+        # Reset on the class, so the next browser gets its own profile
+        LATimesBrowser._instance = None
         logger.info('Finished closing browser.')
 
 
@@ -713,27 +1211,60 @@ class Scraper:
     specified date range.
 
     This class provides methods to scrape articles based on a given 
-    date range and search phrase. It uses the LATimesBrowser to 
-    navigate the website, retrieve articles, and filter them according 
-    to the specified criteria.
+    date range and search phrase. It uses a browser (LATimesBrowser by 
+    default, or any backend with the same interface such as 
+    LATimesHTTPBrowser) to navigate the website, retrieve articles, and 
+    filter them according to the specified criteria.
+
+    When the browser can fetch any results page directly (i.e. it has 
+    a get_page_articles_at method, like LATimesHTTPBrowser), the first 
+    results page that reaches the date range is located before 
+    scraping, and with more than one worker several results pages are 
+    fetched at the same time instead of one after another. The workers 
+    only live as long as the scrape, and the browser closes their 
+    connections (close_idle_sessions) when it ends.
+
+    When an ArticleStore is given, scraping stops at the first article 
+    that was already harvested for the same search phrase and topic, 
+    so only new articles are returned.
+
+    When a ScrapeJournal is given, the selected articles and the cursor 
+    of the scrape are journaled after each results page. If the journal 
+    has a checkpoint of the same scrape (an interrupted earlier run), 
+    its articles are returned first and scraping resumes from its next 
+    page, skipping articles that were already journaled.
+
+    When a stop event is given, scraping stops with an error once the 
+    event is set (e.g. when the worker running the scrape lost the 
+    lease of its job), before the next results page is read. The pages 
+    read until then stay journaled.
     """
 
-    def __init__(self) -> None:
-        self.__browser = LATimesBrowser()
+    MAX_PAGES: int = 10
+
+    def __init__(self, browser=None, workers: int = 1,
+                 store: Optional[ArticleStore] = None,
+                 journal: Optional[ScrapeJournal] = None,
+                 stop_event: Optional[threading.Event] = None) -> None:
+        if browser is None:
+            browser = LATimesBrowser()
+        self.__browser = browser
+        self.__workers = max(1, workers)
+        self.__store = store
+        self.__journal = journal
+        self.__stop_event = stop_event
+        self.__seen_article_keys: set[str] = set()
+        self.__journaled_article_keys: set[str] = set()
 
     def scrape_articles_in_date_range(self, start_date: datetime,
-                                      end_date: datetime,
-                                      phrase: str) -> list[dict]:
+                                      end_date: datetime, phrase: str,
+                                      topic: str = '') -> list[Article]:
         """
         Scrapes articles within a specified date range from the 
         LA Times website.
 
-        This method initializes the browser, scrapes articles page by 
-        page, and filters them based on the given date range. If the 
-        date of an article cannot be found or is outside the specified 
-        range, the article is skipped. The method continues to scrape 
-        and collect articles until no more pages are available or all 
-        articles within the date range are collected.
+        This method collects every article yielded by 
+        iter_articles_in_date_range into a list.
 
         Args:
             start_date (datetime): The start date of the date range for 
@@ -742,37 +1273,431 @@ class Scraper:
                                  scraping articles.
             phrase (str): The search phrase to be used in filtering 
                           articles.
+            topic (str): The topic the articles were filtered by. It is 
+                         only used to look up already harvested 
+                         articles in the store and the checkpoint in 
+                         the journal. Defaults to ''.
 
         Returns:
-            list[dict]: A list of dictionaries, each representing an 
-                        article found within the specified date range.
+            list[Article]: The articles found within the specified date 
+                           range.
+        """
+        return list(self.iter_articles_in_date_range(start_date, end_date,
+                                                     phrase, topic))
+
+    def iter_articles_in_date_range(self, start_date: datetime,
+                                    end_date: datetime, phrase: str,
+                                    topic: str = '') -> Iterator[Article]:
+        """
+        Scrapes articles within a specified date range from the 
+        LA Times website, yielding them as each page is parsed.
+
+        This method scrapes articles page by page (or several pages at 
+        a time, see the class description), and filters them based on 
+        the given date range. If the date of an article cannot be 
+        found or is outside the specified range, the article is 
+        skipped. The method continues to scrape and yield articles 
+        until no more pages are available or all articles within the 
+        date range are yielded. The next page is only requested once 
+        the articles of the current one were consumed.
+
+        Args:
+            start_date (datetime): The start date of the date range for 
+                                   scraping articles.
+            end_date (datetime): The end date of the date range for 
+                                 scraping articles.
+            phrase (str): The search phrase to be used in filtering 
+                          articles.
+            topic (str): The topic the articles were filtered by. It is 
+                         only used to look up already harvested 
+                         articles in the store and the checkpoint in 
+                         the journal. Defaults to ''.
+
+        Yields:
+            Article: The articles found within the specified date range, 
+                  newest first.
         """
         logger.info('Scraping articles...')
-        page_number: int = 1
-        articles: list = []
-        while True:
-            page_articles: list[dict] = self.__browser.get_page_articles(
-                phrase)
-            for page_article in page_articles:
-                string_date: str = page_article['date']
-                if string_date == 'Date not found':
-                    warning_message: str = (
-                        'Date not found for article when scraping. Therefore, '
-                        'article will be skipped.'
-                        )
-                    logger.warning(warning_message)
-                    continue
-                page_article_date: Optional[datetime] = DateUtil.date_to_datetime(
-                    string_date)
-                if page_article_date > end_date:
-                    continue
-                if page_article_date < start_date:
-                    if len(articles) == 0:
-                        logger.warning('No articles found within date range.')
+        if self.__store is not None:
+            self.__seen_article_keys = self.__store.get_article_keys(phrase,
+                                                                     topic)
+        articles_count: int = 0
+        scrape_key: Optional[str] = None
+        resume_page: Optional[int] = None
+        if self.__journal is not None:
+            scrape_key = ScrapeJournal.scrape_key(phrase, topic, start_date,
+                                                  end_date)
+            checkpoint: Optional[dict] = self.__journal.get_checkpoint(
+                scrape_key)
+            if checkpoint is not None:
+                journaled_articles: list[Article] = (
+                    self.__journal.get_articles(scrape_key))
+                info_message: str = (
+                    'Resuming interrupted scrape with %d journaled articles '
+                    'from results page %d.'
+                    )
+                logger.info(info_message, len(journaled_articles),
+                            checkpoint['next_page'])
+                self.__journaled_article_keys = {
+                    ArticleStore.article_key(article)
+                    for article in journaled_articles
+                    }
+                articles_count += len(journaled_articles)
+                yield from journaled_articles
+                if checkpoint['is_complete'] or (
+                        checkpoint['next_page'] > self.MAX_PAGES):
                     logger.info('Finished scraping articles.')
-                    return articles
-                articles.append(page_article)
-            if not self.__browser.next_page(page_number):
+                    return
+                resume_page = checkpoint['next_page']
+        if hasattr(self.__browser, 'get_page_articles_at'):
+            pages: dict[int, list[Article]] = {}
+            first_page: Optional[int] = resume_page
+            if first_page is None:
+                first_page = self.__locate_first_page(end_date, phrase,
+                                                      pages)
+            if first_page is None:
+                logger.warning('No articles found within date range.')
                 logger.info('Finished scraping articles.')
-                return articles
+                return
+            page_iterator: Iterator[tuple[int, list[Article]]] = (
+                self.__iter_pages_concurrently(start_date, phrase,
+                                               first_page, pages)
+                )
+        else:
+            if self.__workers > 1:
+                warning_message: str = (
+                    'The browser cannot fetch results pages concurrently. '
+                    'Scraping them one at a time instead.'
+                    )
+                logger.warning(warning_message)
+            page_iterator = self.__iter_pages_sequentially(phrase,
+                                                           resume_page or 1)
+        try:
+            for page_number, page_articles in page_iterator:
+                articles, is_last_page = self.__filter_page_articles(
+                    page_articles, start_date, end_date)
+                if self.__journal is not None:
+                    # Journal the page before its articles are handed on
+                    last_article_key: Optional[str] = None
+                    if page_articles:
+                        last_article_key = ArticleStore.article_key(
+                            page_articles[-1])
+                    self.__journal.save_page(scrape_key, page_number + 1,
+                                             last_article_key, articles,
+                                             is_last_page)
+                articles_count += len(articles)
+                yield from articles
+                if is_last_page:
+                    break
+                if (self.__stop_event is not None
+                        and self.__stop_event.is_set()):
+                    logger.error('Scrape stopped after results page %d.',
+                                 page_number)
+                    raise RuntimeError('The scrape was stopped')
+        finally:
+            page_iterator.close()
+        if self.__journal is not None:
+            self.__journal.complete(scrape_key)
+        if articles_count == 0:
+            logger.warning('No articles found within date range.')
+        logger.info('Finished scraping articles.')
+
+    def __iter_pages_sequentially(self, phrase: str, first_page: int = 1
+                                  ) -> Iterator[tuple[int, list[Article]]]:
+        """
+        Yields the articles of the results pages one page at a time, 
+        moving to the next page only when it is requested.
+
+        Args:
+            phrase (str): The search phrase to be used in article 
+                          conversion.
+            first_page (int): The number of the first page to scrape. 
+                              The pages before it are skipped without 
+                              reading their articles. Defaults to 1.
+
+        Yields:
+            tuple[int, list[Article]]: The number and the articles of 
+                                       each results page.
+        """
+        metrics: Metrics = Metrics()
+        page_number: int = 1
+        while page_number < first_page:
+            with metrics.span('next_page'):
+                has_next_page: bool = self.__browser.next_page(page_number)
+            if not has_next_page:
+                return
             page_number += 1
+        while True:
+            with metrics.span('page', page=str(page_number)):
+                page_articles: list[Article] = (
+                    self.__browser.get_page_articles(phrase))
+            yield page_number, page_articles
+            with metrics.span('next_page'):
+                has_next_page = self.__browser.next_page(page_number)
+            if not has_next_page:
+                return
+            page_number += 1
+
+    def __iter_pages_concurrently(self, start_date: datetime, phrase: str,
+                                  first_page: int,
+                                  pages: dict[int, list[Article]]
+                                  ) -> Iterator[tuple[int, list[Article]]]:
+        """
+        Yields the articles of the results pages, fetching them with a 
+        bounded pool of workers.
+
+        This method keeps up to the configured number of results pages, 
+        starting at the given first page, being fetched at the same 
+        time. Pages that were already fetched are reused. As soon as 
+        any fetched page is empty, contains an article older than the 
+        start date or an already harvested article, no page after it 
+        is needed: the pages after it that are still waiting are 
+        cancelled and no new ones are requested. Pages are yielded in 
+        page order as soon as they are available, so the articles keep 
+        the newest-first order of the search results.
+
+        Args:
+            start_date (datetime): The start date of the date range for 
+                                   scraping articles.
+            phrase (str): The search phrase to be used in article 
+                          conversion.
+            first_page (int): The number of the first page to scrape.
+            pages (dict[int, list[Article]]): The articles of the pages 
+                                              that were already fetched, 
+                                              by page number.
+
+        Yields:
+            tuple[int, list[Article]]: The number and the articles of 
+                                       each results page.
+        """
+        last_page: int = self.MAX_PAGES
+        cancelled = threading.Event()
+
+        def fetch_page(page_number: int) -> Optional[list[Article]]:
+            if cancelled.is_set() and page_number > last_page:
+                return None
+            with Metrics().span('page', page=str(page_number)):
+                return self.__browser.get_page_articles_at(page_number,
+                                                           phrase)
+
+        is_last_page_found: bool = False
+        # Pages fetched while locating the first page are checked first
+        for page_number in sorted(pages):
+            if page_number >= first_page and (
+                    not pages[page_number] or self.__is_last_needed_page(
+                        pages[page_number], start_date)):
+                last_page = min(last_page, page_number)
+                is_last_page_found = True
+        executor = ThreadPoolExecutor(max_workers=self.__workers)
+        pending: dict[Future, int] = {}
+        next_page_number: int = first_page
+        page_to_yield: int = first_page
+        try:
+            while page_to_yield <= last_page:
+                if page_to_yield in pages:
+                    yield page_to_yield, pages.pop(page_to_yield)
+                    page_to_yield += 1
+                    continue
+                # Yielded pages are popped, so they are not requested
+                # again
+                next_page_number = max(next_page_number, page_to_yield)
+                while (next_page_number <= last_page
+                       and len(pending) < self.__workers):
+                    if next_page_number in pages:
+                        next_page_number += 1
+                        continue
+                    future: Future = executor.submit(fetch_page,
+                                                     next_page_number)
+                    pending[future] = next_page_number
+                    next_page_number += 1
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future not in pending:
+                        # Cancelled by an earlier page of this batch
+                        continue
+                    page_number: int = pending.pop(future)
+                    if page_number > last_page:
+                        continue
+                    page_articles: list[Article] = future.result()
+                    pages[page_number] = page_articles
+                    if not page_articles or self.__is_last_needed_page(
+                            page_articles, start_date):
+                        last_page = page_number
+                        is_last_page_found = True
+                        cancelled.set()
+                        for other_future, other_page in list(pending.items()):
+                            if other_page > last_page:
+                                other_future.cancel()
+                                del pending[other_future]
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            # The workers ended, so their connections are closed
+            self.__browser.close_idle_sessions()
+        if not is_last_page_found:
+            warning_message: str = (
+                'Could not move to next page %d due to search results only '
+                'return 10 pages of results.'
+            )
+            logger.warning(warning_message, last_page + 1)
+
+    def __locate_first_page(self, end_date: datetime, phrase: str,
+                            pages: dict[int, list[Article]]
+                            ) -> Optional[int]:
+        """
+        Locates the first results page that reaches the date range.
+
+        Since the results are sorted newest first, every page before 
+        the first one whose oldest article is not newer than the end 
+        date only contains articles that would be skipped. This method 
+        probes pages with exponentially growing jumps (1, 2, 4, 8, ...) 
+        until it finds a page that reaches the date range, and then 
+        binary searches between the last two probes. Empty pages (past 
+        the last page of the search) and pages without any dated 
+        article count as reaching the date range, which can only make 
+        scraping start earlier than needed, never later.
+
+        Args:
+            end_date (datetime): The end date of the date range.
+            phrase (str): The search phrase to be used in article 
+                          conversion.
+            pages (dict[int, list[Article]]): The articles of the probed 
+                                              pages, by page number. It is 
+                                              filled by this method so the 
+                                              probed pages are not fetched 
+                                              again.
+
+        Returns:
+            Optional[int]: The number of the first page that reaches 
+                           the date range, or None if every page only 
+                           contains articles newer than the end date.
+        """
+
+        def reaches_date_range(page_number: int) -> bool:
+            if page_number not in pages:
+                with Metrics().span('page', page=str(page_number)):
+                    pages[page_number] = self.__browser.get_page_articles_at(
+                        page_number, phrase)
+            page_dates: list[datetime] = [
+                page_article_date for page_article_date in (
+                    page_article.date for page_article in pages[page_number]
+                    )
+                if page_article_date is not None
+                ]
+            return not page_dates or min(page_dates) <= end_date
+
+        if reaches_date_range(1):
+            return 1
+        # Gallop until a page reaches the date range
+        too_new_page: int = 1
+        probe_page: int = 2
+        while probe_page < self.MAX_PAGES and not reaches_date_range(
+                probe_page):
+            too_new_page = probe_page
+            probe_page *= 2
+        reaching_page: int = min(probe_page, self.MAX_PAGES)
+        if not reaches_date_range(reaching_page):
+            return None
+        # Binary search between the last page that is too new and the
+        # first probed page that reaches the date range
+        while reaching_page - too_new_page > 1:
+            middle_page: int = (too_new_page + reaching_page) // 2
+            if reaches_date_range(middle_page):
+                reaching_page = middle_page
+            else:
+                too_new_page = middle_page
+        if reaching_page > 1:
+            logger.info('Skipping to results page %d.', reaching_page)
+        return reaching_page
+
+    def __is_last_needed_page(self, page_articles: list[Article],
+                              start_date: datetime) -> bool:
+        """
+        Checks if no results page after the given one is needed, i.e. 
+        if any of its articles is older than the start date or was 
+        already harvested.
+
+        Args:
+            page_articles (list[Article]): The articles of the page.
+            start_date (datetime): The start date of the date range.
+
+        Returns:
+            bool: True if no page after the given one is needed, False 
+                  otherwise.
+        """
+        for page_article in page_articles:
+            page_article_date: Optional[datetime] = page_article.date
+            if page_article_date is None:
+                # Skipped when the page is filtered as well
+                continue
+            if self.__is_harvested(page_article):
+                return True
+            if page_article_date < start_date:
+                return True
+        return False
+
+    def __filter_page_articles(self, page_articles: list[Article],
+                               start_date: datetime, end_date: datetime
+                               ) -> tuple[list[Article], bool]:
+        """
+        Selects the articles of a results page that are within the date 
+        range.
+
+        Articles without a valid date are skipped, as are articles newer 
+        than the end date. Since the results are sorted newest first, 
+        the first article older than the start date means that no later 
+        article is within the date range, and the first already 
+        harvested article means that every later article was harvested 
+        as well.
+
+        Args:
+            page_articles (list[Article]): The articles of the page.
+            start_date (datetime): The start date of the date range.
+            end_date (datetime): The end date of the date range.
+
+        Returns:
+            tuple[list[Article], bool]: The articles within the date 
+                                        range, and whether an article 
+                                        older than the start date or an 
+                                        already harvested article was 
+                                        found and scraping should stop.
+        """
+        articles: list[Article] = []
+        for page_article in page_articles:
+            page_article_date: Optional[datetime] = page_article.date
+            if page_article_date is None:
+                warning_message: str = (
+                    'Date not found for article when scraping. Therefore, '
+                    'article will be skipped.'
+                    )
+                logger.warning(warning_message)
+                continue
+            if page_article_date > end_date:
+                continue
+            if page_article_date < start_date:
+                return articles, True
+            if self.__is_harvested(page_article):
+                logger.info('Reached an article harvested by a previous run.')
+                return articles, True
+            if ArticleStore.article_key(page_article) in (
+                    self.__journaled_article_keys):
+                # Already returned from the journal of an interrupted run
+                continue
+            articles.append(page_article)
+        return articles, False
+
+    def __is_harvested(self, page_article: Article) -> bool:
+        """
+        Checks if an article was already harvested for the current 
+        search phrase and topic.
+
+        Args:
+            page_article (Article): The article.
+
+        Returns:
+            bool: True if the article is in the store, False otherwise.
+        """
+        if not self.__seen_article_keys:
+            return False
+        return ArticleStore.article_key(page_article) in (
+            self.__seen_article_keys)
@@ -0,0 +1,580 @@
+"""
+This module provides a browser-free backend for scraping articles from
+the LA Times website over plain HTTP.
+
+Classes:
+    LATimesResultsParser: Parses an LA Times search results page.
+    LATimesHTTPBrowser: Requests LA Times search results pages directly
+                        and exposes the same interface as
+                        LATimesBrowser, so it can be used by the Scraper.
+
+Dependencies:
+    - requests
+    - urllib3.util.retry
+    - html.parser
+    - logging
+    - sys
+    - threading
+    - typing
+    - urllib.parse
+    - news_bot.models.Article
+    - news_bot.storage.TopicFilterCache
+"""
+
+from html.parser import HTMLParser
+import logging
+import sys
+import threading
+from typing import Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from news_bot.models import Article
+from news_bot.storage import TopicFilterCache
+from news_bot.utils import ArticleUtil, SearchUtil
+
+logger = logging.getLogger(__name__)
+
+
+class LATimesResultsParser(HTMLParser):
+    """
+    Parser for LA Times search results pages.
+
+    This class extracts, in a single pass over the HTML, the same
+    information the browser reads from a search results page: the raw
+    fields of every article in the results menu, the available topic
+    filters and whether there is a next page.
+
+    Attributes:
+        articles (list[dict]): The raw fields ('title', 'description',
+                               'timestamp' and 'image_src') of every
+                               article on the page. Missing fields are
+                               None.
+        topics (dict[str, Tuple[str, str]]): The name and value of the
+                                             filter parameter of each
+                                             topic, keyed by the
+                                             lowercase topic title.
+        next_page_url (Optional[str]): The URL of the next results page,
+                                       or None if there is none.
+    """
+
+    __VOID_TAGS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr',
+                             'img', 'input', 'link', 'meta', 'source',
+                             'track', 'wbr'})
+    __TEXT_FIELDS = {'promo-title': 'title',
+                     'promo-description': 'description',
+                     'promo-timestamp': 'timestamp'}
+
+    def __init__(self, page_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.articles: list[dict] = []
+        self.topics: dict[str, Tuple[str, str]] = {}
+        self.next_page_url: Optional[str] = None
+        self.__page_url = page_url
+        # Stack of (tag, context) for every open element
+        self.__stack: list[Tuple[str, Optional[str]]] = []
+        self.__article: Optional[dict] = None
+        self.__topic_title: Optional[str] = None
+        self.__topic_filter: Optional[Tuple[str, str]] = None
+        self.__text_parts: list[str] = []
+
+    def __in_context(self, context: str) -> bool:
+        """
+        Checks if the parser is inside an element of the given context.
+
+        Args:
+            context (str): The context to check (e.g. 'results').
+
+        Returns:
+            bool: True if an open element has the given context, False 
+                  otherwise.
+        """
+        return any(open_context == context for _, open_context in self.__stack)
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        """
+        Handles the start tag of an element.
+
+        This method detects the elements the parser is interested in 
+        (the results menu, articles and their fields, topics and the 
+        next page link) and pushes the element to the stack of open 
+        elements together with its context.
+
+        Args:
+            tag (str): The name of the tag.
+            attrs (list): The (name, value) pairs of the attributes.
+
+        Returns:
+            None
+        """
+        attributes: dict = dict(attrs)
+        classes: set[str] = set((attributes.get('class') or '').split())
+        if tag in self.__VOID_TAGS:
+            self.__handle_void_tag(tag, attributes, classes)
+            return
+        context: Optional[str] = None
+        if 'search-results-module-results-menu' in classes:
+            context = 'results'
+        elif tag == 'li' and self.__in_context('results') and (
+                self.__article is None):
+            context = 'article'
+            self.__article = {'title': None, 'description': None,
+                              'timestamp': None, 'image_src': None}
+        elif self.__article is not None and (
+                classes & self.__TEXT_FIELDS.keys()):
+            class_name: str = next(iter(classes & self.__TEXT_FIELDS.keys()))
+            context = self.__TEXT_FIELDS[class_name]
+            self.__text_parts = []
+        elif attributes.get('data-name') == 'Topics':
+            context = 'topics'
+        elif tag == 'li' and self.__in_context('topics'):
+            context = 'topic'
+            self.__topic_title = None
+            self.__topic_filter = None
+        elif tag == 'span' and self.__in_context('topic') and (
+                self.__topic_title is None):
+            context = 'topic_title'
+            self.__text_parts = []
+        elif 'search-results-module-next-page' in classes:
+            context = 'next_page'
+        elif tag == 'a' and self.__in_context('next_page'):
+            href: Optional[str] = attributes.get('href')
+            if href:
+                self.next_page_url = urljoin(self.__page_url, href)
+        self.__stack.append((tag, context))
+
+    def __handle_void_tag(self, tag: str, attributes: dict,
+                          classes: set[str]) -> None:
+        """
+        Handles an element without content, such as an image or an 
+        input.
+
+        This method reads the image source of articles and the filter 
+        name and value of topic checkboxes.
+
+        Args:
+            tag (str): The name of the tag.
+            attributes (dict): The attributes of the element.
+            classes (set[str]): The classes of the element.
+
+        Returns:
+            None
+        """
+        if tag == 'img' and self.__article is not None and (
+                'image' in classes):
+            src: Optional[str] = attributes.get('src')
+            if src:
+                self.__article['image_src'] = urljoin(self.__page_url, src)
+        elif tag == 'input' and self.__in_context('topic'):
+            name: Optional[str] = attributes.get('name')
+            value: Optional[str] = attributes.get('value')
+            if name and value:
+                self.__topic_filter = (name, value)
+
+    def handle_endtag(self, tag: str) -> None:
+        """
+        Handles the end tag of an element.
+
+        This method pops the element (and any element left open inside 
+        it) from the stack of open elements, closing their contexts. 
+        End tags without a matching open element are ignored.
+
+        Args:
+            tag (str): The name of the tag.
+
+        Returns:
+            None
+        """
+        if not any(open_tag == tag for open_tag, _ in self.__stack):
+            # Stray end tag
+            return
+        # Close every element left open inside the one being closed
+        while self.__stack:
+            open_tag, context = self.__stack.pop()
+            self.__close_context(context)
+            if open_tag == tag:
+                return
+
+    def __close_context(self, context: Optional[str]) -> None:
+        """
+        Stores the data collected for a context that was closed.
+
+        Args:
+            context (Optional[str]): The context of the closed element.
+
+        Returns:
+            None
+        """
+        if context == 'article':
+            self.articles.append(self.__article)
+            self.__article = None
+        elif context in self.__TEXT_FIELDS.values():
+            if self.__article is not None:
+                self.__article[context] = self.__joined_text()
+        elif context == 'topic_title':
+            self.__topic_title = self.__joined_text()
+        elif context == 'topic':
+            if self.__topic_title and self.__topic_filter:
+                self.topics[self.__topic_title.lower()] = self.__topic_filter
+
+    def __joined_text(self) -> str:
+        """
+        Joins the text collected for the current field, collapsing 
+        whitespace the same way the browser renders the text.
+
+        Returns:
+            str: The text of the current field.
+        """
+        return ' '.join(''.join(self.__text_parts).split())
+
+    def handle_data(self, data: str) -> None:
+        """
+        Collects the text content of the current element.
+
+        Args:
+            data (str): The text content.
+
+        Returns:
+            None
+        """
+        self.__text_parts.append(data)
+
+
+class LATimesHTTPBrowser:
+    """
+    Class for scraping the LA Times search results over plain HTTP.
+
+    This class requests the search results pages directly, passing the
+    search phrase, sort order, topic filter and page number as URL
+    parameters, and parses them without a browser. It exposes the same
+    methods as LATimesBrowser, so the news bot and the Scraper can use
+    either of them. Its requests identify it as a bot with its
+    User-Agent header, which can be replaced, e.g. to add a contact.
+
+    Attributes:
+        url (str): The base URL of the LA Times website.
+        user_agent (str): The User-Agent header of the requests.
+    """
+
+    USER_AGENT: str = 'news_bot/1.0 (automated LA Times news scraper)'
+
+    def __init__(self, url: str = 'https://www.latimes.com/',
+                 pool_size: int = 10, timeout: float = 30,
+                 user_agent: str = USER_AGENT) -> None:
+        self.url = url
+        self.user_agent = user_agent
+        self.__pool_size = pool_size
+        self.__timeout = timeout
+        # Sessions are not guaranteed to be thread-safe, so every thread
+        # that requests pages gets its own pooled session
+        self.__local = threading.local()
+        self.__sessions: dict[threading.Thread, requests.Session] = {}
+        self.__sessions_lock = threading.Lock()
+        self.__phrase: Optional[str] = None
+        self.__newest: bool = False
+        self.__topic_filter: Optional[Tuple[str, str]] = None
+        self.__page_number: int = 1
+        self.__page: Optional[LATimesResultsParser] = None
+
+    def open_website(self) -> None:
+        """
+        Prepares the HTTP backend for scraping.
+
+        Unlike the browser, the HTTP backend does not need to load the
+        homepage before searching, so this method only logs the process.
+
+        Returns:
+            None
+        """
+        logger.info('Opening website...')
+        logger.info('Finished opening website.')
+
+    def search(self, phrase: str) -> None:
+        """
+        Sets the search phrase of the results pages to request.
+
+        Args:
+            phrase (str): The search phrase.
+
+        Returns:
+            None
+        """
+        logger.info('Searching for articles...')
+        self.__phrase = phrase
+        self.__page_number = 1
+        self.__page = None
+        logger.info('Finished searching for articles.')
+
+    def select_newest_articles(self) -> None:
+        """
+        Sorts the requested results pages by newest first.
+
+        Returns:
+            None
+        """
+        logger.info('Selecting newest articles...')
+        self.__newest = True
+        self.__page_number = 1
+        self.__page = None
+        logger.info('Finished selecting newest articles.')
+
+    def select_topic(self, search_topic: str) -> None:
+        """
+        Filters the requested results pages by the given topic.
+
+        This method reads the topic filters available on the first
+        results page and selects the one whose title matches the given
+        topic. If no matching topic is found, it logs a critical error
+        and exits the program.
+
+        Args:
+            search_topic (str): The topic to be searched and selected.
+
+        Returns:
+            None
+        """
+        logger.info('Selecting topic...')
+        topics: dict[str, Tuple[str, str]] = self.__get_page().topics
+        topic_filter: Optional[Tuple[str, str]] = topics.get(
+            search_topic.lower())
+        if topic_filter is None:
+            critical_message: str = 'Was not able to find topic: %s'
+            logger.critical(critical_message, search_topic)
+            sys.exit(1)
+        self.__topic_filter = topic_filter
+        self.__page_number = 1
+        self.__page = None
+        logger.info('Finished selecting topic.')
+
+    def open_search_results(self, phrase: str, topic: str,
+                            topic_filters: TopicFilterCache) -> bool:
+        """
+        Searches for the phrase, sorted by newest first and filtered by 
+        topic, in one step.
+
+        The filter of the topic is taken from the cache, so the 
+        unfiltered first results page is only requested when it is not 
+        cached. The filters of all the topics of that page are cached.
+
+        Args:
+            phrase (str): The search phrase.
+            topic (str): The topic to filter the results by.
+            topic_filters (TopicFilterCache): The cache of the topic 
+                                              filters.
+
+        Returns:
+            bool: True if the search is ready, False if the topic was 
+                  not found.
+        """
+        logger.info('Opening search results...')
+        self.search(phrase)
+        self.__newest = True
+        topic_filter: Optional[Tuple[str, str]] = topic_filters.get(topic)
+        if topic_filter is None:
+            topic_filters.update(self.__get_page().topics)
+            topic_filter = topic_filters.get(topic)
+            if topic_filter is None:
+                logger.warning('Topic filter not found: %s', topic)
+                return False
+        self.__topic_filter = topic_filter
+        self.__page_number = 1
+        self.__page = None
+        logger.info('Finished opening search results.')
+        return True
+
+    def get_page_articles(self, phrase: str) -> list[Article]:
+        """
+        Retrieves the articles of the current results page.
+
+        Args:
+            phrase (str): The search phrase to be used in article
+                          conversion.
+
+        Returns:
+            list[Article]: The articles found on the page.
+        """
+        return ArticleUtil.build_articles(self.__get_page().articles, phrase)
+
+    def next_page(self, page_number: int) -> bool:
+        """
+        Moves to the next results page if available.
+
+        This method mirrors LATimesBrowser.next_page: the search only
+        returns 10 pages of results, and if the current page has no
+        next page link it logs an error and returns False.
+
+        Args:
+            page_number (int): The current page number.
+
+        Returns:
+            bool: True if there is a next page, False otherwise.
+        """
+        if page_number == 10:
+            warning_message: str = (
+                'Could not move to next page %d due to search results only '
+                'return 10 pages of results.'
+            )
+            logger.warning(warning_message, page_number + 1)
+            return False
+        if self.__get_page().next_page_url is None:
+            logger.error('Next button element not found.')
+            return False
+        self.__page_number = page_number + 1
+        self.__page = None
+        return True
+
+    def reset(self) -> None:
+        """
+        Clears the search, sort order and topic of the previous search. 
+        The pooled HTTP connections are kept open.
+
+        Returns:
+            None
+        """
+        logger.info('Resetting browser...')
+        self.__phrase = None
+        self.__newest = False
+        self.__topic_filter = None
+        self.__page_number = 1
+        self.__page = None
+        logger.info('Finished resetting browser.')
+
+    def is_healthy(self) -> bool:
+        """
+        Checks whether the backend can still request pages. The pooled 
+        sessions reconnect when needed, so it always can.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    def close_browser(self) -> None:
+        """
+        Closes the pooled HTTP connections.
+
+        Returns:
+            None
+        """
+        logger.info('Closing browser...')
+        with self.__sessions_lock:
+            for session in self.__sessions.values():
+                session.close()
+            self.__sessions.clear()
+        logger.info('Finished closing browser.')
+
+    def close_idle_sessions(self) -> None:
+        """
+        Closes the pooled HTTP connections of the threads that ended, 
+        e.g. the workers of a finished concurrent scrape, so a browser 
+        reused by many runs does not keep them open.
+
+        Returns:
+            None
+        """
+        with self.__sessions_lock:
+            for thread in [thread for thread in self.__sessions
+                           if not thread.is_alive()]:
+                self.__sessions.pop(thread).close()
+
+    def get_page_articles_at(self, page_number: int,
+                             phrase: str) -> list[Article]:
+        """
+        Retrieves the articles of the given results page.
+
+        Unlike get_page_articles, this method does not depend on the 
+        current page, so several pages can be requested at the same time 
+        from different threads. A page past the last one of the search 
+        returns no articles.
+
+        Args:
+            page_number (int): The number of the results page.
+            phrase (str): The search phrase to be used in article 
+                          conversion.
+
+        Returns:
+            list[Article]: The articles found on the page.
+        """
+        return ArticleUtil.build_articles(
+            self.__fetch_page(page_number).articles, phrase)
+
+    def __get_page(self) -> LATimesResultsParser:
+        """
+        Returns the parsed current results page, requesting it if it 
+        was not requested yet.
+
+        Returns:
+            LATimesResultsParser: The parsed results page.
+        """
+        if self.__page is None:
+            self.__page = self.__fetch_page(self.__page_number)
+        return self.__page
+
+    def __fetch_page(self, page_number: int) -> LATimesResultsParser:
+        """
+        Requests and parses the given results page.
+
+        If the request fails, it logs a critical error and raises the 
+        error of the request. Pages are requested from worker threads 
+        too, where exiting the program would only end the thread, so 
+        the error is left to the caller.
+
+        Args:
+            page_number (int): The number of the results page.
+
+        Raises:
+            RuntimeError: If no search was made.
+            requests.RequestException: If the request failed.
+
+        Returns:
+            LATimesResultsParser: The parsed results page.
+        """
+        if self.__phrase is None:
+            raise RuntimeError('A search must be made before reading '
+                               'results.')
+        page_url: str = SearchUtil.build_search_url(
+            self.url, self.__phrase, self.__newest, self.__topic_filter,
+            page_number)
+        try:
+            response = self.__get_session().get(page_url,
+                                                timeout=self.__timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            critical_message: str = (
+                'An error occurred while requesting results page %d: %s'
+                )
+            logger.critical(critical_message, page_number, e)
+            raise
+        parser = LATimesResultsParser(response.url)
+        parser.feed(response.text)
+        parser.close()
+        return parser
+
+    def __get_session(self) -> requests.Session:
+        """
+        Returns the pooled HTTP session of the current thread, creating 
+        it if needed.
+
+        Returns:
+            requests.Session: The HTTP session of the current thread.
+        """
+        session: Optional[requests.Session] = getattr(self.__local,
+                                                      'session', None)
+        if session is not None:
+            return session
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5,
+                        status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=self.__pool_size,
+                              pool_maxsize=self.__pool_size,
+                              max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['User-Agent'] = self.user_agent
+        self.__local.session = session
+        with self.__sessions_lock:
+            self.__sessions[threading.current_thread()] = session
+        return session
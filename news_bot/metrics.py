@@ -0,0 +1,258 @@
+"""
+This module provides the instrumentation of the news bot.
+
+Classes:
+    Metrics: A singleton that records the wall time of every phase of a
+             run and counts of what was processed, and exports them.
+
+Dependencies:
+    - json
+    - logging
+    - os
+    - threading
+    - time
+    - contextlib
+    - datetime
+    - typing
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class Metrics:
+    """
+    Singleton class recording the metrics of a news bot run.
+
+    Metrics are of two kinds:
+      - Spans: the wall time of a phase or step (e.g. 'search', 'page'
+        or 'image_download'). The spans of a name and labels are
+        aggregated into their count, total, minimum and maximum
+        duration.
+      - Counters: counts of what was processed (e.g. 'image_bytes').
+
+    Metrics can be recorded from several threads at the same time. They
+    are exported as JSON and in the Prometheus textfile format, so the
+    runs can be compared and collected by a node exporter.
+
+    Attributes:
+        __lock (threading.Lock): Serializes the access to the metrics.
+        __started_at (datetime): When the metrics started to be
+                                 recorded.
+        __spans (dict): The aggregated spans, keyed by name and labels.
+        __counters (dict): The counters, keyed by name and labels.
+    """
+
+    _instance = None
+    PROMETHEUS_PREFIX: str = 'news_bot'
+
+    def __new__(cls, *args, **kwargs):
+        """
+        Creates a new instance of Metrics if one does not already
+        exist.
+
+        Returns:
+            Metrics: The singleton instance of Metrics.
+        """
+        if cls._instance is None:
+            cls._instance = super(Metrics, cls).__new__(cls, *args, **kwargs)
+            cls._instance.__lock = threading.Lock()
+            cls._instance.reset()
+        return cls._instance
+
+    def reset(self) -> None:
+        """
+        Discards every recorded metric, e.g. before a new run.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__started_at: datetime = datetime.now()
+            self.__spans: dict[tuple, dict] = {}
+            self.__counters: dict[tuple, float] = {}
+
+    @contextmanager
+    def span(self, name: str, **labels: str) -> Iterator[None]:
+        """
+        Records the wall time of the enclosed block as a span.
+
+        The span is recorded even if the block raises an error.
+
+        Args:
+            name (str): The name of the span.
+            **labels (str): The labels of the span (e.g. page='2').
+
+        Yields:
+            None
+        """
+        started_at: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started_at, **labels)
+
+    def record(self, name: str, seconds: float, **labels: str) -> None:
+        """
+        Records a span whose duration was already measured.
+
+        Args:
+            name (str): The name of the span.
+            seconds (float): The duration of the span.
+            **labels (str): The labels of the span.
+
+        Returns:
+            None
+        """
+        key: tuple = (name, tuple(sorted(labels.items())))
+        with self.__lock:
+            span: dict = self.__spans.get(key)
+            if span is None:
+                self.__spans[key] = {'count': 1, 'total_seconds': seconds,
+                                     'min_seconds': seconds,
+                                     'max_seconds': seconds}
+                return
+            span['count'] += 1
+            span['total_seconds'] += seconds
+            span['min_seconds'] = min(span['min_seconds'], seconds)
+            span['max_seconds'] = max(span['max_seconds'], seconds)
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name (str): The name of the counter.
+            value (float): The amount to increment the counter by.
+                           Defaults to 1.
+            **labels (str): The labels of the counter.
+
+        Returns:
+            None
+        """
+        key: tuple = (name, tuple(sorted(labels.items())))
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def snapshot(self) -> dict:
+        """
+        Returns the recorded metrics.
+
+        Returns:
+            dict: The start time of the recording and the lists of
+                  spans and counters, each with its name and labels.
+        """
+        with self.__lock:
+            return {
+                'started_at': self.__started_at.isoformat(),
+                'spans': [
+                    {'name': name, 'labels': dict(labels), **span}
+                    for (name, labels), span in self.__spans.items()
+                    ],
+                'counters': [
+                    {'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in self.__counters.items()
+                    ],
+            }
+
+    def export(self, output_dir: str) -> None:
+        """
+        Writes the recorded metrics to 'metrics.json' and, in the
+        Prometheus textfile format, to 'metrics.prom' in the given
+        directory.
+
+        If the files cannot be written, it logs an error: the metrics
+        never make a run fail.
+
+        Args:
+            output_dir (str): The directory where the metrics will be
+                              written.
+
+        Returns:
+            None
+        """
+        snapshot: dict = self.snapshot()
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            with open(os.path.join(output_dir, 'metrics.json'), 'w',
+                      encoding='utf-8') as json_file:
+                json.dump(snapshot, json_file, indent=2)
+            with open(os.path.join(output_dir, 'metrics.prom'), 'w',
+                      encoding='utf-8') as prometheus_file:
+                prometheus_file.write(self.__to_prometheus(snapshot))
+        except OSError as e:
+            logger.error('Could not export metrics to %s: %s', output_dir, e)
+            return
+        logger.info('Exported metrics to %s.', output_dir)
+
+    @classmethod
+    def __to_prometheus(cls, snapshot: dict) -> str:
+        """
+        Formats the metrics in the Prometheus textfile format.
+
+        Every span becomes the '<prefix>_span_seconds_total',
+        '<prefix>_span_count_total' and '<prefix>_span_seconds_max'
+        samples labelled with its name, and every counter becomes a
+        '<prefix>_<name>_total' sample.
+
+        Args:
+            snapshot (dict): The recorded metrics.
+
+        Returns:
+            str: The metrics in the Prometheus textfile format.
+        """
+        lines: list[str] = []
+        span_metrics: tuple[tuple[str, str, str], ...] = (
+            ('span_seconds_total', 'counter', 'total_seconds'),
+            ('span_count_total', 'counter', 'count'),
+            ('span_seconds_max', 'gauge', 'max_seconds'),
+        )
+        for metric, metric_type, field in span_metrics:
+            if not snapshot['spans']:
+                break
+            metric_name: str = f'{cls.PROMETHEUS_PREFIX}_{metric}'
+            lines.append(f'# TYPE {metric_name} {metric_type}')
+            for span in snapshot['spans']:
+                labels: dict = {'span': span['name'], **span['labels']}
+                lines.append(f'{metric_name}{cls.__format_labels(labels)} '
+                             f'{span[field]}')
+        counters_by_name: dict[str, list[dict]] = {}
+        for counter in snapshot['counters']:
+            counters_by_name.setdefault(counter['name'], []).append(counter)
+        for name, counters in counters_by_name.items():
+            metric_name = f'{cls.PROMETHEUS_PREFIX}_{name}_total'
+            lines.append(f'# TYPE {metric_name} counter')
+            for counter in counters:
+                lines.append(f'{metric_name}'
+                             f'{cls.__format_labels(counter["labels"])} '
+                             f'{counter["value"]}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def __format_labels(labels: dict) -> str:
+        """
+        Formats labels as a Prometheus label set.
+
+        Args:
+            labels (dict): The labels.
+
+        Returns:
+            str: The label set (e.g. '{span="page",page="2"}'), or an
+                 empty string if there are no labels.
+        """
+        if not labels:
+            return ''
+        escaped_labels: list[str] = [
+            '{}="{}"'.format(name, str(value).replace('\\', '\\\\')
+                             .replace('"', '\\"').replace('\n', '\\n'))
+            for name, value in labels.items()
+            ]
+        return '{' + ','.join(escaped_labels) + '}'
@@ -0,0 +1,151 @@
+"""
+This module provides the records of the news bot.
+
+Classes:
+    Article: A scraped article, with typed fields, which is converted
+             to a row only by the output writers.
+
+Dependencies:
+    - datetime
+    - typing
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+class Article:
+    """
+    Record of an article scraped from a search results page.
+
+    Articles are created for every result of every page and most of
+    them only live until their date is compared with the date range,
+    so the record is slotted (no per-instance dictionary) and keeps its
+    fields in their native types: the date is a datetime, whether the
+    text contains money is derived from the mentions of money, which
+    are (amount, form) pairs. The fields are only formatted when the
+    article is written, by to_row (e.g. for the Excel file) or to_dict
+    (e.g. for the local databases).
+
+    Attributes:
+        title (str): The title of the article, or a placeholder if it
+                     was not found.
+        description (str): The description of the article, or a
+                           placeholder if it was not found.
+        date (Optional[datetime]): The date of the article, or None if
+                                   it could not be converted.
+        date_placeholder (Optional[str]): The placeholder written
+                                          instead of the date when it
+                                          could not be converted (e.g.
+                                          'Date not found').
+        image_src (str): The image source URL of the article, or a
+                         placeholder if it was not found.
+        image_file_name (str): The file name of the image of the
+                               article, or a placeholder if it was not
+                               found.
+        money_mentions (tuple[Tuple[float, str], ...]): The amount and
+            the form of every mention of money in the text of the
+            article.
+        search_phrase_count (int): How many times the search phrase
+                                   appears in the text of the article.
+    """
+
+    __slots__ = ('title', 'description', 'date', 'date_placeholder',
+                 'image_src', 'image_file_name', 'money_mentions',
+                 'search_phrase_count')
+
+    DATE_FORMAT: str = '%m/%d/%Y'
+    # The columns of the rows of the output files, in order
+    COLUMNS: tuple[str, ...] = ('title', 'description', 'date',
+                                'image_file_name', 'text_contains_money',
+                                'money_amounts', 'money_forms',
+                                'search_phrase_count')
+
+    def __init__(self, title: str, description: str,
+                 date: Optional[datetime], image_src: str,
+                 image_file_name: str,
+                 money_mentions: tuple[Tuple[float, str], ...],
+                 search_phrase_count: int,
+                 date_placeholder: Optional[str] = None) -> None:
+        self.title = title
+        self.description = description
+        self.date = date
+        self.date_placeholder = date_placeholder
+        self.image_src = image_src
+        self.image_file_name = image_file_name
+        self.money_mentions = money_mentions
+        self.search_phrase_count = search_phrase_count
+
+    @property
+    def text_contains_money(self) -> bool:
+        """
+        Whether the text of the article mentions money.
+
+        Returns:
+            bool: True if the text has a mention of money, False
+                  otherwise.
+        """
+        return bool(self.money_mentions)
+
+    def to_row(self) -> dict:
+        """
+        Converts the article to a row of the output files, with the
+        COLUMNS as keys. The date is written in the 'mm/dd/yyyy' format
+        (or as its placeholder), and the amounts and the forms of the
+        mentions of money are each separated by '; '.
+
+        Returns:
+            dict: The row of the article.
+        """
+        date: Optional[str] = self.date_placeholder
+        if self.date is not None:
+            date = self.date.strftime(self.DATE_FORMAT)
+        return {
+            'title': self.title,
+            'description': self.description,
+            'date': date,
+            'image_file_name': self.image_file_name,
+            'text_contains_money': self.text_contains_money,
+            'money_amounts': '; '.join(f'{amount:.2f}'
+                                       for amount, _ in self.money_mentions),
+            'money_forms': '; '.join(form for _, form in self.money_mentions),
+            'search_phrase_count': self.search_phrase_count
+        }
+
+    def to_dict(self) -> dict:
+        """
+        Converts the article to a JSON serializable dictionary: its row
+        and its image source.
+
+        Returns:
+            dict: The dictionary of the article.
+        """
+        return dict(self.to_row(), image_src=self.image_src)
+
+    @classmethod
+    def from_dict(cls, article: dict) -> 'Article':
+        """
+        Converts a dictionary made by to_dict back to an article.
+
+        Args:
+            article (dict): The dictionary of the article.
+
+        Returns:
+            Article: The article.
+        """
+        date: Optional[datetime] = None
+        date_placeholder: Optional[str] = None
+        try:
+            date = datetime.strptime(article['date'], cls.DATE_FORMAT)
+        except (TypeError, ValueError):
+            date_placeholder = article['date']
+        money_mentions: tuple[Tuple[float, str], ...] = ()
+        if article['money_amounts']:
+            money_mentions = tuple(zip(
+                (float(amount)
+                 for amount in article['money_amounts'].split('; ')),
+                article['money_forms'].split('; ')))
+        return cls(article['title'], article['description'], date,
+                   article['image_src'], article['image_file_name'],
+                   money_mentions, article['search_phrase_count'],
+                   date_placeholder)
@@ -12,25 +12,47 @@ articles, Excel to save the results, ImageUtil to download images and
 DateUtil for date conversions.
 
 Dependencies:
+- contextlib
 - datetime
 - logging
+- threading
+- news_bot.handlers.BrowserProfile
 - news_bot.handlers.Excel
 - news_bot.handlers.LATimesBrowser
 - news_bot.handlers.Scraper
+- news_bot.handlers.StreamingExcel
+- news_bot.http_handlers.LATimesHTTPBrowser
+- news_bot.metrics.Metrics
+- news_bot.models.Article
+- news_bot.pipeline.PipelineStage
+- news_bot.storage.ArticleStore
+- news_bot.storage.ImageCache
+- news_bot.storage.ScrapeJournal
+- news_bot.storage.TopicFilterCache
 - news_bot.utils.DateUtil
 - news_bot.utils.ImageUtil
 
 Usage:
     Instantiate the LATimesNewsBot with the directory paths for Excel 
-    and images, then call the get_articles method with the search 
-    phrase, start date, end date, and topic.
+    and images (and optionally the scraping backend), then call the run 
+    method with the search phrase, start date, end date, and topic.
 """
 
+from contextlib import ExitStack
 from datetime import datetime
 import logging
+import threading
+from typing import Optional
 
-from news_bot.handlers import Excel, LATimesBrowser, Scraper
-from news_bot.utils import ImageUtil
+from news_bot.handlers import (BrowserProfile, Excel, LATimesBrowser,
+                               Scraper, StreamingExcel)
+from news_bot.http_handlers import LATimesHTTPBrowser
+from news_bot.metrics import Metrics
+from news_bot.models import Article
+from news_bot.pipeline import PipelineStage
+from news_bot.storage import (ArticleStore, ImageCache, ScrapeJournal,
+                              TopicFilterCache)
+from news_bot.utils import DateUtil, ImageUtil
 
 logger = logging.getLogger(__name__)
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -51,11 +73,121 @@ class LATimesNewsBot:
         __excel_dir (str): Directory to save the Excel file with 
                            scraped articles.
         __images_dir (str): Directory to save the downloaded images.
+        __backend (str): The scraping backend, either 'selenium' (a 
+                         real browser) or 'http' (plain HTTP requests 
+                         to the search results pages).
+        __workers (int): The number of results pages fetched at the 
+                         same time. Only the 'http' backend fetches 
+                         pages concurrently.
+        __store_path (Optional[str]): Path of the SQLite database of 
+                                      already harvested articles. When 
+                                      set, scraping stops at the first 
+                                      article harvested by a previous 
+                                      run and only the images of new 
+                                      articles are downloaded.
+        __only_new (bool): When a store is used, whether to save only 
+                           the new articles to the Excel file instead of 
+                           every harvested article within the date 
+                           range.
+        __image_cache_dir (Optional[str]): Directory of the persistent 
+                                           cache of downloaded images. 
+                                           When set, images downloaded 
+                                           by previous runs are only 
+                                           revalidated instead of being 
+                                           downloaded again.
+        __image_max_width (Optional[int]): The maximum width, in pixels, 
+                                           of the downloaded images. 
+                                           When set, a smaller rendition 
+                                           of each image is requested 
+                                           from the image resizing proxy.
+        __image_quality (Optional[int]): The quality (1 to 100) of the 
+                                         requested image renditions.
+        __metrics_dir (Optional[str]): Directory where the metrics of 
+                                       each run (the wall time of every 
+                                       phase and step, and counts) are 
+                                       exported, as 'metrics.json' and 
+                                       'metrics.prom'.
+        __journal_path (Optional[str]): Path of the SQLite journal of 
+                                        the scrapes in progress. When 
+                                        set, the scraped articles and 
+                                        the results page reached are 
+                                        journaled after each page, so 
+                                        an interrupted run resumes 
+                                        where it stopped when it is 
+                                        run again, and images already 
+                                        on disk are not downloaded 
+                                        again.
+        __browser (Optional[LATimesBrowser | LATimesHTTPBrowser]): An 
+            open browser reused by the runs (e.g. by the daemon or a 
+            session batch), which is deep linked to the results, or 
+            reset before the search form, instead of being launched, 
+            and is left open after each run. When not set, each run 
+            launches and closes its own browser.
+        __deep_link (bool): Whether to load the results page sorted by 
+                            newest and filtered by topic directly from 
+                            its URL, falling back to the search form, 
+                            sort dropdown and topic list only if that 
+                            fails.
+        __topic_filters (TopicFilterCache): The cache of the filter of 
+                                            each topic used to build 
+                                            the URL of the results 
+                                            page.
+        __browser_profile (Optional[BrowserProfile]): The lean profile 
+                                                      of the Selenium 
+                                                      browser, or None 
+                                                      to open it with 
+                                                      the defaults.
+        __prefetch_pages (bool): Whether the Selenium browser loads the 
+                                 next results page in a second tab 
+                                 while the current one is read.
+        __streaming_excel (bool): Whether the Excel file is written row 
+                                  by row, in constant memory, by 
+                                  StreamingExcel instead of Excel.
+        __stop_event (Optional[threading.Event]): Stops the scrape once 
+                                                  set (see Scraper).
+        __user_agent (str): The User-Agent header of the requests of 
+                            the 'http' backend.
     """
 
-    def __init__(self, excel_dir: str, images_dir: str) -> None:
+    BACKENDS: tuple[str, ...] = ('selenium', 'http')
+
+    def __init__(self, excel_dir: str, images_dir: str,
+                 backend: str = 'selenium', workers: int = 1,
+                 store_path: Optional[str] = None,
+                 only_new: bool = False,
+                 image_cache_dir: Optional[str] = None,
+                 image_max_width: Optional[int] = None,
+                 image_quality: Optional[int] = None,
+                 metrics_dir: Optional[str] = None,
+                 journal_path: Optional[str] = None,
+                 browser=None, deep_link: bool = True,
+                 topic_filters_path: Optional[str] = None,
+                 browser_profile: Optional[BrowserProfile] = None,
+                 prefetch_pages: bool = False,
+                 streaming_excel: bool = False,
+                 stop_event: Optional[threading.Event] = None,
+                 user_agent: str = LATimesHTTPBrowser.USER_AGENT) -> None:
+        if backend not in self.BACKENDS:
+            raise ValueError(f'Unknown scraping backend: {backend}')
         self.__excel_dir = excel_dir
         self.__images_dir = images_dir
+        self.__backend = backend
+        self.__workers = workers
+        self.__store_path = store_path
+        self.__only_new = only_new
+        self.__image_cache_dir = image_cache_dir
+        self.__image_max_width = image_max_width
+        self.__image_quality = image_quality
+        self.__metrics_dir = metrics_dir
+        self.__journal_path = journal_path
+        self.__browser = browser
+        self.__deep_link = deep_link
+        self.__topic_filters = TopicFilterCache(topic_filters_path)
+        self.__browser_profile = browser_profile
+        self.__prefetch_pages = prefetch_pages
+        self.__streaming_excel = streaming_excel
+        self.__stop_event = stop_event
+        self.__user_agent = user_agent
 
     def run(self, phrase: str, start_date: datetime,
                      end_date: datetime, topic: str) -> bool:
@@ -67,7 +199,10 @@ class LATimesNewsBot:
         performs a search using the given phrase, selects the newest 
         articles, and filters them by the specified topic. It then 
         scrapes the articles within the date range, saves them to an 
-        Excel file, and downloads associated images.
+        Excel file, and downloads associated images. The articles are 
+        streamed to the Excel writer and to the image downloader, which 
+        run in their own threads, as each results page is parsed. The 
+        metrics of the run are exported even if it fails.
 
         Args:
             phrase (str): The search phrase to input into the search 
@@ -82,23 +217,222 @@ class LATimesNewsBot:
                   otherwise.
         """
         logger.info('Running news bot...')
-        browser: LATimesBrowser = LATimesBrowser()
-        browser.open_website()
-        browser.search(phrase)
-        browser.select_newest_articles()
-        browser.select_topic(topic)
-        scraper = Scraper()
-        articles: list[dict] = scraper.scrape_articles_in_date_range(
-            start_date, end_date, phrase
-            )
-        browser.close_browser()
-        # Create list with all image sources
-        image_src_list = [article['image_src'] for article in articles]
-        # Remove 'image_src' from all articles
-        for article in articles:
-            del article['image_src']
-        excel: Excel = Excel()
-        excel.save_articles_excel(articles, self.__excel_dir)
-        image_downloader = ImageUtil()
-        image_downloader.download_images(image_src_list, self.__images_dir)
+        # Relative dates (e.g. '3 hours ago') of every article of the
+        # run are converted against the same time
+        DateUtil.set_reference_time(datetime.now())
+        metrics: Metrics = Metrics()
+        metrics.reset()
+        try:
+            with metrics.span('run'):
+                self.__run(phrase, start_date, end_date, topic, metrics)
+        finally:
+            if self.__metrics_dir is not None:
+                metrics.export(self.__metrics_dir)
         logger.info('Finished running news bot.')
+
+    def __run(self, phrase: str, start_date: datetime, end_date: datetime,
+              topic: str, metrics: Metrics) -> None:
+        """
+        Runs the phases of the news bot, recording the wall time of each 
+        of them.
+
+        Args:
+            phrase (str): The search phrase.
+            start_date (datetime): The start date of the date range.
+            end_date (datetime): The end date of the date range.
+            topic (str): The topic to filter articles by.
+            metrics (Metrics): The metrics of the run.
+
+        Returns:
+            None
+        """
+        if self.__browser is None:
+            browser = self.__create_browser()
+        else:
+            browser = self.__browser
+        try:
+            self.__open_results(browser, phrase, topic, metrics)
+        # The news bot exits when the website cannot be scraped
+        except (Exception, SystemExit):
+            # Once the results are open, the browser launched by the run
+            # is closed with the other resources of the run
+            if self.__browser is None:
+                browser.close_browser()
+            raise
+        store: Optional[ArticleStore] = None
+        if self.__store_path is not None:
+            store = ArticleStore(self.__store_path)
+        journal: Optional[ScrapeJournal] = None
+        if self.__journal_path is not None:
+            journal = ScrapeJournal(self.__journal_path)
+        scraper = Scraper(browser, self.__workers, store, journal,
+                          self.__stop_event)
+        # Images are downloaded and articles are written while the next
+        # pages are still being scraped
+        excel: Excel | StreamingExcel = Excel()
+        if self.__streaming_excel:
+            excel = StreamingExcel()
+        excel_stage = PipelineStage(
+            'excel-writer',
+            lambda articles: excel.save_articles_excel(articles,
+                                                       self.__excel_dir)
+            )
+        image_cache: Optional[ImageCache] = None
+        if self.__image_cache_dir is not None:
+            image_cache = ImageCache(self.__image_cache_dir)
+        image_downloader = ImageUtil(cache=image_cache,
+                                     max_width=self.__image_max_width,
+                                     quality=self.__image_quality,
+                                     skip_existing=journal is not None)
+        image_stage = PipelineStage(
+            'image-downloader',
+            lambda image_src_list: image_downloader.download_images(
+                image_src_list, self.__images_dir)
+            )
+        is_scraped: bool = False
+        try:
+            # With a store, the rows are written once the new articles
+            # are merged with the harvested ones (unless only new rows
+            # are wanted)
+            is_streaming_rows: bool = store is None or self.__only_new
+            new_articles: list[Article] = []
+            with metrics.span('scrape'):
+                for article in scraper.iter_articles_in_date_range(
+                        start_date, end_date, phrase, topic):
+                    metrics.increment('articles_scraped')
+                    image_stage.put(article.image_src)
+                    if is_streaming_rows:
+                        excel_stage.put(article)
+                    if store is not None:
+                        new_articles.append(article)
+            if store is not None:
+                store.add_articles(phrase, topic, new_articles)
+                if not is_streaming_rows:
+                    for article in store.get_articles(phrase, topic,
+                                                      start_date, end_date):
+                        excel_stage.put(article)
+            is_scraped = True
+        finally:
+            scrape_key: Optional[str] = None
+            if is_scraped:
+                scrape_key = ScrapeJournal.scrape_key(phrase, topic,
+                                                      start_date, end_date)
+            try:
+                self.__close_run(excel_stage, image_stage, store,
+                                 image_cache, journal, scrape_key, metrics,
+                                 browser if self.__browser is None else None)
+            except (Exception, SystemExit) as e:
+                if is_scraped:
+                    raise
+                # The error of the scrape is raised instead
+                logger.error('Could not close the run: %r', e)
+
+    def __open_results(self, browser, phrase: str, topic: str,
+                       metrics: Metrics) -> None:
+        """
+        Opens the results of the search, sorted by newest and filtered 
+        by topic, from their deep link or else from the search form.
+
+        Args:
+            browser (LATimesBrowser | LATimesHTTPBrowser): The browser of 
+                                                           the run.
+            phrase (str): The search phrase.
+            topic (str): The topic to filter articles by.
+            metrics (Metrics): The metrics of the run.
+
+        Returns:
+            None
+        """
+        if self.__browser is None:
+            with metrics.span('browser_launch'):
+                browser.open_website()
+        # The deep link replaces the page and the search of the previous
+        # run, so a reused browser is only reset (back to the homepage)
+        # for the search form
+        is_deep_linked: bool = False
+        if self.__deep_link:
+            with metrics.span('deep_link'):
+                is_deep_linked = browser.open_search_results(
+                    phrase, topic, self.__topic_filters)
+        if is_deep_linked:
+            metrics.increment('searches', mode='deep_link')
+        else:
+            metrics.increment('searches', mode='search_form')
+            if self.__browser is not None:
+                with metrics.span('browser_reset'):
+                    browser.reset()
+            with metrics.span('search'):
+                browser.search(phrase)
+            with metrics.span('sort'):
+                browser.select_newest_articles()
+            with metrics.span('topic'):
+                browser.select_topic(topic)
+
+    @staticmethod
+    def __close_run(excel_stage: PipelineStage, image_stage: PipelineStage,
+                    store: Optional[ArticleStore],
+                    image_cache: Optional[ImageCache],
+                    journal: Optional[ScrapeJournal],
+                    scrape_key: Optional[str], metrics: Metrics,
+                    browser=None) -> None:
+        """
+        Waits for the Excel writer and the image downloader and closes 
+        the databases and the browser of a run. Each of them is closed 
+        even if closing the previous ones failed, whose error is raised 
+        once all of them are closed.
+
+        Args:
+            excel_stage (PipelineStage): The Excel writer.
+            image_stage (PipelineStage): The image downloader.
+            store (Optional[ArticleStore]): The article store, if any.
+            image_cache (Optional[ImageCache]): The image cache, if any.
+            journal (Optional[ScrapeJournal]): The scrape journal, if 
+                                               any.
+            scrape_key (Optional[str]): The key of the scrape in the 
+                                        journal if it was completed, or 
+                                        None if it resumes on the next 
+                                        run.
+            metrics (Metrics): The metrics of the run.
+            browser (Optional[LATimesBrowser | LATimesHTTPBrowser]): 
+                The browser of the run if the run launched it, or None 
+                if it is reused by the next runs.
+
+        Returns:
+            None
+        """
+        with ExitStack() as resources:
+            # Closed in reverse order, after the stages
+            if journal is not None:
+                resources.callback(journal.close)
+            if image_cache is not None:
+                resources.callback(image_cache.close)
+            if store is not None:
+                resources.callback(store.close)
+            if browser is not None:
+                resources.callback(browser.close_browser)
+            # Waiting for the stages shows how long the Excel file and
+            # the images took after the scraping was done
+            with metrics.span('wait_for_stages'), ExitStack() as stages:
+                stages.callback(image_stage.close)
+                stages.callback(excel_stage.close)
+            if journal is not None:
+                # The run is complete once the Excel file and the images
+                # are written, so a rerun starts a new scrape
+                if scrape_key is not None:
+                    journal.clear(scrape_key)
+                else:
+                    logger.info('Scrape journaled, it resumes on the next '
+                                'run.')
+
+    def __create_browser(self):
+        """
+        Creates the browser of the selected scraping backend.
+
+        Returns:
+            LATimesBrowser | LATimesHTTPBrowser: The browser used to 
+                                                 search and scrape the 
+                                                 articles.
+        """
+        if self.__backend == 'http':
+            return LATimesHTTPBrowser(user_agent=self.__user_agent)
+        return LATimesBrowser(self.__browser_profile, self.__prefetch_pages)
@@ -0,0 +1,118 @@
+"""
+This module provides the building block of the news bot's streaming
+pipeline.
+
+Classes:
+    PipelineStage: A consumer stage that processes items in its own
+                   thread as they are produced.
+
+Dependencies:
+    - logging
+    - queue
+    - threading
+    - typing
+"""
+
+import logging
+from queue import Queue
+import threading
+from typing import Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineStage:
+    """
+    A consumer stage of the news bot's streaming pipeline.
+
+    The stage runs its consumer in a separate thread and hands it the
+    items put into the stage through a bounded queue, so the producer
+    (e.g. the scraper) and the consumer (e.g. the image downloader)
+    work at the same time while only a bounded number of items is held
+    in memory. If the consumer fails, the remaining items are discarded
+    so the producer is never blocked, and the error is raised again
+    when the stage is closed.
+
+    Attributes:
+        __queue (Queue): The bounded queue of items waiting to be
+                         consumed.
+        __consumer (Callable[[Iterator], None]): The function consuming
+                                                 the items.
+        __error (Optional[BaseException]): The error raised by the
+                                           consumer, if any.
+        __thread (threading.Thread): The thread running the consumer.
+    """
+
+    __END = object()
+
+    def __init__(self, name: str, consumer: Callable[[Iterator], None],
+                 max_queued_items: int = 100) -> None:
+        self.__queue: Queue = Queue(maxsize=max_queued_items)
+        self.__consumer = consumer
+        self.__error: Optional[BaseException] = None
+        self.__thread = threading.Thread(target=self.__run, name=name,
+                                         daemon=True)
+        self.__thread.start()
+
+    def put(self, item) -> None:
+        """
+        Hands an item over to the consumer, waiting while the queue is
+        full.
+
+        Args:
+            item: The item to be consumed.
+
+        Returns:
+            None
+        """
+        self.__queue.put(item)
+
+    def close(self) -> None:
+        """
+        Signals that there are no more items and waits for the consumer
+        to finish.
+
+        Raises:
+            BaseException: The error raised by the consumer, if any.
+
+        Returns:
+            None
+        """
+        self.__queue.put(self.__END)
+        self.__thread.join()
+        if self.__error is not None:
+            raise self.__error
+
+    def __iter_items(self) -> Iterator:
+        """
+        Yields the items put into the stage until it is closed.
+
+        Yields:
+            The items to be consumed, in the order they were put.
+        """
+        while True:
+            item = self.__queue.get()
+            if item is self.__END:
+                return
+            yield item
+
+    def __run(self) -> None:
+        """
+        Runs the consumer over the items of the stage.
+
+        If the consumer fails, the error is stored and the remaining
+        items are discarded until the stage is closed.
+
+        Returns:
+            None
+        """
+        items: Iterator = self.__iter_items()
+        try:
+            self.__consumer(items)
+        except BaseException as e:
+            logger.error('Pipeline stage %s failed: %s',
+                         self.__thread.name, e)
+            self.__error = e
+        # Drain the items the consumer did not take
+        for _ in items:
+            pass
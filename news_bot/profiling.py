@@ -0,0 +1,218 @@
+"""
+This module provides an opt-in profiler for news bot runs.
+
+Classes:
+    Profiler: Profiles the enclosed code with a deterministic CPU
+              profiler or a sampling wall-clock profiler and writes the
+              profile and a summary of the top functions.
+
+Dependencies:
+    - cProfile
+    - io
+    - logging
+    - os
+    - pstats
+    - sys
+    - threading
+    - time
+    - collections
+    - typing
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Profiler:
+    """
+    Context manager that profiles a news bot run.
+
+    Two modes are available:
+      - 'cpu': a deterministic profile (cProfile) of the thread that
+        enters the profiler, which is the one scraping the pages. It
+        writes 'profile.pstats', which can be opened with pstats or
+        snakeviz, and 'profile_summary.txt' with the top functions by
+        cumulative time.
+      - 'wall': a sampling profile of every thread (including the image
+        downloader and Excel writer), taken at a fixed interval from a
+        separate thread, so time spent waiting (e.g. on the network) is
+        included. It writes 'profile.collapsed', in the collapsed stack
+        format read by flame graph tools, and 'profile_summary.txt' with
+        the top functions by samples.
+
+    Usage:
+        with Profiler('wall', 'output'):
+            news_bot.run(...)
+
+    Attributes:
+        __mode (str): The profiling mode.
+        __output_dir (str): The directory where the profile is written.
+        __top (int): The number of functions in the summary.
+        __interval (float): The sampling interval of the 'wall' mode,
+                            in seconds.
+        __profile (Optional[cProfile.Profile]): The profile of the 'cpu'
+                                                mode.
+        __stacks (Counter): The number of samples of each collapsed
+                            stack of the 'wall' mode.
+        __stop_sampling (threading.Event): Stops the sampling thread.
+        __sampler (Optional[threading.Thread]): The sampling thread.
+        __started_at (float): When the profiling started.
+    """
+
+    MODES: tuple[str, ...] = ('cpu', 'wall')
+
+    def __init__(self, mode: str, output_dir: str, top: int = 30,
+                 interval: float = 0.005) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f'Unknown profiling mode: {mode}')
+        self.__mode = mode
+        self.__output_dir = output_dir
+        self.__top = top
+        self.__interval = interval
+        self.__profile: Optional[cProfile.Profile] = None
+        self.__stacks: Counter = Counter()
+        self.__stop_sampling = threading.Event()
+        self.__sampler: Optional[threading.Thread] = None
+        self.__started_at: float = 0.0
+
+    def __enter__(self) -> 'Profiler':
+        logger.info('Profiling run (%s)...', self.__mode)
+        self.__started_at = time.perf_counter()
+        if self.__mode == 'cpu':
+            self.__profile = cProfile.Profile()
+            self.__profile.enable()
+        else:
+            self.__sampler = threading.Thread(target=self.__sample,
+                                              name='profiler', daemon=True)
+            self.__sampler.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        duration: float = time.perf_counter() - self.__started_at
+        if self.__mode == 'cpu':
+            self.__profile.disable()
+        else:
+            self.__stop_sampling.set()
+            self.__sampler.join()
+        try:
+            os.makedirs(self.__output_dir, exist_ok=True)
+            if self.__mode == 'cpu':
+                self.__write_cpu_profile(duration)
+            else:
+                self.__write_wall_profile(duration)
+        except OSError as e:
+            logger.error('Could not write profile to %s: %s',
+                         self.__output_dir, e)
+            return
+        logger.info('Wrote profile to %s.', self.__output_dir)
+
+    def __sample(self) -> None:
+        """
+        Samples the stack of every other thread at the configured
+        interval until the profiling stops.
+
+        Returns:
+            None
+        """
+        sampler_id: int = threading.get_ident()
+        while not self.__stop_sampling.wait(self.__interval):
+            thread_names: dict[int, str] = {
+                thread.ident: thread.name for thread in threading.enumerate()
+                }
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_id:
+                    continue
+                stack: list[str] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(
+                        f'{code.co_name} ({os.path.basename(code.co_filename)}'
+                        f':{code.co_firstlineno})'
+                        )
+                    frame = frame.f_back
+                stack.append(thread_names.get(thread_id, str(thread_id)))
+                self.__stacks[';'.join(reversed(stack))] += 1
+
+    def __write_cpu_profile(self, duration: float) -> None:
+        """
+        Writes the CPU profile and the summary of its top functions by
+        cumulative time.
+
+        Args:
+            duration (float): The wall time of the profiled run.
+
+        Returns:
+            None
+        """
+        self.__profile.dump_stats(os.path.join(self.__output_dir,
+                                               'profile.pstats'))
+        summary = io.StringIO()
+        summary.write(f'CPU profile of the main thread, run took '
+                      f'{duration:.2f}s\n\n')
+        stats = pstats.Stats(self.__profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.__top)
+        self.__write_summary(summary.getvalue())
+
+    def __write_wall_profile(self, duration: float) -> None:
+        """
+        Writes the collapsed stacks of the wall-clock profile and the
+        summary of its top functions by samples.
+
+        A function is counted once per sample in which it is on the
+        stack ('total') and once per sample in which it is the running
+        function ('self').
+
+        Args:
+            duration (float): The wall time of the profiled run.
+
+        Returns:
+            None
+        """
+        with open(os.path.join(self.__output_dir, 'profile.collapsed'), 'w',
+                  encoding='utf-8') as collapsed_file:
+            for stack, samples in self.__stacks.most_common():
+                collapsed_file.write(f'{stack} {samples}\n')
+        total_samples: Counter = Counter()
+        self_samples: Counter = Counter()
+        for stack, samples in self.__stacks.items():
+            # The first frame is the name of the thread
+            functions: list[str] = stack.split(';')[1:]
+            for function in set(functions):
+                total_samples[function] += samples
+            if functions:
+                self_samples[functions[-1]] += samples
+        sample_count: int = sum(self.__stacks.values())
+        lines: list[str] = [
+            f'Wall-clock profile of every thread, run took {duration:.2f}s, '
+            f'{sample_count} samples every {self.__interval * 1000:.0f}ms',
+            '',
+            f'{"total":>8} {"self":>8}  function',
+        ]
+        for function, samples in total_samples.most_common(self.__top):
+            lines.append(f'{samples:>8} {self_samples[function]:>8}  '
+                         f'{function}')
+        self.__write_summary('\n'.join(lines) + '\n')
+
+    def __write_summary(self, summary: str) -> None:
+        """
+        Writes the summary of the profile.
+
+        Args:
+            summary (str): The summary of the profile.
+
+        Returns:
+            None
+        """
+        with open(os.path.join(self.__output_dir, 'profile_summary.txt'),
+                  'w', encoding='utf-8') as summary_file:
+            summary_file.write(summary)
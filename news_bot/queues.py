@@ -0,0 +1,432 @@
+"""
+This module provides the queues of search queries shared by several
+news bot workers, on one or several hosts.
+
+Classes:
+    JobQueue: The interface of a queue of search queries (jobs) that
+              workers claim with a lease, keep alive with heartbeats and
+              acknowledge once processed.
+    SQLiteJobQueue: A JobQueue stored in a SQLite database, which can
+                    be shared by the workers of several hosts through a
+                    shared file system.
+    LeaseKeeper: Sends the heartbeats of a claimed job from a
+                 background thread while the job is processed, and
+                 signals the worker when the lease is lost.
+
+Dependencies:
+    - sqlite3
+    - json
+    - logging
+    - os
+    - threading
+    - time
+    - abc
+    - typing
+"""
+
+import sqlite3
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue(ABC):
+    """
+    Interface of a queue of search queries shared by several workers.
+
+    A job is the query of a run of the news bot (the variables of an
+    input work item). A worker claims a job, which leases it to the
+    worker for a limited time; while the job is processed, the worker
+    renews the lease with heartbeats. A job whose lease expires (e.g.
+    because its worker crashed) can be claimed again by another worker.
+    A job that fails, or whose lease expires, is retried until it was
+    attempted `max_attempts` times.
+
+    Jobs are returned as dicts with their 'id', their 'query' and the
+    number of the current attempt ('attempts').
+    """
+
+    @abstractmethod
+    def put(self, query: dict) -> int:
+        """
+        Adds a job to the queue.
+
+        Args:
+            query (dict): The query of the job.
+
+        Returns:
+            int: The id of the job.
+        """
+
+    @abstractmethod
+    def claim(self, worker_id: str) -> Optional[dict]:
+        """
+        Leases the oldest available job to a worker.
+
+        Args:
+            worker_id (str): The id of the worker.
+
+        Returns:
+            Optional[dict]: The claimed job, or None if no job is
+                            available.
+        """
+
+    @abstractmethod
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """
+        Renews the lease of a job.
+
+        Args:
+            job_id (int): The id of the job.
+            worker_id (str): The id of the worker processing the job.
+
+        Returns:
+            bool: True if the lease was renewed, False if the worker no
+                  longer holds it (e.g. it expired and another worker
+                  claimed the job).
+        """
+
+    @abstractmethod
+    def complete(self, job_id: int, worker_id: str, result: dict) -> bool:
+        """
+        Acknowledges a processed job.
+
+        Args:
+            job_id (int): The id of the job.
+            worker_id (str): The id of the worker processing the job.
+            result (dict): The result of the job.
+
+        Returns:
+            bool: True if the job was acknowledged, False if the worker
+                  no longer holds its lease.
+        """
+
+    @abstractmethod
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """
+        Reports a failed attempt of a job, which is retried later unless
+        it was attempted `max_attempts` times.
+
+        Args:
+            job_id (int): The id of the job.
+            worker_id (str): The id of the worker processing the job.
+            error (str): The error of the attempt.
+
+        Returns:
+            bool: True if the failure was recorded, False if the worker
+                  no longer holds the lease of the job.
+        """
+
+    @abstractmethod
+    def is_drained(self) -> bool:
+        """
+        Checks whether every job of the queue is done or failed.
+
+        Returns:
+            bool: True if no job is pending or leased, False otherwise.
+        """
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """
+        Counts the jobs of the queue by status.
+
+        Returns:
+            dict[str, int]: The number of 'pending', 'leased', 'done'
+                            and 'failed' jobs.
+        """
+
+    def close(self) -> None:
+        """
+        Releases the resources of the queue.
+
+        Returns:
+            None
+        """
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    JobQueue stored in a SQLite database.
+
+    Every change of the queue is made in an immediate transaction, so
+    the SQLite file lock serializes the workers of every process and
+    host using the same database file: a job is never leased to two
+    workers at the same time. The database uses the default rollback
+    journal, which (unlike the write-ahead log) works on shared file
+    systems with working file locks (e.g. NFS with locking enabled).
+    Leases are compared against the wall clock of each host, so the
+    clocks of the hosts must be synchronized (e.g. with NTP).
+
+    The jobs only hold the queries; the workers run them, so the time a
+    claim takes is negligible next to a run and the throughput grows
+    with the number of workers.
+
+    Attributes:
+        __connection (sqlite3.Connection): The connection to the SQLite
+                                           database.
+        __lease_seconds (float): How long a claim or a heartbeat leases
+                                 a job for.
+        __max_attempts (int): How many times a job is attempted before
+                              it is marked as failed.
+        __retry_delay (float): How long a failed job waits before its
+                               second attempt, doubled for each further
+                               attempt.
+    """
+
+    def __init__(self, queue_path: str, lease_seconds: float = 300,
+                 max_attempts: int = 3, retry_delay: float = 30) -> None:
+        directory: str = os.path.dirname(queue_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Transactions are started explicitly, so claims can take the
+        # write lock before reading
+        self.__connection = sqlite3.connect(queue_path, timeout=60,
+                                            isolation_level=None)
+        self.__lease_seconds = lease_seconds
+        self.__max_attempts = max_attempts
+        self.__retry_delay = retry_delay
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'query TEXT NOT NULL, '
+            "status TEXT NOT NULL DEFAULT 'pending', "
+            'attempts INTEGER NOT NULL DEFAULT 0, '
+            'available_at REAL NOT NULL, '
+            'worker_id TEXT, '
+            'lease_expires_at REAL, '
+            'result TEXT, '
+            'error TEXT, '
+            'updated_at REAL NOT NULL)'
+            )
+        self.__connection.execute(
+            'CREATE INDEX IF NOT EXISTS jobs_status '
+            'ON jobs (status, available_at)'
+            )
+
+    def put(self, query: dict) -> int:
+        now: float = time.time()
+        cursor = self.__connection.execute(
+            'INSERT INTO jobs (query, available_at, updated_at) '
+            'VALUES (?, ?, ?)',
+            (json.dumps(query), now, now)
+            )
+        return cursor.lastrowid
+
+    def claim(self, worker_id: str) -> Optional[dict]:
+        self.__connection.execute('BEGIN IMMEDIATE')
+        try:
+            now: float = time.time()
+            self.__expire_leases(now)
+            row: Optional[tuple] = self.__connection.execute(
+                "SELECT id, query, attempts FROM jobs "
+                "WHERE status = 'pending' AND available_at <= ? "
+                'ORDER BY available_at, id LIMIT 1',
+                (now,)
+                ).fetchone()
+            if row is None:
+                self.__connection.execute('COMMIT')
+                return None
+            job_id, query, attempts = row
+            self.__connection.execute(
+                "UPDATE jobs SET status = 'leased', attempts = ?, "
+                'worker_id = ?, lease_expires_at = ?, updated_at = ? '
+                'WHERE id = ?',
+                (attempts + 1, worker_id, now + self.__lease_seconds, now,
+                 job_id)
+                )
+            self.__connection.execute('COMMIT')
+        except BaseException:
+            self.__connection.execute('ROLLBACK')
+            raise
+        return {'id': job_id, 'query': json.loads(query),
+                'attempts': attempts + 1}
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        now: float = time.time()
+        cursor = self.__connection.execute(
+            'UPDATE jobs SET lease_expires_at = ?, updated_at = ? '
+            "WHERE id = ? AND worker_id = ? AND status = 'leased' "
+            'AND lease_expires_at >= ?',
+            (now + self.__lease_seconds, now, job_id, worker_id, now)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, result: dict) -> bool:
+        now: float = time.time()
+        cursor = self.__connection.execute(
+            "UPDATE jobs SET status = 'done', result = ?, error = NULL, "
+            'lease_expires_at = NULL, updated_at = ? '
+            "WHERE id = ? AND worker_id = ? AND status = 'leased'",
+            (json.dumps(result), now, job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        now: float = time.time()
+        # Retried with an exponential backoff until the last attempt
+        cursor = self.__connection.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? "
+            "THEN 'failed' ELSE 'pending' END, "
+            'available_at = ? + ? * (1 << (attempts - 1)), error = ?, '
+            'lease_expires_at = NULL, updated_at = ? '
+            "WHERE id = ? AND worker_id = ? AND status = 'leased'",
+            (self.__max_attempts, now, self.__retry_delay, error, now,
+             job_id, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def is_drained(self) -> bool:
+        row: tuple = self.__connection.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status IN ('pending', 'leased')"
+            ).fetchone()
+        return row[0] == 0
+
+    def counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {'pending': 0, 'leased': 0, 'done': 0,
+                                  'failed': 0}
+        for status, count in self.__connection.execute(
+                'SELECT status, COUNT(*) FROM jobs GROUP BY status'):
+            counts[status] = count
+        return counts
+
+    def get_job(self, job_id: int) -> Optional[dict]:
+        """
+        Retrieves a job with its state.
+
+        Args:
+            job_id (int): The id of the job.
+
+        Returns:
+            Optional[dict]: The 'id', 'query', 'status', 'attempts',
+                            'worker_id', 'result' and 'error' of the
+                            job, or None if it does not exist.
+        """
+        row: Optional[tuple] = self.__connection.execute(
+            'SELECT id, query, status, attempts, worker_id, result, error '
+            'FROM jobs WHERE id = ?',
+            (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job_id, query, status, attempts, worker_id, result, error = row
+        return {'id': job_id, 'query': json.loads(query), 'status': status,
+                'attempts': attempts, 'worker_id': worker_id,
+                'result': json.loads(result) if result else None,
+                'error': error}
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def __expire_leases(self, now: float) -> None:
+        """
+        Makes the jobs whose lease expired available again, or marks
+        them as failed if they were attempted `max_attempts` times. It
+        must be called inside a transaction.
+
+        Args:
+            now (float): The current time.
+
+        Returns:
+            None
+        """
+        self.__connection.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? "
+            "THEN 'failed' ELSE 'pending' END, "
+            "error = 'Lease expired', available_at = ?, "
+            'lease_expires_at = NULL, updated_at = ? '
+            "WHERE status = 'leased' AND lease_expires_at < ?",
+            (self.__max_attempts, now, now, now)
+            )
+
+
+class LeaseKeeper:
+    """
+    Context manager that keeps the lease of a claimed job alive.
+
+    It sends a heartbeat for the job from a background thread at a
+    fixed interval (which must be well below the lease time of the
+    queue) until the processing of the job ends. The heartbeats use
+    their own connection to the queue, so the queue of the worker is
+    not shared between threads.
+
+    When a heartbeat finds that the worker no longer holds the lease
+    (e.g. it expired and another worker claimed the job), the `lost`
+    event is set, so the worker can stop processing the job, and its
+    result must be dropped.
+
+    Usage:
+        with LeaseKeeper(lambda: SQLiteJobQueue(path), job_id, worker_id,
+                         interval=60) as lease:
+            process(job, stop_event=lease.lost)
+        if lease.is_lost:
+            ...
+
+    Attributes:
+        lost (threading.Event): Set when a heartbeat failed because the
+                                worker no longer holds the lease.
+    """
+
+    def __init__(self, open_queue, job_id: int, worker_id: str,
+                 interval: float) -> None:
+        self.lost = threading.Event()
+        self.__open_queue = open_queue
+        self.__job_id = job_id
+        self.__worker_id = worker_id
+        self.__interval = interval
+        self.__stop = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def is_lost(self) -> bool:
+        """
+        Whether the worker lost the lease of the job.
+
+        Returns:
+            bool: True if a heartbeat failed because the worker no
+                  longer holds the lease, False otherwise.
+        """
+        return self.lost.is_set()
+
+    def __enter__(self) -> 'LeaseKeeper':
+        self.__thread = threading.Thread(target=self.__beat,
+                                         name='lease-keeper', daemon=True)
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.__stop.set()
+        self.__thread.join()
+
+    def __beat(self) -> None:
+        """
+        Sends the heartbeats of the job until the processing ends or
+        the lease is lost.
+
+        Returns:
+            None
+        """
+        queue: JobQueue = self.__open_queue()
+        try:
+            while not self.__stop.wait(self.__interval):
+                try:
+                    is_renewed: bool = queue.heartbeat(self.__job_id,
+                                                       self.__worker_id)
+                except sqlite3.Error as e:
+                    # Retried at the next interval, before the lease ends
+                    logger.warning('Heartbeat of job %d failed: %s',
+                                   self.__job_id, e)
+                    continue
+                if not is_renewed:
+                    logger.error('Lost the lease of job %d, stopping it.',
+                                 self.__job_id)
+                    self.lost.set()
+                    return
+        finally:
+            queue.close()
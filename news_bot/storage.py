@@ -0,0 +1,690 @@
+"""
+This module provides local persistent storage for the news bot.
+
+Classes:
+    ArticleStore: A SQLite-backed store of the articles already
+                  harvested for each search phrase and topic.
+    ScrapeJournal: A SQLite-backed journal of the progress of scrapes,
+                   used to resume interrupted scrapes.
+    TopicFilterCache: A persistent cache of the search filter of each
+                      topic, used to load filtered results directly.
+    ImageCache: A persistent content-addressed cache of downloaded
+                images.
+
+Dependencies:
+    - sqlite3
+    - hashlib
+    - json
+    - logging
+    - os
+    - shutil
+    - threading
+    - uuid
+    - datetime
+    - typing
+    - news_bot.models.Article
+"""
+
+import sqlite3
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple
+
+from news_bot.models import Article
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleStore:
+    """
+    SQLite-backed store of already harvested articles.
+
+    Articles are stored per search phrase and topic (both compared case
+    insensitively) and identified by a hash of their normalized title
+    and date, since the search results do not expose a stable article
+    id. The store lets scheduled runs stop scraping as soon as they
+    reach an article harvested by a previous run. Articles are stored
+    as JSON (see Article.to_dict), with their dates as 'mm/dd/yyyy'
+    strings.
+
+    Attributes:
+        __connection (sqlite3.Connection): The connection to the SQLite
+                                           database.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        directory: str = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(db_path)
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS articles ('
+            'phrase TEXT NOT NULL, '
+            'topic TEXT NOT NULL, '
+            'article_key TEXT NOT NULL, '
+            'article_date TEXT NOT NULL, '
+            'harvested_at TEXT NOT NULL, '
+            'article TEXT NOT NULL, '
+            'PRIMARY KEY (phrase, topic, article_key))'
+            )
+        self.__connection.commit()
+
+    @staticmethod
+    def article_key(article: Article) -> str:
+        """
+        Computes the key that identifies an article.
+
+        The key is a hash of the article title (lowercased and with
+        collapsed whitespace) and date, or the date placeholder of an
+        article without a date (such articles are never stored, but
+        the journal keys the last article of every page).
+
+        Args:
+            article (Article): The article.
+
+        Returns:
+            str: The key of the article.
+        """
+        title: str = ' '.join(article.title.lower().split())
+        date: Optional[str] = article.date_placeholder
+        if article.date is not None:
+            date = article.date.strftime(Article.DATE_FORMAT)
+        return hashlib.sha256(f'{title}|{date}'.encode('utf-8')).hexdigest()
+
+    def get_article_keys(self, phrase: str, topic: str) -> set[str]:
+        """
+        Retrieves the keys of the articles harvested for a search
+        phrase and topic.
+
+        Args:
+            phrase (str): The search phrase.
+            topic (str): The topic.
+
+        Returns:
+            set[str]: The keys of the harvested articles.
+        """
+        cursor = self.__connection.execute(
+            'SELECT article_key FROM articles WHERE phrase = ? AND topic = ?',
+            (phrase.lower(), topic.lower())
+            )
+        return {article_key for (article_key,) in cursor}
+
+    def add_articles(self, phrase: str, topic: str,
+                     articles: list[Article]) -> None:
+        """
+        Adds harvested articles of a search phrase and topic to the
+        store.
+
+        Articles that are already in the store are left unchanged.
+
+        Args:
+            phrase (str): The search phrase.
+            topic (str): The topic.
+            articles (list[Article]): The harvested articles, newest 
+                                      first.
+
+        Returns:
+            None
+        """
+        harvested_at: str = datetime.now().isoformat()
+        rows: list[tuple] = [
+            (phrase.lower(), topic.lower(), self.article_key(article),
+             article.date.strftime('%Y-%m-%d'), harvested_at,
+             self.serialize_article(article))
+            for article in articles
+            ]
+        with self.__connection:
+            self.__connection.executemany(
+                'INSERT OR IGNORE INTO articles (phrase, topic, article_key, '
+                'article_date, harvested_at, article) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+                )
+        logger.info('Stored %d harvested articles.', len(rows))
+
+    def get_articles(self, phrase: str, topic: str, start_date: datetime,
+                     end_date: datetime) -> list[Article]:
+        """
+        Retrieves the articles of a search phrase and topic harvested
+        within a date range.
+
+        The articles are returned newest first, in the same order as
+        the search results they were harvested from.
+
+        Args:
+            phrase (str): The search phrase.
+            topic (str): The topic.
+            start_date (datetime): The start date of the date range.
+            end_date (datetime): The end date of the date range.
+
+        Returns:
+            list[Article]: The harvested articles within the date range.
+        """
+        cursor = self.__connection.execute(
+            'SELECT article FROM articles '
+            'WHERE phrase = ? AND topic = ? '
+            'AND article_date BETWEEN ? AND ? '
+            'ORDER BY article_date DESC, harvested_at DESC, rowid ASC',
+            (phrase.lower(), topic.lower(),
+             start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+            )
+        return [self.deserialize_article(article) for (article,) in cursor]
+
+    @staticmethod
+    def serialize_article(article: Article) -> str:
+        """
+        Converts an article to JSON, with its date in the 'mm/dd/yyyy'
+        format.
+
+        Args:
+            article (Article): The article.
+
+        Returns:
+            str: The JSON of the article.
+        """
+        return json.dumps(article.to_dict())
+
+    @staticmethod
+    def deserialize_article(article_json: str) -> Article:
+        """
+        Converts the JSON of a stored article back to an article.
+
+        Args:
+            article_json (str): The JSON of the stored article.
+
+        Returns:
+            Article: The article.
+        """
+        return Article.from_dict(json.loads(article_json))
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+
+        Returns:
+            None
+        """
+        self.__connection.close()
+
+
+class ScrapeJournal:
+    """
+    SQLite-backed journal of the progress of scrapes.
+
+    After each results page, the scraper records in the journal the 
+    articles it selected from the page and its cursor: the next page to 
+    scrape, the key of the last article seen and whether the scrape is 
+    complete. If a run is interrupted (e.g. by a timeout on a late 
+    results page), a rerun with the same search phrase, topic and date 
+    range replays the journaled articles and resumes scraping from the 
+    cursor instead of starting over. The journal of a scrape is cleared 
+    once its run succeeds.
+
+    Attributes:
+        __connection (sqlite3.Connection): The connection to the SQLite
+                                           database.
+    """
+
+    def __init__(self, journal_path: str) -> None:
+        directory: str = os.path.dirname(journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.__connection = sqlite3.connect(journal_path)
+        with self.__connection:
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS checkpoints ('
+                'scrape_key TEXT PRIMARY KEY, '
+                'next_page INTEGER NOT NULL, '
+                'last_article_key TEXT, '
+                'is_complete INTEGER NOT NULL, '
+                'updated_at TEXT NOT NULL)'
+                )
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS articles ('
+                'scrape_key TEXT NOT NULL, '
+                'position INTEGER NOT NULL, '
+                'article TEXT NOT NULL, '
+                'PRIMARY KEY (scrape_key, position))'
+                )
+
+    @staticmethod
+    def scrape_key(phrase: str, topic: str, start_date: datetime,
+                   end_date: datetime) -> str:
+        """
+        Computes the key that identifies a scrape.
+
+        Args:
+            phrase (str): The search phrase.
+            topic (str): The topic.
+            start_date (datetime): The start date of the date range.
+            end_date (datetime): The end date of the date range.
+
+        Returns:
+            str: The key of the scrape.
+        """
+        return hashlib.sha256(
+            f'{phrase.lower()}|{topic.lower()}|{start_date.isoformat()}|'
+            f'{end_date.isoformat()}'.encode('utf-8')
+            ).hexdigest()
+
+    def get_checkpoint(self, scrape_key: str) -> Optional[dict]:
+        """
+        Retrieves the cursor of an interrupted scrape.
+
+        Args:
+            scrape_key (str): The key of the scrape.
+
+        Returns:
+            Optional[dict]: The next page to scrape ('next_page'), the 
+                            key of the last article seen 
+                            ('last_article_key') and whether the scrape 
+                            is complete ('is_complete'), or None if the 
+                            scrape has no checkpoint.
+        """
+        row: Optional[tuple] = self.__connection.execute(
+            'SELECT next_page, last_article_key, is_complete '
+            'FROM checkpoints WHERE scrape_key = ?',
+            (scrape_key,)
+            ).fetchone()
+        if row is None:
+            return None
+        next_page, last_article_key, is_complete = row
+        return {'next_page': next_page, 'last_article_key': last_article_key,
+                'is_complete': bool(is_complete)}
+
+    def get_articles(self, scrape_key: str) -> list[Article]:
+        """
+        Retrieves the articles journaled for a scrape, in the order they 
+        were scraped.
+
+        Args:
+            scrape_key (str): The key of the scrape.
+
+        Returns:
+            list[Article]: The journaled articles.
+        """
+        cursor = self.__connection.execute(
+            'SELECT article FROM articles WHERE scrape_key = ? '
+            'ORDER BY position',
+            (scrape_key,)
+            )
+        return [ArticleStore.deserialize_article(article)
+                for (article,) in cursor]
+
+    def save_page(self, scrape_key: str, next_page: int,
+                  last_article_key: Optional[str], articles: list[Article],
+                  is_complete: bool) -> None:
+        """
+        Records the articles selected from a results page and the cursor 
+        of the scrape after it, in a single transaction.
+
+        Args:
+            scrape_key (str): The key of the scrape.
+            next_page (int): The next page to scrape.
+            last_article_key (Optional[str]): The key of the last 
+                                              article seen on the page.
+            articles (list[Article]): The articles selected from the 
+                                      page.
+            is_complete (bool): Whether no more pages are needed.
+
+        Returns:
+            None
+        """
+        with self.__connection:
+            (position,) = self.__connection.execute(
+                'SELECT COUNT(*) FROM articles WHERE scrape_key = ?',
+                (scrape_key,)
+                ).fetchone()
+            self.__connection.executemany(
+                'INSERT INTO articles (scrape_key, position, article) '
+                'VALUES (?, ?, ?)',
+                [(scrape_key, position + offset,
+                  ArticleStore.serialize_article(article))
+                 for offset, article in enumerate(articles)]
+                )
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO checkpoints (scrape_key, next_page, '
+                'last_article_key, is_complete, updated_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (scrape_key, next_page, last_article_key, int(is_complete),
+                 datetime.now().isoformat())
+                )
+
+    def complete(self, scrape_key: str) -> None:
+        """
+        Marks a scrape as complete, so a rerun does not scrape any more 
+        pages.
+
+        Args:
+            scrape_key (str): The key of the scrape.
+
+        Returns:
+            None
+        """
+        with self.__connection:
+            self.__connection.execute(
+                'UPDATE checkpoints SET is_complete = 1, updated_at = ? '
+                'WHERE scrape_key = ?',
+                (datetime.now().isoformat(), scrape_key)
+                )
+
+    def clear(self, scrape_key: str) -> None:
+        """
+        Removes the checkpoint and the articles of a scrape.
+
+        Args:
+            scrape_key (str): The key of the scrape.
+
+        Returns:
+            None
+        """
+        with self.__connection:
+            self.__connection.execute(
+                'DELETE FROM checkpoints WHERE scrape_key = ?', (scrape_key,))
+            self.__connection.execute(
+                'DELETE FROM articles WHERE scrape_key = ?', (scrape_key,))
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+
+        Returns:
+            None
+        """
+        self.__connection.close()
+
+
+class TopicFilterCache:
+    """
+    Persistent cache of the search filter of each topic.
+
+    The LA Times search filters the results by topic through a query 
+    parameter whose value is the id of the topic (e.g. 'f0=00000168-...'). 
+    The cache maps the titles of the topics (compared case 
+    insensitively) to their filter parameter, so the filtered results 
+    page of a query can be loaded directly. It is kept in a JSON file, 
+    replaced atomically on every change, so several processes can share 
+    it (the last write wins). Without a path, it is only kept in memory.
+
+    Attributes:
+        __cache_path (Optional[str]): The path of the JSON file.
+        __filters (dict[str, Tuple[str, str]]): The name and value of 
+                                                the filter parameter of 
+                                                each topic.
+        __lock (threading.Lock): Serializes the changes of the cache.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None) -> None:
+        self.__cache_path = cache_path
+        self.__filters: dict[str, Tuple[str, str]] = {}
+        self.__lock = threading.Lock()
+        if cache_path is None or not os.path.exists(cache_path):
+            return
+        try:
+            with open(cache_path, encoding='utf-8') as cache_file:
+                self.__filters = {
+                    topic: (name, value)
+                    for topic, (name, value) in json.load(cache_file).items()
+                    }
+        # A file that is not a JSON object of filter pairs is unreadable
+        # too
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            # The filters are discovered again by the next search
+            logger.warning('Could not read topic filter cache %s: %s',
+                           cache_path, e)
+
+    def get(self, topic: str) -> Optional[Tuple[str, str]]:
+        """
+        Retrieves the filter of a topic.
+
+        Args:
+            topic (str): The title of the topic.
+
+        Returns:
+            Optional[Tuple[str, str]]: The name and value of the filter 
+                                       parameter of the topic, or None 
+                                       if it is not cached.
+        """
+        return self.__filters.get(topic.lower())
+
+    def update(self, filters: dict[str, Tuple[str, str]]) -> None:
+        """
+        Caches the filters of several topics.
+
+        Args:
+            filters (dict[str, Tuple[str, str]]): The name and value of 
+                                                  the filter parameter 
+                                                  of each topic title.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__filters.update({topic.lower(): tuple(topic_filter)
+                                   for topic, topic_filter in filters.items()})
+            self.__save()
+
+    def remove(self, topic: str) -> None:
+        """
+        Removes the filter of a topic, e.g. when it no longer filters 
+        the results.
+
+        Args:
+            topic (str): The title of the topic.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            if self.__filters.pop(topic.lower(), None) is not None:
+                self.__save()
+
+    def __save(self) -> None:
+        """
+        Writes the cache to its JSON file, if it has one.
+
+        Returns:
+            None
+        """
+        if self.__cache_path is None:
+            return
+        try:
+            directory: str = os.path.dirname(self.__cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Written to a temporary file first, so readers never see a
+            # partial file
+            temporary_path: str = f'{self.__cache_path}.{uuid.uuid4().hex}'
+            with open(temporary_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(self.__filters, cache_file, indent=2)
+            os.replace(temporary_path, self.__cache_path)
+        except OSError as e:
+            logger.warning('Could not write topic filter cache %s: %s',
+                           self.__cache_path, e)
+
+
+class ImageCache:
+    """
+    Persistent content-addressed cache of downloaded images.
+
+    Image files are stored once per content hash (SHA-256) under
+    'objects/', so identical images served from different URLs share a
+    single file. An SQLite index maps every source URL to the hash of
+    its content and to the validators (ETag and Last-Modified) of the
+    response it was downloaded from, so a later run can revalidate the
+    image with a conditional request instead of downloading it again.
+    Cached images are hardlinked into the output directory (or copied,
+    when hardlinks are not possible), so they must not be modified in
+    place.
+
+    The cache can be used by several threads at the same time.
+
+    Attributes:
+        __cache_dir (str): The directory of the cache.
+        __connection (sqlite3.Connection): The connection to the index.
+        __lock (threading.Lock): Serializes the access to the index.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.__cache_dir = cache_dir
+        os.makedirs(os.path.join(cache_dir, 'objects'), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, 'tmp'), exist_ok=True)
+        self.__connection = sqlite3.connect(
+            os.path.join(cache_dir, 'index.sqlite3'),
+            check_same_thread=False
+            )
+        self.__lock = threading.Lock()
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS images ('
+                'url TEXT PRIMARY KEY, '
+                'sha256 TEXT NOT NULL, '
+                'etag TEXT, '
+                'last_modified TEXT, '
+                'fetched_at TEXT NOT NULL)'
+                )
+
+    def get_validators(self, url: str) -> dict[str, str]:
+        """
+        Returns the headers of a conditional request for a cached URL.
+
+        Args:
+            url (str): The source URL of the image.
+
+        Returns:
+            dict[str, str]: The 'If-None-Match' and/or
+                            'If-Modified-Since' headers, or an empty
+                            dictionary if the URL is not cached (or its
+                            file is missing).
+        """
+        entry: Optional[tuple] = self.__get_entry(url)
+        if entry is None:
+            return {}
+        sha256, etag, last_modified = entry
+        if not os.path.exists(self.__object_path(sha256)):
+            return {}
+        headers: dict[str, str] = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def new_temporary_path(self) -> str:
+        """
+        Returns a unique path inside the cache where a download can be
+        written before it is stored.
+
+        Returns:
+            str: The temporary path.
+        """
+        return os.path.join(self.__cache_dir, 'tmp', f'{uuid.uuid4().hex}.part')
+
+    def store(self, url: str, temporary_path: str, sha256: str,
+              etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Stores a downloaded image in the cache.
+
+        The downloaded file is moved to its content-addressed path (or
+        discarded, if an identical image is already cached) and the
+        index entry of the URL is updated.
+
+        Args:
+            url (str): The source URL of the image.
+            temporary_path (str): The path the image was downloaded to.
+            sha256 (str): The SHA-256 hex digest of the image.
+            etag (Optional[str]): The ETag of the response.
+            last_modified (Optional[str]): The Last-Modified date of the
+                                           response.
+
+        Returns:
+            None
+        """
+        object_path: str = self.__object_path(sha256)
+        if os.path.exists(object_path):
+            os.remove(temporary_path)
+        else:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            os.replace(temporary_path, object_path)
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO images '
+                '(url, sha256, etag, last_modified, fetched_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (url, sha256, etag, last_modified, datetime.now().isoformat())
+                )
+
+    def copy_to(self, url: str, image_path: str) -> bool:
+        """
+        Places the cached image of a URL at the given path.
+
+        The image is hardlinked to the path, or copied if hardlinks are
+        not supported (e.g. the output directory is on another device).
+
+        Args:
+            url (str): The source URL of the image.
+            image_path (str): The path where the image will be placed.
+
+        Returns:
+            bool: True if the image was placed, False if the URL is not
+                  cached.
+        """
+        entry: Optional[tuple] = self.__get_entry(url)
+        if entry is None:
+            return False
+        object_path: str = self.__object_path(entry[0])
+        if not os.path.exists(object_path):
+            return False
+        if os.path.lexists(image_path):
+            os.remove(image_path)
+        try:
+            os.link(object_path, image_path)
+        except OSError:
+            shutil.copyfile(object_path, image_path)
+        return True
+
+    def close(self) -> None:
+        """
+        Closes the connection to the index.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__connection.close()
+
+    def __get_entry(self, url: str) -> Optional[tuple]:
+        """
+        Returns the index entry of a URL.
+
+        Args:
+            url (str): The source URL of the image.
+
+        Returns:
+            Optional[tuple]: The content hash, ETag and Last-Modified
+                             date of the URL, or None if it is not
+                             cached.
+        """
+        with self.__lock:
+            return self.__connection.execute(
+                'SELECT sha256, etag, last_modified FROM images WHERE url = ?',
+                (url,)
+                ).fetchone()
+
+    def __object_path(self, sha256: str) -> str:
+        """
+        Returns the path of a cached image from its content hash.
+
+        Args:
+            sha256 (str): The SHA-256 hex digest of the image.
+
+        Returns:
+            str: The path of the cached image.
+        """
+        return os.path.join(self.__cache_dir, 'objects', sha256[:2], sha256)
@@ -1,20 +1,38 @@
 """
-This module provides utility classes for handling image downloads and 
-date conversions.
+This module provides utility classes for handling image downloads, 
+date conversions and the construction of scraped articles.
 
 Classes:
     ImageUtil: A utility class for downloading images from URLs.
     DateUtil: A utility class for converting date strings to datetime 
               objects.
+    MoneyUtil: A utility class for finding mentions of money in a text.
+    ArticleUtil: A utility class for building articles from raw field 
+                 values.
+    SearchUtil: A utility class for building LA Times search URLs.
 """
 
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                as_completed, wait)
 from datetime import datetime, timedelta
+from functools import lru_cache
+import hashlib
+import math
+import os
+import random
 import re
-from urllib.parse import urlparse, parse_qs
+import threading
+import time
+from urllib.parse import urlencode, urlparse, parse_qs
 import logging
-from typing import Optional, Tuple
+from typing import Iterable, Iterator, Optional, Tuple
 
-from RPA.HTTP import HTTP
+import requests
+from requests.adapters import HTTPAdapter
+
+from news_bot.metrics import Metrics
+from news_bot.models import Article
+from news_bot.storage import ImageCache
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +46,58 @@ class ImageUtil:
       - Download images from a list of sources to a specified 
         directory.
 
-    This class utilizes an HTTP client (provided as an `HTTP` 
-    attribute) to handle image downloads. 
+    Images are downloaded concurrently by a bounded pool of workers. 
+    Every worker keeps its own pooled HTTP session, so connections to 
+    each host are kept alive and reused across images. Requests have a 
+    timeout, and failed requests (connection errors, timeouts and 
+    retryable status codes) are retried with jittered exponential 
+    backoff.
+
+    When a maximum width and/or quality is given, a smaller rendition 
+    of each image is requested from the image resizing proxy the page 
+    uses, instead of the full-size original, falling back to the 
+    original if the rendition cannot be downloaded.
+
+    When an ImageCache is given, images downloaded by previous runs are 
+    revalidated with conditional requests (ETag / If-Modified-Since) 
+    and, if unchanged, taken from the cache instead of being downloaded 
+    again.
+
+    Attributes:
+        __workers (int): The maximum number of images downloaded at the 
+                         same time.
+        __timeout (float): The timeout, in seconds, of each request.
+        __max_retries (int): How many times a failed request is retried.
+        __backoff (float): The base delay, in seconds, between retries.
+        __cache (Optional[ImageCache]): The cache of downloaded images.
+        __max_width (Optional[int]): The maximum width, in pixels, of 
+                                     the requested renditions.
+        __quality (Optional[int]): The quality (1 to 100) of the 
+                                   requested renditions.
+        __skip_existing (bool): Whether images that are already in the 
+                                images directory are kept instead of 
+                                being downloaded again (e.g. when an 
+                                interrupted run is resumed).
     """
 
-    def __init__(self) -> None:
-        self.__http: HTTP = HTTP()
+    __RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503,
+                                                      504})
+
+    def __init__(self, workers: int = 8, timeout: float = 30,
+                 max_retries: int = 3, backoff: float = 0.5,
+                 cache: Optional[ImageCache] = None,
+                 max_width: Optional[int] = None,
+                 quality: Optional[int] = None,
+                 skip_existing: bool = False) -> None:
+        self.__workers = max(1, workers)
+        self.__timeout = timeout
+        self.__max_retries = max_retries
+        self.__backoff = backoff
+        self.__cache = cache
+        self.__max_width = max_width
+        self.__quality = quality
+        self.__skip_existing = skip_existing
+        self.__local = threading.local()
 
     @classmethod
     def extract_image_name(cls, image_src: str) -> Optional[str]:
@@ -44,9 +108,11 @@ class ImageUtil:
         This method attempts to extract the image URL from the provided 
         image source using the `__get_image_url` method. If the URL is 
         invalid, it logs an error message and returns None. If the URL 
-        is valid, it extracts the image name from the URL. If the image 
-        name does not have a valid image extension, it appends '.jpg' 
-        to the image name.
+        is valid, it extracts the image name from the URL and adds a 
+        short hash of the URL to it, so different images that share the 
+        same file name do not overwrite each other. If the image name 
+        does not have a valid image extension, it appends '.jpg' to the 
+        image name.
 
         Args:
             image_src (str): The image source URL.
@@ -66,39 +132,121 @@ class ImageUtil:
         image_name: str = image_url.split('/')[-1]
         if not cls.__is_image(image_name):
             image_name += '.jpg'
-        return image_name
+        stem, extension = os.path.splitext(image_name)
+        url_hash: str = hashlib.sha1(image_url.encode('utf-8')).hexdigest()[:8]
+        return f'{stem}-{url_hash}{extension}'
 
-    def download_images(self, image_src_list: list[str],
-                        images_dir: str) -> None:
+    def download_images(self, image_src_list: Iterable[str],
+                        images_dir: str) -> dict:
         """
-        Downloads images from a list of image sources to a specified 
-        directory.
+        Downloads images from image sources to a specified directory.
 
-        This method iterates through the list of image sources, 
-        attempts to download each image using the `___download_image` 
-        method, and logs the progress. If an image download fails, it 
-        logs an error message and continues to the next image.
+        This method downloads the images with a bounded pool of workers 
+        using the `___download_image` method. The image sources can be 
+        any iterable, so images can be downloaded while the articles are 
+        still being scraped; only a bounded number of image sources is 
+        taken from it ahead of the downloads. If an image download 
+        fails, it logs an error message and continues with the other 
+        images. Once every image was processed, it logs a summary of 
+        the downloads.
 
         Args:
-            image_src_list (list[str]): A list of image sources.
+            image_src_list (Iterable[str]): The image sources.
             images_dir (str): The directory where images will be 
                               downloaded.
 
         Returns:
-            None
+            dict: A summary of the downloads, with the number of images 
+                  that were downloaded ('succeeded'), that failed 
+                  ('failed'), that were taken from the cache ('cached', 
+                  included in 'succeeded') and that were already on 
+                  disk ('existing', included in 'succeeded'), the 
+                  downloaded bytes ('bytes'), the total time in seconds 
+                  ('seconds') and the 50th, 90th and 
+                  99th percentiles of the download time of each image, 
+                  in seconds ('latency_p50', 'latency_p90' and 
+                  'latency_p99').
         """
-        for num, image_src in enumerate(image_src_list, start=1):
-            logger.info('Downloading image %d...', num)
-            if not self.___download_image(image_src, images_dir):
-                error_message: str = (
-                    'Failed to download image %d. Skipping...'
-                    )
-                logger.error(error_message, num)
-            info_message: str = (
-                'Finished downloading process for image  %d. %d images left '
-                'to download.'
-                )
-            logger.info(info_message, num, len(image_src_list) - num)
+        logger.info('Downloading images...')
+        os.makedirs(images_dir, exist_ok=True)
+        started_at: float = time.perf_counter()
+        succeeded: int = 0
+        failed: int = 0
+        cached: int = 0
+        existing: int = 0
+        downloaded_bytes: int = 0
+        latencies: list[float] = []
+
+        metrics: Metrics = Metrics()
+
+        def collect(future: Future, num: int) -> None:
+            nonlocal succeeded, failed, cached, existing, downloaded_bytes
+            image_bytes, latency, outcome = future.result()
+            latencies.append(latency)
+            metrics.record('image_download', latency, outcome=outcome)
+            if image_bytes is None:
+                failed += 1
+                logger.error('Failed to download image %d. Skipping...', num)
+                return
+            succeeded += 1
+            cached += outcome == 'cached'
+            existing += outcome == 'existing'
+            downloaded_bytes += image_bytes
+            metrics.increment('image_bytes', image_bytes)
+
+        with ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            pending: dict[Future, int] = {}
+            for num, image_src in enumerate(image_src_list, start=1):
+                if len(pending) >= 2 * self.__workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future, pending.pop(future))
+                future: Future = executor.submit(self.___download_image,
+                                                 image_src, images_dir)
+                pending[future] = num
+            for future in as_completed(pending):
+                collect(future, pending[future])
+        metrics.record('image_downloads', time.perf_counter() - started_at)
+        latencies.sort()
+        report: dict = {
+            'succeeded': succeeded,
+            'failed': failed,
+            'cached': cached,
+            'existing': existing,
+            'bytes': downloaded_bytes,
+            'seconds': time.perf_counter() - started_at,
+            'latency_p50': self.__percentile(latencies, 50),
+            'latency_p90': self.__percentile(latencies, 90),
+            'latency_p99': self.__percentile(latencies, 99)
+        }
+        info_message: str = (
+            'Finished downloading images: %d downloaded (%d from cache, %d '
+            'already on disk), %d failed, %d bytes in %.2fs (p50 %.3fs, p90 '
+            '%.3fs, p99 %.3fs).'
+            )
+        logger.info(info_message, report['succeeded'], report['cached'],
+                    report['existing'], report['failed'], report['bytes'],
+                    report['seconds'], report['latency_p50'],
+                    report['latency_p90'], report['latency_p99'])
+        return report
+
+    @staticmethod
+    def __percentile(sorted_values: list[float], percent: float) -> float:
+        """
+        Computes a percentile of sorted values with the nearest-rank 
+        method.
+
+        Args:
+            sorted_values (list[float]): The values, sorted ascending.
+            percent (float): The percentile to compute, from 0 to 100.
+
+        Returns:
+            float: The percentile, or 0.0 if there are no values.
+        """
+        if not sorted_values:
+            return 0.0
+        rank: int = math.ceil(percent / 100 * len(sorted_values))
+        return sorted_values[max(rank, 1) - 1]
 
     @staticmethod
     def __get_image_url(image_src: str) -> Optional[str]:
@@ -128,17 +276,18 @@ class ImageUtil:
             return None
         return image_url
 
-    def ___download_image(self, image_src: str, images_dir: str) -> bool:
+    def ___download_image(self, image_src: str, images_dir: str
+                          ) -> Tuple[Optional[int], float, str]:
         """
         Downloads an image from the given image source URL and saves it 
         to the specified directory.
 
         This method extracts the image URL from the provided image 
         source using the `__get_image_url` method. If the URL is 
-        invalid, it logs an error message and returns False. If the URL 
-        is valid, it constructs the file path for the image, downloads 
-        it using the HTTP class, and saves it to the specified 
-        directory.
+        invalid, it logs an error message and fails. If the URL is 
+        valid, it downloads the configured rendition of the image (if 
+        any), falling back to the original image. When existing images 
+        are skipped, an image already at its path is kept as it is.
 
         Args:
             image_src (str): The image source URL.
@@ -146,19 +295,219 @@ class ImageUtil:
                               saved.
 
         Returns:
-            bool: True if the image was downloaded successfully, False 
-                  otherwise.
+            Tuple[Optional[int], float, str]: The number of bytes 
+                                              downloaded (None if the 
+                                              download failed), the 
+                                              time it took in seconds, 
+                                              and the outcome of the 
+                                              download ('downloaded', 
+                                              'cached', 'existing' or 
+                                              'failed').
         """
-        image_url: str = self.__get_image_url(image_src)
+        started_at: float = time.perf_counter()
+        image_url: Optional[str] = self.__get_image_url(image_src)
         if image_url is None:
             error_message: str = (
                 'Could not download image from an invalid image source URL.'
                 )
             logger.error(error_message)
-            return False
+            return None, time.perf_counter() - started_at, 'failed'
         image_path: str = f'{images_dir}/{self.extract_image_name(image_src)}'
-        self.__http.download(image_url, image_path)
-        return True
+        if self.__skip_existing and os.path.exists(image_path):
+            # Images are moved to their path once complete, so an
+            # existing image is never a partial download
+            return 0, time.perf_counter() - started_at, 'existing'
+        rendition_url: Optional[str] = self.__get_rendition_url(image_src)
+        if rendition_url is not None:
+            result: Optional[Tuple[int, bool]] = self.__download_url(
+                rendition_url, image_path)
+            if result is not None:
+                return (result[0], time.perf_counter() - started_at,
+                        self.__outcome(result[1]))
+            warning_message: str = (
+                'Could not download the image rendition. Downloading the '
+                'original image instead.'
+                )
+            logger.warning(warning_message)
+        result = self.__download_url(image_url, image_path)
+        if result is None:
+            return None, time.perf_counter() - started_at, 'failed'
+        return (result[0], time.perf_counter() - started_at,
+                self.__outcome(result[1]))
+
+    @staticmethod
+    def __outcome(is_cached: bool) -> str:
+        """
+        Returns the outcome of a successful download.
+
+        Args:
+            is_cached (bool): Whether the image was taken from the 
+                              cache.
+
+        Returns:
+            str: 'cached' if the image was taken from the cache, 
+                 'downloaded' otherwise.
+        """
+        return 'cached' if is_cached else 'downloaded'
+
+    def __download_url(self, url: str,
+                       image_path: str) -> Optional[Tuple[int, bool]]:
+        """
+        Downloads a URL to the given path, retrying failed requests.
+
+        With a cache, the request is conditional when the URL is cached, 
+        a '304 Not Modified' response places the cached image instead, 
+        and downloaded images are stored in the cache.
+
+        Args:
+            url (str): The URL to download.
+            image_path (str): The path where the image will be saved.
+
+        Returns:
+            Optional[Tuple[int, bool]]: The number of bytes downloaded 
+                                        and whether the image was taken 
+                                        from the cache, or None if the 
+                                        download failed.
+        """
+        headers: dict[str, str] = {}
+        if self.__cache is not None:
+            headers = self.__cache.get_validators(url)
+        for attempt in range(self.__max_retries + 1):
+            if attempt > 0:
+                # Full jitter, so concurrent retries do not line up
+                time.sleep(random.uniform(0, self.__backoff * 2 ** attempt))
+            try:
+                with self.__get_session().get(url, headers=headers,
+                                              stream=True,
+                                              timeout=self.__timeout
+                                              ) as response:
+                    if response.status_code in self.__RETRY_STATUS_CODES:
+                        logger.warning('Image request returned status %d.',
+                                       response.status_code)
+                        continue
+                    if response.status_code == 304:
+                        if self.__cache.copy_to(url, image_path):
+                            return 0, True
+                        # The cached image is gone, request it in full
+                        headers = {}
+                        continue
+                    response.raise_for_status()
+                    image_bytes: int = self.__save_response(response, url,
+                                                            image_path)
+                return image_bytes, False
+            except (requests.ConnectionError, requests.Timeout) as e:
+                logger.warning('Image request failed: %s', e)
+            except requests.RequestException as e:
+                logger.error('Image request failed: %s', e)
+                break
+            except OSError as e:
+                logger.error('Could not save image to %s: %s', image_path, e)
+                break
+        return None
+
+    def __get_rendition_url(self, image_src: str) -> Optional[str]:
+        """
+        Builds the URL of a smaller rendition of an image through the 
+        image resizing proxy used by the page.
+
+        The image source of the LA Times promos points to a resizing 
+        proxy (e.g. 'https://ca-times.brightspotcdn.com/dims4/default/
+        <signature>/2147483647/strip/true/resize/320x213!/quality/75/
+        ?url=<original>'), whose path is a list of operation/value 
+        pairs. This method sets the 'resize' operation to the 
+        configured maximum width (keeping the aspect ratio) and the 
+        'quality' operation to the configured quality, keeping every 
+        other operation.
+
+        Args:
+            image_src (str): The image source URL.
+
+        Returns:
+            Optional[str]: The URL of the rendition, or None if no 
+                           rendition is configured or the image source 
+                           is not a resizing proxy URL.
+        """
+        if self.__max_width is None and self.__quality is None:
+            return None
+        parsed_url = urlparse(image_src)
+        if '/dims4/' not in parsed_url.path or (
+                'url' not in parse_qs(parsed_url.query)):
+            return None
+        segments: list[str] = parsed_url.path.split('/')
+        operations: list[Tuple[str, str]] = []
+        if self.__max_width is not None:
+            operations.append(('resize', f'{self.__max_width}x'))
+        if self.__quality is not None:
+            operations.append(('quality', str(self.__quality)))
+        for operation, value in operations:
+            if operation in segments[:-1]:
+                segments[segments.index(operation) + 1] = value
+            elif segments[-1] == '':
+                # Keep the trailing slash of the path
+                segments[-1:-1] = [operation, value]
+            else:
+                segments.extend([operation, value])
+        return parsed_url._replace(path='/'.join(segments)).geturl()
+
+    def __save_response(self, response: requests.Response, image_url: str,
+                        image_path: str) -> int:
+        """
+        Streams the body of a response to a file.
+
+        The body is written to a temporary file, which is only moved to 
+        the final path once the body was fully received. With a cache, 
+        the temporary file is written inside the cache, stored there 
+        under the hash of its content, and then placed at the final 
+        path.
+
+        Args:
+            response (requests.Response): The response of the image 
+                                          request.
+            image_url (str): The URL of the image.
+            image_path (str): The path where the image will be saved.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        if self.__cache is None:
+            temporary_path: str = f'{image_path}.part'
+        else:
+            temporary_path: str = self.__cache.new_temporary_path()
+        image_bytes: int = 0
+        content_hash = hashlib.sha256()
+        with open(temporary_path, 'wb') as image_file:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                image_file.write(chunk)
+                content_hash.update(chunk)
+                image_bytes += len(chunk)
+        if self.__cache is None:
+            os.replace(temporary_path, image_path)
+            return image_bytes
+        self.__cache.store(image_url, temporary_path,
+                           content_hash.hexdigest(),
+                           response.headers.get('ETag'),
+                           response.headers.get('Last-Modified'))
+        self.__cache.copy_to(image_url, image_path)
+        return image_bytes
+
+    def __get_session(self) -> requests.Session:
+        """
+        Returns the pooled HTTP session of the current worker, creating 
+        it if needed.
+
+        Returns:
+            requests.Session: The HTTP session of the current worker.
+        """
+        session: Optional[requests.Session] = getattr(self.__local,
+                                                      'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.__workers,
+                                  pool_maxsize=self.__workers)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self.__local.session = session
+        return session
 
     @staticmethod
     def __is_image(image_name: str) -> bool:
@@ -191,27 +540,44 @@ class DateUtil:
     specific date formats (e.g., 'Month day, year'), and standard date
     formats (e.g., 'month/day/4year'). It also handles empty date 
     strings.
+
+    Every format is matched in a single pass by one precompiled 
+    pattern, and the conversions of absolute dates are memoized, since 
+    the same dates appear on many articles. Relative times are 
+    converted against a reference time, which is fixed for a whole run 
+    with `set_reference_time` so that every article of the run is dated 
+    consistently.
     """
 
-    __date_patterns = {
-        # Matches dates like '1 minute ago' or '2 minutes ago'
-        'minutes ago': r'(\d+) minute(s)? ago',
-        # Matches dates like '1 hour ago' or '2 hours ago'
-        'hours ago': r'(\d+) hour(s)? ago',
+    __DATE_PATTERN: re.Pattern = re.compile(
+        # Matches dates like '1 minute ago', '2 minutes ago', '1 hour 
+        # ago' or '2 hours ago'
+        r'(?P<relative_amount>\d+) (?P<relative_unit>minute|hour)s? ago'
         # Matches dates like 'January 1, 2022', 'Jan 1, 2022' or
         # 'Jan. 1, 2022'
-        'Month day, year': ( 
-            r'(\w{3})\w*.? (0?[1-9]|[12][0-9]|3[01]), ([0-9]{4})'
-        ),
+        r'|(?P<month_name>\w{3})\w*.? (?P<day>0?[1-9]|[12][0-9]|3[01]), '
+        r'(?P<year>[0-9]{4})'
         # Matches dates like '12/01/2022' or '12/1/2022'
-        'month/day/4year': (
-            r'^(0?[1-9]|1[0-2])\/(0?[1-9]|[12][0-9]|3[01])\/([0-9]{4})$'
-        ),
-        # Matches empty strings
-        'empty': (
-            r''
+        r'|^(?P<numeric_date>(?:0?[1-9]|1[0-2])/'
+        r'(?:0?[1-9]|[12][0-9]|3[01])/[0-9]{4})$'
         )
-    }
+    __reference_time: Optional[datetime] = None
+
+    @classmethod
+    def set_reference_time(cls, reference_time: Optional[datetime]) -> None:
+        """
+        Sets the time relative times (e.g. '3 hours ago') are converted 
+        against.
+
+        Args:
+            reference_time (Optional[datetime]): The reference time, or 
+                                                 None to use the current 
+                                                 time of each conversion.
+
+        Returns:
+            None
+        """
+        cls.__reference_time = reference_time
 
     @classmethod
     def date_to_datetime(cls, date: str) -> Optional[datetime]:
@@ -219,41 +585,427 @@ class DateUtil:
         Converts a date string to a datetime object based on various 
         date formats.
 
-        This method tries to match the provided date string against a 
-        set of predefined date patterns. If a match is found, it 
-        converts the string to a datetime object. The supported date 
-        formats include relative time strings (e.g., 'minutes ago'),
-        specific date formats (e.g., 'Month day, year'), and standard 
-        date formats (e.g., 'month/day/4year').
+        This method matches the provided date string against the 
+        supported date formats. If a match is found, it converts the 
+        string to a datetime object. The supported date formats include 
+        relative time strings (e.g., 'minutes ago'), specific date 
+        formats (e.g., 'Month day, year'), and standard date formats 
+        (e.g., 'month/day/4year').
+
+        Args:
+            date (str): The date string to be converted.
+
+        Returns:
+            Optional[datetime]: A datetime object if the conversion 
+                                is successful, otherwise None.
+        """
+        return cls.__convert(date, cls.__reference_time or datetime.now())
+
+    @classmethod
+    def parse_many(cls, dates: Iterable[str]) -> list[Optional[datetime]]:
+        """
+        Converts several date strings to datetime objects.
+
+        Relative times are all converted against the same reference 
+        time, even when no reference time was set for the run.
+
+        Args:
+            dates (Iterable[str]): The date strings to be converted.
+
+        Returns:
+            list[Optional[datetime]]: The datetime object of each date 
+                                      string, or None for the ones that 
+                                      could not be converted.
+        """
+        reference_time: datetime = cls.__reference_time or datetime.now()
+        return [cls.__convert(date, reference_time) for date in dates]
+
+    @classmethod
+    def __convert(cls, date: str,
+                  reference_time: datetime) -> Optional[datetime]:
+        """
+        Converts a date string to a datetime object, converting relative 
+        times against the given reference time.
+
+        Args:
+            date (str): The date string to be converted.
+            reference_time (datetime): The reference time of relative 
+                                       times.
+
+        Returns:
+            Optional[datetime]: A datetime object if the conversion 
+                                is successful, otherwise None.
+        """
+        match: Optional[re.Match] = cls.__DATE_PATTERN.search(date)
+        if match is None:
+            if not date.strip():
+                warning_message: str = (
+                    'The date string that is trying to be converted to '
+                    'datetime is an empty string.'
+                    )
+                logger.warning(warning_message)
+            else:
+                logger.warning('Unrecognized date format: %r', date)
+            return None
+        if match.group('relative_amount') is not None:
+            amount: int = int(match.group('relative_amount'))
+            if match.group('relative_unit') == 'minute':
+                return reference_time - timedelta(minutes=amount)
+            return reference_time - timedelta(hours=amount)
+        if match.group('numeric_date') is not None:
+            return cls.__parse_absolute_date(match.group('numeric_date'),
+                                             '%m/%d/%Y')
+        string_date: str = (
+            f"{match.group('month_name')} {match.group('day')}, "
+            f"{match.group('year')}"
+            )
+        return cls.__parse_absolute_date(string_date, '%b %d, %Y')
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __parse_absolute_date(date: str,
+                              date_format: str) -> Optional[datetime]:
+        """
+        Converts an absolute date string in the given format to a 
+        datetime object.
 
         Args:
             date (str): The date string to be converted.
+            date_format (str): The strptime format of the date string.
 
         Returns:
             Optional[datetime]: A datetime object if the conversion 
                                 is successful, otherwise None.
         """
-        for date_format, pattern in cls.__date_patterns.items():
-            match: Optional[re.Match] = re.search(pattern, date)
-            if match:
-                if date_format == 'minutes ago':
-                    minutes: int = int(match.group(1))
-                    return datetime.now() - timedelta(minutes=minutes)
-                elif date_format == 'hours ago':
-                    hours: int = int(match.group(1))
-                    return datetime.now() - timedelta(hours=hours)
-                elif date_format == 'Month day, year':
-                    month: int = match.group(1)
-                    day: int = match.group(2)
-                    year: int = match.group(3)
-                    string_date: str = f'{month} {day}, {year}'
-                    return datetime.strptime(string_date, '%b %d, %Y')
-                elif date_format == 'month/day/4year':
-                    return datetime.strptime(date, '%m/%d/%Y')
-                elif date_format == 'empty':
-                    warning_message: str = (
-                        'The date string that is trying to be converted to '
-                        'datetime is an empty string.'
-                        )
-                    logger.warning(warning_message)
-                    return None
+        try:
+            return datetime.strptime(date, date_format)
+        except ValueError:
+            logger.warning('Unrecognized date format: %r', date)
+            return None
+
+
+class MoneyUtil:
+    """
+    Utility class for finding mentions of money in a text.
+
+    It recognizes amounts in the forms '$11.1', '$111,111.11', 
+    '$1.5 million', '11 dollars' and '11 USD' / 'USD 11' (case 
+    insensitively), and parses the amount of every mention.
+
+    The pattern is compiled once and runs in linear time: every amount 
+    either starts at a '$' or 'USD' sign or at the first digit of a 
+    number (enforced by a lookbehind), and no quantifier is nested in 
+    another one, so long digit runs cannot cause catastrophic 
+    backtracking.
+    """
+
+    # An amount must not be followed by more digits (e.g. '$1,2345' or
+    # '$1.234' are not amounts), only by punctuation (e.g. '$5, and')
+    __AMOUNT: str = r'(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d{1,2})?(?![.,]?\d)'
+    __SCALE: str = r'(?:\s(?P<{name}>thousand|million|billion|trillion)\b)?'
+    __MONEY_PATTERN: re.Pattern = re.compile(
+        rf'\$\s?(?P<dollar_amount>{__AMOUNT})'
+        rf'{__SCALE.format(name="dollar_scale")}'
+        rf'|\bUSD\s?(?P<usd_amount>{__AMOUNT})'
+        rf'{__SCALE.format(name="usd_scale")}'
+        rf'|(?<![\d.,])(?P<amount>{__AMOUNT}){__SCALE.format(name="scale")}'
+        r'\s+(?P<unit>dollars|USD)\b',
+        re.IGNORECASE
+        )
+    __SCALES: dict[str, int] = {
+        'thousand': 10 ** 3,
+        'million': 10 ** 6,
+        'billion': 10 ** 9,
+        'trillion': 10 ** 12
+    }
+
+    @classmethod
+    def find_money(cls, text: str) -> list[Tuple[float, str]]:
+        """
+        Finds every mention of money in the given text.
+
+        Args:
+            text (str): The text to search for mentions of money.
+
+        Returns:
+            list[Tuple[float, str]]: The amount and form ('$', 'dollars' 
+                                     or 'USD') of every mention of 
+                                     money, in the order they appear in 
+                                     the text.
+        """
+        mentions: list[Tuple[float, str]] = []
+        for match in cls.__MONEY_PATTERN.finditer(text):
+            if match.group('dollar_amount') is not None:
+                amount: str = match.group('dollar_amount')
+                scale: Optional[str] = match.group('dollar_scale')
+                form: str = '$'
+            elif match.group('usd_amount') is not None:
+                amount = match.group('usd_amount')
+                scale = match.group('usd_scale')
+                form = 'USD'
+            else:
+                amount = match.group('amount')
+                scale = match.group('scale')
+                form = match.group('unit').lower()
+                if form == 'usd':
+                    form = 'USD'
+            value: float = float(amount.replace(',', ''))
+            if scale is not None:
+                value *= cls.__SCALES[scale.lower()]
+            mentions.append((value, form))
+        return mentions
+
+
+class ArticleUtil:
+    """
+    Utility class for building articles.
+
+    This class turns the raw field values read from a search results 
+    page (by the browser or the HTTP backend) into the articles saved 
+    by the news bot, so that every backend produces exactly the same 
+    output.
+    """
+
+    @classmethod
+    def build_article(cls, title: Optional[str], description: Optional[str],
+                      unconverted_date: Optional[str],
+                      image_src: Optional[str], phrase: str) -> Article:
+        """
+        Builds an article from its raw field values.
+
+        This method replaces missing fields with placeholder strings 
+        (logging an error for each of them), converts the date, extracts 
+        the image file name, finds the mentions of money in the article 
+        text (with their amounts and forms) and counts how many times 
+        the search phrase appears in the article.
+
+        Args:
+            title (Optional[str]): The title of the article, or None if 
+                                   it was not found.
+            description (Optional[str]): The description of the 
+                                         article, or None if it was not 
+                                         found.
+            unconverted_date (Optional[str]): The date text of the 
+                                              article, or None if it 
+                                              was not found.
+            image_src (Optional[str]): The image source URL of the 
+                                       article, or None if it was not 
+                                       found.
+            phrase (str): The search phrase used to count its 
+                          occurrences in the article.
+
+        Returns:
+            Article: The article, including its title, description, date 
+                     (or a placeholder if it could not be converted), 
+                     image source, the amounts and forms of the 
+                     mentions of money in its text, and the count of the 
+                     search phrase.
+        """
+        date: Optional[datetime] = None
+        if unconverted_date is not None:
+            date = DateUtil.date_to_datetime(unconverted_date)
+        return cls.__build_article(title, description, unconverted_date, date,
+                                   image_src, phrase)
+
+    @classmethod
+    def build_articles(cls, raw_articles: list[dict],
+                       phrase: str) -> list[Article]:
+        """
+        Builds the articles of a results page from their raw field 
+        values.
+
+        The dates of the articles are converted together with 
+        `DateUtil.parse_many`, so relative dates are all converted 
+        against the same reference time.
+
+        Args:
+            raw_articles (list[dict]): The raw field values ('title', 
+                                       'description', 'timestamp' and 
+                                       'image_src', each None if it was 
+                                       not found) of each article.
+            phrase (str): The search phrase used to count its 
+                          occurrences in the articles.
+
+        Returns:
+            list[Article]: The articles, as built by `build_article`.
+        """
+        dates: Iterator[Optional[datetime]] = iter(DateUtil.parse_many(
+            raw_article['timestamp'] for raw_article in raw_articles
+            if raw_article['timestamp'] is not None
+            ))
+        metrics: Metrics = Metrics()
+        articles: list[Article] = []
+        for raw_article in raw_articles:
+            with metrics.span('article_extraction'):
+                date: Optional[datetime] = None
+                if raw_article['timestamp'] is not None:
+                    date = next(dates)
+                articles.append(cls.__build_article(
+                    raw_article['title'], raw_article['description'],
+                    raw_article['timestamp'], date, raw_article['image_src'],
+                    phrase))
+        return articles
+
+    @classmethod
+    def __build_article(cls, title: Optional[str], description: Optional[str],
+                        unconverted_date: Optional[str],
+                        date: Optional[datetime], image_src: Optional[str],
+                        phrase: str) -> Article:
+        """
+        Builds an article from its raw field values and its already 
+        converted date.
+
+        Args:
+            title (Optional[str]): The title of the article.
+            description (Optional[str]): The description of the 
+                                         article.
+            unconverted_date (Optional[str]): The date text of the 
+                                              article.
+            date (Optional[datetime]): The converted date of the 
+                                       article, or None if it could not 
+                                       be converted.
+            image_src (Optional[str]): The image source URL of the 
+                                       article.
+            phrase (str): The search phrase used to count its 
+                          occurrences in the article.
+
+        Returns:
+            Article: The article.
+        """
+        if title is None:
+            title = 'Title not found'
+            error_message: str = (
+                'Title element not found. Returned %s placeholder '
+                'instead.'
+                )
+            logger.error(error_message, title)
+        if description is None:
+            description = 'Description not found'
+            error_message: str = (
+                'Description element not found. Returned %s placeholder '
+                'instead.'
+                )
+            logger.error(error_message, description)
+        date_placeholder: Optional[str] = None
+        if date is None:
+            date_placeholder = cls.__get_date_placeholder(unconverted_date)
+        if image_src is None:
+            image_src = 'Image not found'
+            error_message: str = (
+                'Image element not found. Returned %s placeholder instead.'
+                )
+            logger.error(error_message, image_src)
+        image_file_name: str = cls.__get_image_file_name(image_src)
+        article_text: str = title + ' | ' + description
+        money_mentions: list[Tuple[float, str]] = MoneyUtil.find_money(
+            article_text)
+        phrase_count: int = article_text.count(phrase.lower())
+        return Article(title, description, date, image_src, image_file_name,
+                       tuple(money_mentions), phrase_count, date_placeholder)
+
+    @staticmethod
+    def __get_date_placeholder(unconverted_date: Optional[str]) -> str:
+        """
+        Returns the placeholder written instead of the date of an 
+        article that could not be converted.
+
+        The date text is missing, empty or in an unrecognized format: it 
+        logs an error and returns a placeholder string describing the 
+        problem.
+
+        Args:
+            unconverted_date (Optional[str]): The date text of the 
+                                              article, or None if it 
+                                              was not found.
+
+        Returns:
+            str: The placeholder string.
+        """
+        if unconverted_date is None:
+            placeholder: str = 'Date not found'
+            error_message: str = (
+                'Date element not found. Returned %s placeholder instead.'
+                )
+        elif not unconverted_date.strip():
+            placeholder = 'Date found but is empty'
+            error_message = (
+                'Date element found but contains empty string. Returned '
+                '%s placeholder instead.'
+                )
+        else:
+            placeholder = 'Date format not recognized'
+            error_message = (
+                'Date element found but its format is not recognized. '
+                'Returned %s placeholder instead.'
+                )
+        logger.error(error_message, placeholder)
+        return placeholder
+
+    @staticmethod
+    def __get_image_file_name(image_src: str) -> str:
+        """
+        Extracts the image file name from the given image source URL.
+
+        This method extracts the file name from the image source URL by 
+        splitting the URL and returning the last part of the split. If 
+        the image source URL is not valid, it logs an error and returns 
+        a placeholder string.
+
+        Args:
+            image_src (str): The image source URL.
+
+        Returns:
+            str: The image file name or a placeholder string.
+        """
+        if image_src == 'Image not found':
+            image_file_name: str = 'Image not found'
+        else:
+            image_file_name: str = ImageUtil.extract_image_name(image_src)
+        return image_file_name
+
+
+class SearchUtil:
+    """
+    Utility class for building LA Times search result URLs.
+
+    The search results page of the LA Times website can be addressed 
+    directly through query parameters: the search phrase ('q'), the 
+    sort order ('s', where '1' means newest first), the topic filter 
+    (e.g. 'f0', whose value is the topic id) and the page number ('p').
+    """
+
+    NEWEST_SORT: str = '1'
+
+    @classmethod
+    def build_search_url(cls, base_url: str, phrase: str,
+                         newest: bool = True,
+                         topic_filter: Optional[Tuple[str, str]] = None,
+                         page_number: int = 1) -> str:
+        """
+        Builds the URL of a search results page.
+
+        Args:
+            base_url (str): The base URL of the LA Times website (e.g. 
+                            'https://www.latimes.com/').
+            phrase (str): The search phrase.
+            newest (bool): Whether to sort the results by newest first. 
+                           Defaults to True.
+            topic_filter (Optional[Tuple[str, str]]): The name and value 
+                                                      of the topic 
+                                                      filter parameter, 
+                                                      or None to not 
+                                                      filter by topic.
+            page_number (int): The number of the results page. Defaults 
+                               to 1.
+
+        Returns:
+            str: The URL of the search results page.
+        """
+        params: list[Tuple[str, str]] = [('q', phrase)]
+        if newest:
+            params.append(('s', cls.NEWEST_SORT))
+        if topic_filter is not None:
+            params.append(topic_filter)
+        if page_number > 1:
+            params.append(('p', str(page_number)))
+        return f"{base_url.rstrip('/')}/search?{urlencode(params)}"
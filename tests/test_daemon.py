@@ -0,0 +1,148 @@
+"""
+Tests of the requests handled by the news bot daemon, with a fake
+browser and a fake query runner.
+"""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from news_bot.daemon import NewsBotDaemon
+
+
+class FakeBrowser:
+    def __init__(self, query: dict) -> None:
+        self.query = query
+        self.is_closed = False
+        self.resets = 0
+        self.is_broken = False
+
+    def open_website(self) -> None:
+        pass
+
+    def is_healthy(self) -> bool:
+        return not self.is_closed
+
+    def reset(self) -> None:
+        if self.is_broken:
+            raise RuntimeError('The browser could not be reset')
+        self.resets += 1
+
+    def close_browser(self) -> None:
+        self.is_closed = True
+
+
+def run_query(query: dict, artifacts_dir: str, browser: FakeBrowser) -> str:
+    if query.get('breaks_browser'):
+        browser.is_broken = True
+    if 'phrase' not in query:
+        raise KeyError('phrase')
+    return f'{artifacts_dir}/articles.xlsx'
+
+
+def fits_browser(browser: FakeBrowser, query: dict) -> bool:
+    return (browser.query.get('lean_browser', True)
+            == query.get('lean_browser', True))
+
+
+@pytest.fixture
+def served_daemon(tmp_path):
+    socket_path: str = str(tmp_path / 'news_bot.sock')
+    browsers: list[FakeBrowser] = []
+
+    def create_browser(query: dict) -> FakeBrowser:
+        browsers.append(FakeBrowser(query))
+        return browsers[-1]
+
+    daemon = NewsBotDaemon(socket_path, run_query, create_browser,
+                           fits_browser)
+    server = threading.Thread(target=daemon.serve_forever, daemon=True)
+    server.start()
+    while not os.path.exists(socket_path):
+        time.sleep(0.01)
+    yield socket_path, browsers
+    NewsBotDaemon.send(socket_path, {'command': 'shutdown'})
+    server.join()
+
+
+def test_queries_are_run_with_the_warm_browser(served_daemon):
+    socket_path, browsers = served_daemon
+    for _ in range(2):
+        response: dict = NewsBotDaemon.send(
+            socket_path, {'command': 'run', 'query': {'phrase': 'city'},
+                          'artifacts_dir': '/tmp/output'})
+        assert response['status'] == 'done'
+        assert response['excel_file'] == '/tmp/output/articles.xlsx'
+    assert len(browsers) == 1
+
+
+def test_browser_is_relaunched_for_other_browser_options(served_daemon):
+    socket_path, browsers = served_daemon
+    response: dict = NewsBotDaemon.send(
+        socket_path, {'command': 'run',
+                      'query': {'phrase': 'city', 'lean_browser': False},
+                      'artifacts_dir': '/tmp/output'})
+    assert response['status'] == 'done'
+    assert len(browsers) == 2
+    assert browsers[0].is_closed
+    assert browsers[1].query['lean_browser'] is False
+
+
+@pytest.mark.parametrize('request_, error', [
+    ({'command': 'run', 'artifacts_dir': '/tmp/output'}, 'query'),
+    ({'command': 'run', 'query': ['city'], 'artifacts_dir': '/tmp/output'},
+     'query'),
+    ({'command': 'run', 'query': {'phrase': 'city'}}, 'artifacts directory'),
+    ({'command': 'run', 'query': {'phrase': 'city'}, 'artifacts_dir': 1},
+     'artifacts directory'),
+    (['run'], 'Invalid request'),
+    ({'command': 'restart'}, 'Unknown command'),
+])
+def test_invalid_requests_get_an_error(served_daemon, request_, error):
+    socket_path, _ = served_daemon
+    response: dict = NewsBotDaemon.send(socket_path, request_)
+    assert response['status'] == 'failed'
+    assert error in response['error']
+    # The daemon keeps serving
+    assert NewsBotDaemon.send(socket_path, {'command': 'ping'}) == {
+        'status': 'ok'}
+
+
+def test_failed_query_gets_its_error(served_daemon):
+    socket_path, _ = served_daemon
+    response: dict = NewsBotDaemon.send(
+        socket_path, {'command': 'run', 'query': {},
+                      'artifacts_dir': '/tmp/output'})
+    assert response['status'] == 'failed'
+    assert 'phrase' in response['error']
+
+
+def test_browser_is_reset_after_a_failed_query(served_daemon):
+    socket_path, browsers = served_daemon
+    for query in ({'phrase': 'city'}, {}):
+        NewsBotDaemon.send(socket_path, {'command': 'run', 'query': query,
+                                         'artifacts_dir': '/tmp/output'})
+    assert len(browsers) == 1
+    assert browsers[0].resets == 1
+
+
+def test_browser_is_relaunched_when_it_cannot_be_reset(served_daemon):
+    socket_path, browsers = served_daemon
+    NewsBotDaemon.send(socket_path, {'command': 'run',
+                                     'query': {'breaks_browser': True},
+                                     'artifacts_dir': '/tmp/output'})
+    assert len(browsers) == 2
+    assert browsers[0].is_closed
+
+
+def test_malformed_json_gets_an_error(served_daemon):
+    socket_path, _ = served_daemon
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile('rwb') as stream:
+            stream.write(b'{"command": \n')
+            stream.flush()
+            assert b'Invalid request' in stream.readline()
@@ -0,0 +1,71 @@
+"""
+Tests of the dates converted by DateUtil.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from news_bot.utils import DateUtil
+
+REFERENCE_TIME: datetime = datetime(2024, 5, 17, 12, 0)
+
+
+@pytest.fixture
+def reference_time():
+    DateUtil.set_reference_time(REFERENCE_TIME)
+    yield REFERENCE_TIME
+    DateUtil.set_reference_time(None)
+
+
+@pytest.mark.parametrize('date, expected', [
+    ('1 minute ago', REFERENCE_TIME - timedelta(minutes=1)),
+    ('45 minutes ago', REFERENCE_TIME - timedelta(minutes=45)),
+    ('1 hour ago', REFERENCE_TIME - timedelta(hours=1)),
+    ('3 hours ago', REFERENCE_TIME - timedelta(hours=3)),
+    ('January 1, 2022', datetime(2022, 1, 1)),
+    ('Jan 1, 2022', datetime(2022, 1, 1)),
+    ('Jan. 1, 2022', datetime(2022, 1, 1)),
+    ('Sept. 30, 2023', datetime(2023, 9, 30)),
+    ('December 31, 2023', datetime(2023, 12, 31)),
+    ('12/01/2022', datetime(2022, 12, 1)),
+    ('2/9/2022', datetime(2022, 2, 9)),
+])
+def test_supported_formats(reference_time, date, expected):
+    assert DateUtil.date_to_datetime(date) == expected
+
+
+@pytest.mark.parametrize('date', [
+    '',
+    '   ',
+    'Yesterday',
+    'Feb. 30, 2022',
+    'Foo 1, 2022',
+    '13/01/2022',
+    'Published 12/01/2022',
+])
+def test_unsupported_dates_are_none(reference_time, date):
+    assert DateUtil.date_to_datetime(date) is None
+
+
+def test_relative_times_of_a_run_share_the_reference_time(reference_time):
+    assert DateUtil.parse_many(['2 hours ago', 'May 1, 2024', '', '5/2/2024',
+                                '30 minutes ago']) == [
+        REFERENCE_TIME - timedelta(hours=2), datetime(2024, 5, 1), None,
+        datetime(2024, 5, 2), REFERENCE_TIME - timedelta(minutes=30)]
+
+
+def test_parse_many_uses_one_reference_time_without_a_run():
+    started_at: datetime = datetime.now()
+    dates: list[datetime] = DateUtil.parse_many(['1 minute ago'] * 100
+                                                + ['61 minutes ago'])
+    assert len(set(dates[:100])) == 1
+    assert dates[0] - dates[100] == timedelta(hours=1)
+    assert started_at - timedelta(minutes=1) <= dates[0] <= datetime.now()
+
+
+def test_current_time_is_used_once_the_reference_time_is_cleared():
+    DateUtil.set_reference_time(REFERENCE_TIME)
+    DateUtil.set_reference_time(None)
+    started_at: datetime = datetime.now()
+    assert DateUtil.date_to_datetime('0 minutes ago') >= started_at
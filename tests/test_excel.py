@@ -0,0 +1,70 @@
+"""
+Tests of the Excel files written by StreamingExcel, which must be the
+same as the ones written by Excel.
+"""
+
+from datetime import datetime
+from typing import Iterator
+
+import openpyxl
+import pytest
+
+from news_bot.handlers import Excel, StreamingExcel
+from news_bot.models import Article
+
+ARTICLES: list[Article] = [
+    Article('City council approves budget', 'It costs $11.1 million.',
+            datetime(2024, 5, 17, 9, 30), 'https://example.com/1.jpg',
+            '1.jpg', ((11100000.0, '$'),), 1),
+    Article('Árvores e ônibus: 日本語', '', datetime(2023, 12, 31),
+            'https://example.com/2.jpg', '2.jpg',
+            ((5.0, '$'), (40.5, 'USD')), 0),
+    Article('Undated article', 'A "quoted" description\non two lines',
+            None, 'https://example.com/3.jpg', '3.jpg', (), 2,
+            'Date not found'),
+]
+
+
+def read_workbook(path: str) -> dict[str, list[tuple]]:
+    workbook = openpyxl.load_workbook(path)
+    rows: dict[str, list[tuple]] = {
+        worksheet.title: list(worksheet.iter_rows(values_only=True))
+        for worksheet in workbook.worksheets
+        }
+    workbook.close()
+    return rows
+
+
+def stream(articles: list[Article]) -> Iterator[Article]:
+    yield from articles
+
+
+@pytest.mark.parametrize('articles', [ARTICLES, ARTICLES[:1]])
+def test_streamed_file_matches_the_excel_file(tmp_path, articles):
+    Excel().save_articles_excel(stream(articles),
+                                str(tmp_path / 'excel.xlsx'))
+    StreamingExcel().save_articles_excel(stream(articles),
+                                         str(tmp_path / 'streaming.xlsx'))
+    excel_rows: dict[str, list[tuple]] = read_workbook(
+        str(tmp_path / 'excel.xlsx'))
+    assert read_workbook(str(tmp_path / 'streaming.xlsx')) == excel_rows
+    assert excel_rows['search_results'][0] == Article.COLUMNS
+    assert len(excel_rows['search_results']) == len(articles) + 1
+
+
+def test_streamed_rows_are_the_rows_of_the_articles(tmp_path):
+    StreamingExcel().save_articles_excel(ARTICLES,
+                                         str(tmp_path / 'streaming.xlsx'))
+    rows: list[tuple] = read_workbook(
+        str(tmp_path / 'streaming.xlsx'))['search_results']
+    # Empty cells are read back as None
+    assert rows[1:] == [tuple(None if value == '' else value
+                              for value in article.to_row().values())
+                        for article in ARTICLES]
+    assert rows[3][2] == 'Date not found'
+
+
+@pytest.mark.parametrize('excel', [Excel(), StreamingExcel()])
+def test_no_file_is_written_without_articles(tmp_path, excel):
+    excel.save_articles_excel(stream([]), str(tmp_path / 'articles.xlsx'))
+    assert not (tmp_path / 'articles.xlsx').exists()
@@ -0,0 +1,145 @@
+"""
+Tests of the HTTP backend and of the Scraper driving it, against the
+fixture LA Times website of the benchmarks.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+from benchmarks.fixtures import FixtureServer, FixtureSite
+from news_bot.handlers import Scraper
+from news_bot.http_handlers import LATimesHTTPBrowser
+from news_bot.models import Article
+from news_bot.storage import TopicFilterCache
+
+NOW: datetime = datetime.now()
+# The fixture articles are one day apart, so the range holds the 10
+# newest of them, on the first 2 of the 3 pages
+START_DATE: datetime = NOW - timedelta(days=10)
+END_DATE: datetime = NOW + timedelta(days=1)
+
+
+@pytest.fixture(scope='module')
+def server():
+    site = FixtureSite(pages=3, articles_per_page=5, image_size=1_000,
+                       newest_date=NOW)
+    with FixtureServer(site) as server:
+        yield server
+
+
+@pytest.fixture
+def browser(server):
+    browser = LATimesHTTPBrowser(server.url)
+    browser.open_website()
+    browser.search('city')
+    browser.select_newest_articles()
+    browser.select_topic('Politics')
+    yield browser
+    browser.close_browser()
+
+
+class RecordingSession(requests.Session):
+    instances: list = []
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.is_closed = False
+        RecordingSession.instances.append(self)
+
+    def close(self) -> None:
+        self.is_closed = True
+        super().close()
+
+
+@pytest.fixture
+def sessions(monkeypatch) -> list[RecordingSession]:
+    monkeypatch.setattr(requests, 'Session', RecordingSession)
+    RecordingSession.instances = []
+    return RecordingSession.instances
+
+
+def scrape(browser: LATimesHTTPBrowser, workers: int) -> list[Article]:
+    return Scraper(browser, workers).scrape_articles_in_date_range(
+        START_DATE, END_DATE, 'city', 'Politics')
+
+
+def test_articles_of_the_date_range_are_scraped(server, browser):
+    articles: list[Article] = scrape(browser, 1)
+    assert len(articles) == 10
+    assert all(START_DATE <= article.date <= END_DATE
+               for article in articles)
+    assert all(article.image_src.startswith(f'{server.url}/dims4/')
+               for article in articles)
+    # Only the descriptions with money mention their cost
+    assert all(article.text_contains_money == ('costs' in article.description)
+               for article in articles)
+
+
+def test_concurrent_scrape_matches_the_sequential_one(browser):
+    sequential_titles: list[str] = [article.title
+                                    for article in scrape(browser, 1)]
+    browser.select_topic('Politics')
+    assert [article.title
+            for article in scrape(browser, 3)] == sequential_titles
+
+
+def test_sessions_of_the_workers_are_closed_after_each_scrape(server,
+                                                              sessions):
+    browser = LATimesHTTPBrowser(server.url)
+    browser.search('city')
+    for _ in range(3):
+        scrape(browser, 3)
+    # Only the session of the main thread is left open
+    assert len(sessions) > 3
+    assert [session.is_closed for session in sessions].count(False) == 1
+    browser.close_browser()
+    assert all(session.is_closed for session in sessions)
+
+
+@pytest.mark.parametrize('user_agent', [LATimesHTTPBrowser.USER_AGENT,
+                                        'news_bot/1.0 (ops@example.com)'])
+def test_requests_identify_the_bot(server, sessions, user_agent):
+    browser = LATimesHTTPBrowser(server.url, user_agent=user_agent)
+    browser.search('city')
+    browser.get_page_articles('city')
+    browser.close_browser()
+    assert 'news_bot' in LATimesHTTPBrowser.USER_AGENT
+    assert [session.headers['User-Agent']
+            for session in sessions] == [user_agent]
+
+
+def test_pages_past_the_last_one_have_no_articles(browser):
+    assert len(browser.get_page_articles_at(3, 'city')) == 5
+    assert browser.get_page_articles_at(4, 'city') == []
+
+
+def test_next_page_stops_at_the_last_page(browser):
+    assert browser.next_page(1)
+    assert browser.next_page(2)
+    assert not browser.next_page(3)
+
+
+def test_search_results_are_opened_with_cached_topic_filters(tmp_path,
+                                                             server):
+    topic_filters = TopicFilterCache(str(tmp_path / 'topic_filters.json'))
+    browser = LATimesHTTPBrowser(server.url)
+    assert browser.open_search_results('city', 'Sports', topic_filters)
+    assert topic_filters.get('Politics') is not None
+    assert len(browser.get_page_articles('city')) == 5
+    assert not browser.open_search_results('city', 'Weather', topic_filters)
+    browser.close_browser()
+
+
+def test_failed_requests_raise_an_error(server):
+    browser = LATimesHTTPBrowser(f'{server.url}/missing')
+    with pytest.raises(RuntimeError, match='search'):
+        browser.get_page_articles('city')
+    browser.search('city')
+    with pytest.raises(requests.HTTPError):
+        browser.get_page_articles('city')
+    # Also when the pages are requested from worker threads
+    with pytest.raises(requests.HTTPError):
+        scrape(browser, 3)
+    browser.close_browser()
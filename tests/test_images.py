@@ -0,0 +1,94 @@
+"""
+Tests of the image downloads of ImageUtil, against the fixture LA Times
+website of the benchmarks.
+"""
+
+import os
+from urllib.parse import quote
+
+import pytest
+
+from benchmarks.fixtures import FixtureServer, FixtureSite
+from news_bot.storage import ImageCache
+from news_bot.utils import ImageUtil
+
+IMAGES_COUNT: int = 5
+IMAGE_SIZE: int = 2_000
+
+
+@pytest.fixture(scope='module')
+def server():
+    with FixtureServer(FixtureSite(image_size=IMAGE_SIZE)) as server:
+        yield server
+
+
+def image_src(server: FixtureServer, image_number: int) -> str:
+    """
+    Builds the image source of a promo, which points to the image
+    resizing proxy of the fixture website.
+    """
+    image_url: str = quote(f'{server.url}/images/{image_number}.jpg',
+                           safe='')
+    return (f'{server.url}/dims4/default/0a1b2c3/2147483647/strip/true/'
+            f'resize/320x213!/quality/75/?url={image_url}')
+
+
+def image_src_list(server: FixtureServer) -> list[str]:
+    return [image_src(server, number) for number in range(IMAGES_COUNT)]
+
+
+def image_sizes(server: FixtureServer, images_dir: str) -> list[int]:
+    return [os.path.getsize(os.path.join(
+                images_dir, ImageUtil.extract_image_name(src)))
+            for src in image_src_list(server)]
+
+
+def test_original_images_are_downloaded(tmp_path, server):
+    report: dict = ImageUtil(workers=2).download_images(
+        image_src_list(server), str(tmp_path))
+    assert report['succeeded'] == IMAGES_COUNT
+    assert report['failed'] == 0
+    assert report['bytes'] == IMAGES_COUNT * IMAGE_SIZE
+    assert image_sizes(server, str(tmp_path)) == [IMAGE_SIZE] * IMAGES_COUNT
+
+
+def test_renditions_are_downloaded_through_the_resizing_proxy(tmp_path,
+                                                              server):
+    report: dict = ImageUtil(max_width=100, quality=50).download_images(
+        image_src_list(server), str(tmp_path))
+    assert report['succeeded'] == IMAGES_COUNT
+    # The proxy of the fixture website returns a tenth of the image
+    assert image_sizes(server, str(tmp_path)) == (
+        [IMAGE_SIZE // 10] * IMAGES_COUNT)
+
+
+def test_cached_images_are_revalidated_instead_of_downloaded(tmp_path,
+                                                             server):
+    cache = ImageCache(str(tmp_path / 'cache'))
+    ImageUtil(cache=cache).download_images(image_src_list(server),
+                                           str(tmp_path / 'first'))
+    report: dict = ImageUtil(cache=cache).download_images(
+        image_src_list(server), str(tmp_path / 'second'))
+    cache.close()
+    assert report['cached'] == IMAGES_COUNT
+    assert report['bytes'] == 0
+    assert image_sizes(server, str(tmp_path / 'second')) == (
+        [IMAGE_SIZE] * IMAGES_COUNT)
+
+
+def test_existing_images_are_kept(tmp_path, server):
+    ImageUtil().download_images(image_src_list(server), str(tmp_path))
+    report: dict = ImageUtil(skip_existing=True).download_images(
+        image_src_list(server), str(tmp_path))
+    assert report['existing'] == IMAGES_COUNT
+    assert report['bytes'] == 0
+
+
+def test_failed_downloads_are_reported(tmp_path, server):
+    missing_image_src: str = (
+        f"{server.url}/dims4/?url={quote(f'{server.url}/missing.jpg')}")
+    report: dict = ImageUtil(max_retries=0).download_images(
+        [image_src(server, 0), f'{server.url}/no-url.jpg',
+         missing_image_src], str(tmp_path))
+    assert report['succeeded'] == 1
+    assert report['failed'] == 2
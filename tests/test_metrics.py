@@ -0,0 +1,90 @@
+"""
+Tests of the spans and counters recorded by Metrics and of their JSON
+and Prometheus exports.
+"""
+
+import json
+import threading
+
+import pytest
+
+from news_bot.metrics import Metrics
+
+
+@pytest.fixture
+def metrics():
+    metrics = Metrics()
+    metrics.reset()
+    yield metrics
+    metrics.reset()
+
+
+def test_spans_of_a_name_and_labels_are_aggregated(metrics):
+    for seconds in (0.5, 0.25, 1.0):
+        metrics.record('page', seconds, page='2')
+    metrics.record('page', 3.0, page='3')
+    spans: list[dict] = metrics.snapshot()['spans']
+    assert spans == [
+        {'name': 'page', 'labels': {'page': '2'}, 'count': 3,
+         'total_seconds': 1.75, 'min_seconds': 0.25, 'max_seconds': 1.0},
+        {'name': 'page', 'labels': {'page': '3'}, 'count': 1,
+         'total_seconds': 3.0, 'min_seconds': 3.0, 'max_seconds': 3.0},
+    ]
+
+
+def test_span_is_recorded_when_the_block_fails(metrics):
+    with pytest.raises(RuntimeError):
+        with metrics.span('search'):
+            raise RuntimeError('The search failed')
+    assert [span['name'] for span in metrics.snapshot()['spans']] == [
+        'search']
+
+
+def test_counters_are_incremented_from_several_threads(metrics):
+    def increment() -> None:
+        for _ in range(1_000):
+            metrics.increment('articles_scraped')
+
+    threads: list[threading.Thread] = [threading.Thread(target=increment)
+                                       for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert metrics.snapshot()['counters'] == [
+        {'name': 'articles_scraped', 'labels': {}, 'value': 4_000}]
+
+
+def test_metrics_are_exported_as_json(tmp_path, metrics):
+    metrics.record('search', 2.0)
+    metrics.increment('image_bytes', 100, outcome='downloaded')
+    metrics.export(str(tmp_path))
+    with open(tmp_path / 'metrics.json', encoding='utf-8') as json_file:
+        assert json.load(json_file) == metrics.snapshot()
+
+
+def test_metrics_are_exported_in_the_prometheus_format(tmp_path, metrics):
+    metrics.record('page', 1.5, page='2')
+    metrics.increment('searches', mode='deep_link')
+    metrics.increment('image_bytes', 100, label='a "quoted"\\ value')
+    metrics.export(str(tmp_path))
+    with open(tmp_path / 'metrics.prom', encoding='utf-8') as prom_file:
+        assert prom_file.read().splitlines() == [
+            '# TYPE news_bot_span_seconds_total counter',
+            'news_bot_span_seconds_total{span="page",page="2"} 1.5',
+            '# TYPE news_bot_span_count_total counter',
+            'news_bot_span_count_total{span="page",page="2"} 1',
+            '# TYPE news_bot_span_seconds_max gauge',
+            'news_bot_span_seconds_max{span="page",page="2"} 1.5',
+            '# TYPE news_bot_searches_total counter',
+            'news_bot_searches_total{mode="deep_link"} 1',
+            '# TYPE news_bot_image_bytes_total counter',
+            'news_bot_image_bytes_total{label="a \\"quoted\\"\\\\ value"} '
+            '100',
+        ]
+
+
+def test_failed_export_does_not_raise(tmp_path, metrics):
+    (tmp_path / 'file').write_text('')
+    metrics.export(str(tmp_path / 'file'))
+    assert not (tmp_path / 'file' / 'metrics.json').exists()
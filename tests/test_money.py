@@ -0,0 +1,57 @@
+"""
+Tests of the mentions of money found by MoneyUtil.
+"""
+
+import time
+
+import pytest
+
+from news_bot.utils import MoneyUtil
+
+
+@pytest.mark.parametrize('text, mentions', [
+    ('It costs $11.1 today.', [(11.1, '$')]),
+    ('A $111,111.11 grant.', [(111111.11, '$')]),
+    ('A $ 25 fee.', [(25.0, '$')]),
+    ('The $1.5 million plan.', [(1500000.0, '$')]),
+    ('A $2 billion deal.', [(2000000000.0, '$')]),
+    ('It raised 11 dollars.', [(11.0, 'dollars')]),
+    ('It raised 1,200 Dollars.', [(1200.0, 'dollars')]),
+    ('It raised 3 thousand dollars.', [(3000.0, 'dollars')]),
+    ('A 40 USD ticket.', [(40.0, 'USD')]),
+    ('A USD 40.50 ticket.', [(40.5, 'USD')]),
+    ('A 7 usd tip.', [(7.0, 'USD')]),
+    ('It costs $5, and $7.', [(5.0, '$'), (7.0, '$')]),
+    ('It costs $5.', [(5.0, '$')]),
+])
+def test_amounts_and_forms(text, mentions):
+    assert MoneyUtil.find_money(text) == mentions
+
+
+@pytest.mark.parametrize('text', [
+    'It costs $1,2345.',
+    'It costs $12,34.',
+    'It costs $1.234.',
+    'It raised 1,2345 dollars.',
+    'It raised 1.234 dollars.',
+    'A USD 1,23 ticket.',
+    'It raised 11 dollarsign.',
+    'It raised 1,000.',
+    'No money here.',
+])
+def test_malformed_amounts_are_not_money(text):
+    assert MoneyUtil.find_money(text) == []
+
+
+@pytest.mark.parametrize('text', [
+    '1' * 100_000,
+    '$' + '1' * 100_000 + '.123',
+    '$' + '1,' * 50_000,
+    '1,' * 50_000 + '1 dollar',
+    '1.' * 50_000 + ' dollars',
+    ('1 ' * 50_000) + 'x',
+])
+def test_long_texts_are_searched_in_bounded_time(text):
+    started_at: float = time.perf_counter()
+    MoneyUtil.find_money(text)
+    assert time.perf_counter() - started_at < 1
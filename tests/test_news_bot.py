@@ -0,0 +1,176 @@
+"""
+Tests of how the news bot ends a run, with a fake browser and fake
+output writers.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+import news_bot.news_bot
+from news_bot import LATimesNewsBot
+from news_bot.metrics import Metrics
+from news_bot.storage import ScrapeJournal
+from tests.test_scraper import NOW, FakeBrowser
+
+
+class SearchableFakeBrowser(FakeBrowser):
+    """
+    Fake browser that can be given to the news bot, optionally failing
+    on a results page.
+    """
+
+    def __init__(self, pages: int = 10, failing_page: int | None = None,
+                 is_search_failing: bool = False,
+                 is_topic_cached: bool = True) -> None:
+        super().__init__(pages)
+        self.failing_page = failing_page
+        self.is_search_failing = is_search_failing
+        self.is_topic_cached = is_topic_cached
+        self.is_closed = False
+        self.searches: list[str] = []
+
+    def open_search_results(self, phrase: str, topic: str,
+                            topic_filters) -> bool:
+        if self.is_topic_cached:
+            self.searches.append('deep_link')
+        return self.is_topic_cached
+
+    def open_website(self) -> None:
+        pass
+
+    def close_browser(self) -> None:
+        self.is_closed = True
+
+    def reset(self) -> None:
+        self.page_number = 1
+
+    def search(self, phrase: str) -> None:
+        if self.is_search_failing:
+            raise RuntimeError('The search form could not be used')
+        self.searches.append('search_form')
+
+    def select_newest_articles(self) -> None:
+        pass
+
+    def select_topic(self, topic: str) -> None:
+        pass
+
+    def get_page_articles(self, phrase: str) -> list:
+        if self.page_number == self.failing_page:
+            raise RuntimeError('The results page could not be read')
+        return super().get_page_articles(phrase)
+
+
+class FailingExcel:
+    def save_articles_excel(self, articles, excel_dir: str) -> None:
+        for _ in articles:
+            pass
+        raise OSError('The Excel file could not be written')
+
+
+class FakeImageUtil:
+    def __init__(self, **kwargs) -> None:
+        self.image_src_list: list[str] = []
+
+    def download_images(self, image_src_list, images_dir: str) -> None:
+        self.image_src_list.extend(image_src_list)
+
+
+class RecordingJournal(ScrapeJournal):
+    instances: list = []
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self.is_closed = False
+        self.cleared_keys: list[str] = []
+        RecordingJournal.instances.append(self)
+
+    def clear(self, scrape_key: str) -> None:
+        self.cleared_keys.append(scrape_key)
+        super().clear(scrape_key)
+
+    def close(self) -> None:
+        self.is_closed = True
+        super().close()
+
+
+@pytest.fixture
+def run_news_bot(tmp_path, monkeypatch):
+    monkeypatch.setattr(news_bot.news_bot, 'Excel', FailingExcel)
+    monkeypatch.setattr(news_bot.news_bot, 'ImageUtil', FakeImageUtil)
+    monkeypatch.setattr(news_bot.news_bot, 'ScrapeJournal', RecordingJournal)
+    RecordingJournal.instances = []
+
+    def run(browser: SearchableFakeBrowser, is_launched: bool = False,
+            deep_link: bool = False) -> None:
+        # A launched browser is created by the run, like the HTTP backend
+        monkeypatch.setattr(news_bot.news_bot, 'LATimesHTTPBrowser',
+                            lambda **kwargs: browser)
+        LATimesNewsBot(
+            str(tmp_path / 'articles.xlsx'), str(tmp_path), 'http',
+            journal_path=str(tmp_path / 'journal.sqlite3'),
+            browser=None if is_launched else browser, deep_link=deep_link,
+            topic_filters_path=str(tmp_path / 'topic_filters.json')).run(
+                'phrase', NOW - timedelta(days=20), NOW, 'topic')
+
+    return run
+
+
+def test_scrape_error_is_raised_when_a_stage_also_fails(run_news_bot):
+    with pytest.raises(RuntimeError, match='results page'):
+        run_news_bot(SearchableFakeBrowser(failing_page=3))
+    journal: RecordingJournal = RecordingJournal.instances[-1]
+    assert journal.is_closed
+    assert journal.cleared_keys == []
+
+
+def test_stage_error_is_raised_once_every_resource_is_closed(run_news_bot):
+    with pytest.raises(OSError, match='Excel file'):
+        run_news_bot(SearchableFakeBrowser())
+    # The Excel file was not written, so the scrape resumes
+    journal: RecordingJournal = RecordingJournal.instances[-1]
+    assert journal.is_closed
+    assert journal.cleared_keys == []
+
+
+@pytest.mark.parametrize('browser', [
+    SearchableFakeBrowser(failing_page=3),
+    SearchableFakeBrowser(is_search_failing=True),
+])
+def test_launched_browser_is_closed_when_the_run_fails(run_news_bot,
+                                                       browser):
+    with pytest.raises(RuntimeError):
+        run_news_bot(browser, is_launched=True)
+    assert browser.is_closed
+
+
+def test_launched_browser_is_closed_when_a_stage_fails(run_news_bot):
+    browser = SearchableFakeBrowser()
+    with pytest.raises(OSError, match='Excel file'):
+        run_news_bot(browser, is_launched=True)
+    assert browser.is_closed
+
+
+def test_reused_browser_is_left_open_when_the_run_fails(run_news_bot):
+    browser = SearchableFakeBrowser(is_search_failing=True)
+    with pytest.raises(RuntimeError, match='search form'):
+        run_news_bot(browser)
+    assert not browser.is_closed
+
+
+@pytest.mark.parametrize('is_topic_cached, searches', [
+    (True, ['deep_link']),
+    (False, ['search_form']),
+])
+def test_search_form_is_used_when_the_deep_link_fails(run_news_bot,
+                                                      is_topic_cached,
+                                                      searches):
+    browser = SearchableFakeBrowser(is_topic_cached=is_topic_cached)
+    with pytest.raises(OSError, match='Excel file'):
+        run_news_bot(browser, deep_link=True)
+    assert browser.searches == searches
+    assert [(counter['labels'], counter['value'])
+            for counter in Metrics().snapshot()['counters']
+            if counter['name'] == 'searches'] == [
+                ({'mode': searches[0]}, 1)]
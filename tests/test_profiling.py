@@ -0,0 +1,68 @@
+"""
+Tests of the profiles written by the Profiler in its CPU and wall-clock
+modes.
+"""
+
+import pstats
+import threading
+import time
+
+import pytest
+
+from news_bot.profiling import Profiler
+
+
+def busy_function(seconds: float) -> None:
+    started_at: float = time.perf_counter()
+    while time.perf_counter() - started_at < seconds:
+        pass
+
+
+def sleeping_function(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_cpu_profile_has_the_functions_of_the_run(tmp_path):
+    with Profiler('cpu', str(tmp_path)):
+        busy_function(0.05)
+    stats = pstats.Stats(str(tmp_path / 'profile.pstats'))
+    assert any(function_name == 'busy_function'
+               for _, _, function_name in stats.stats)
+    summary: str = (tmp_path / 'profile_summary.txt').read_text()
+    assert summary.startswith('CPU profile of the main thread')
+    assert 'busy_function' in summary
+
+
+def test_wall_profile_samples_every_thread(tmp_path):
+    with Profiler('wall', str(tmp_path), interval=0.001):
+        worker = threading.Thread(target=sleeping_function, args=(0.1,),
+                                  name='image-downloader')
+        worker.start()
+        busy_function(0.1)
+        worker.join()
+    stacks: dict[str, int] = {}
+    for line in (tmp_path / 'profile.collapsed').read_text().splitlines():
+        stack, samples = line.rsplit(' ', 1)
+        stacks[stack] = int(samples)
+    # Waiting is sampled too, with the name of its thread first
+    assert any(stack.startswith('image-downloader;')
+               and 'sleeping_function' in stack for stack in stacks)
+    assert any(stack.startswith('MainThread;')
+               and stack.split(';')[-1].startswith('busy_function')
+               for stack in stacks)
+    summary: str = (tmp_path / 'profile_summary.txt').read_text()
+    assert summary.startswith('Wall-clock profile of every thread')
+    assert f'{sum(stacks.values())} samples every 1ms' in summary
+    assert 'sleeping_function' in summary
+
+
+def test_profile_is_written_when_the_run_fails(tmp_path):
+    with pytest.raises(RuntimeError):
+        with Profiler('wall', str(tmp_path)):
+            raise RuntimeError('The run failed')
+    assert (tmp_path / 'profile_summary.txt').exists()
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match='memory'):
+        Profiler('memory', str(tmp_path))
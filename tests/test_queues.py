@@ -0,0 +1,109 @@
+"""
+Tests of the leases of the SQLite job queue and of the LeaseKeeper.
+"""
+
+import time
+
+import pytest
+
+from news_bot.queues import LeaseKeeper, SQLiteJobQueue
+
+LEASE_SECONDS: float = 0.2
+
+
+@pytest.fixture
+def queue_path(tmp_path) -> str:
+    return str(tmp_path / 'queue.sqlite3')
+
+
+@pytest.fixture
+def queue(queue_path):
+    queue = SQLiteJobQueue(queue_path, lease_seconds=LEASE_SECONDS,
+                           max_attempts=2, retry_delay=0)
+    yield queue
+    queue.close()
+
+
+def test_jobs_are_claimed_oldest_first_by_one_worker(queue):
+    first_id: int = queue.put({'phrase': 'first'})
+    second_id: int = queue.put({'phrase': 'second'})
+    first_job: dict = queue.claim('worker-1')
+    second_job: dict = queue.claim('worker-2')
+    assert (first_job['id'], first_job['query']) == (first_id,
+                                                     {'phrase': 'first'})
+    assert first_job['attempts'] == 1
+    assert second_job['id'] == second_id
+    assert queue.claim('worker-3') is None
+    assert queue.counts() == {'pending': 0, 'leased': 2, 'done': 0,
+                              'failed': 0}
+
+
+def test_completed_jobs_drain_the_queue(queue):
+    job_id: int = queue.put({'phrase': 'city'})
+    queue.claim('worker-1')
+    assert not queue.is_drained()
+    assert queue.complete(job_id, 'worker-1', {'excel_file': 'a.xlsx'})
+    assert queue.is_drained()
+    job: dict = queue.get_job(job_id)
+    assert job['status'] == 'done'
+    assert job['result'] == {'excel_file': 'a.xlsx'}
+
+
+def test_expired_lease_is_claimed_by_another_worker(queue):
+    job_id: int = queue.put({'phrase': 'city'})
+    queue.claim('worker-1')
+    time.sleep(LEASE_SECONDS * 1.5)
+    job: dict = queue.claim('worker-2')
+    assert (job['id'], job['attempts']) == (job_id, 2)
+    # The first worker no longer holds the lease
+    assert not queue.heartbeat(job_id, 'worker-1')
+    assert not queue.complete(job_id, 'worker-1', {})
+    assert not queue.fail(job_id, 'worker-1', 'error')
+    assert queue.heartbeat(job_id, 'worker-2')
+    assert queue.complete(job_id, 'worker-2', {})
+
+
+def test_heartbeats_keep_the_lease(queue):
+    job_id: int = queue.put({'phrase': 'city'})
+    queue.claim('worker-1')
+    for _ in range(3):
+        time.sleep(LEASE_SECONDS / 2)
+        assert queue.heartbeat(job_id, 'worker-1')
+    assert queue.claim('worker-2') is None
+
+
+def test_failed_jobs_are_retried_until_the_last_attempt(queue):
+    job_id: int = queue.put({'phrase': 'city'})
+    queue.claim('worker-1')
+    assert queue.fail(job_id, 'worker-1', 'first error')
+    assert queue.get_job(job_id)['status'] == 'pending'
+    queue.claim('worker-2')
+    assert queue.fail(job_id, 'worker-2', 'second error')
+    job: dict = queue.get_job(job_id)
+    assert (job['status'], job['error']) == ('failed', 'second error')
+    assert queue.is_drained()
+
+
+def test_lease_keeper_renews_the_lease(queue, queue_path):
+    job_id: int = queue.put({'phrase': 'city'})
+    queue.claim('worker-1')
+    with LeaseKeeper(
+            lambda: SQLiteJobQueue(queue_path, lease_seconds=LEASE_SECONDS),
+            job_id, 'worker-1', LEASE_SECONDS / 4) as lease:
+        time.sleep(LEASE_SECONDS * 2)
+        assert queue.claim('worker-2') is None
+    assert not lease.is_lost
+    assert queue.complete(job_id, 'worker-1', {})
+
+
+def test_lease_keeper_signals_a_lost_lease(queue, queue_path):
+    job_id: int = queue.put({'phrase': 'city'})
+    queue.claim('worker-1')
+    time.sleep(LEASE_SECONDS * 1.5)
+    queue.claim('worker-2')
+    with LeaseKeeper(
+            lambda: SQLiteJobQueue(queue_path, lease_seconds=LEASE_SECONDS),
+            job_id, 'worker-1', LEASE_SECONDS / 4) as lease:
+        assert lease.lost.wait(LEASE_SECONDS * 10)
+    assert lease.is_lost
+    assert queue.get_job(job_id)['worker_id'] == 'worker-2'
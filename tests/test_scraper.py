@@ -0,0 +1,144 @@
+"""
+Tests of the Scraper, with a fake browser serving generated results
+pages.
+"""
+
+from datetime import datetime, timedelta
+import threading
+
+import pytest
+
+from news_bot.handlers import Scraper
+from news_bot.models import Article
+from news_bot.storage import ArticleStore, ScrapeJournal
+
+NOW: datetime = datetime.now()
+
+
+class FakeBrowser:
+    """
+    Browser serving results pages of three dated articles followed by
+    an article without a date, the articles of page n being 3n to 3n + 2
+    days old. It moves from page to page, like the Selenium browser.
+    """
+
+    def __init__(self, pages: int = 10) -> None:
+        self.pages = pages
+        self.page_number = 1
+
+    @staticmethod
+    def page(page_number: int) -> list[Article]:
+        articles: list[Article] = [
+            Article(f'Article {page_number}-{index}', 'Description',
+                    NOW - timedelta(days=page_number * 3 + index),
+                    'https://example.com/image.jpg', 'image.jpg', (), 0)
+            for index in range(3)
+            ]
+        articles.append(Article(f'Undated {page_number}', 'Description',
+                                None, 'https://example.com/image.jpg',
+                                'image.jpg', (), 0, 'Date not found'))
+        return articles
+
+    def get_page_articles(self, phrase: str) -> list[Article]:
+        return self.page(self.page_number)
+
+    def next_page(self, page_number: int) -> bool:
+        if page_number >= self.pages:
+            return False
+        self.page_number = page_number + 1
+        return True
+
+
+class ConcurrentFakeBrowser(FakeBrowser):
+    """
+    Fake browser that can fetch any page, like the HTTP backend, and
+    records the pages it was asked for.
+    """
+
+    def __init__(self, pages: int = 10) -> None:
+        super().__init__(pages)
+        self.requested_pages: list[int] = []
+
+    def get_page_articles_at(self, page_number: int,
+                             phrase: str) -> list[Article]:
+        self.requested_pages.append(page_number)
+        if page_number > self.pages:
+            return []
+        return self.page(page_number)
+
+    def close_idle_sessions(self) -> None:
+        pass
+
+
+def test_undated_articles_are_skipped_with_a_journal(tmp_path):
+    journal = ScrapeJournal(str(tmp_path / 'journal.sqlite3'))
+    articles: list[Article] = Scraper(
+        FakeBrowser(), 1, None, journal).scrape_articles_in_date_range(
+            NOW - timedelta(days=100), NOW, 'phrase', 'topic')
+    journal.close()
+    assert len(articles) == 30
+    assert all(article.date is not None for article in articles)
+
+
+def test_undated_articles_are_skipped_with_a_store(tmp_path):
+    store = ArticleStore(str(tmp_path / 'articles.sqlite3'))
+    articles: list[Article] = Scraper(
+        ConcurrentFakeBrowser(), 3, store,
+        None).scrape_articles_in_date_range(
+            NOW - timedelta(days=100), NOW, 'phrase', 'topic')
+    store.close()
+    assert len(articles) == 30
+
+
+def test_article_key_of_undated_article():
+    undated = Article('Title', 'Description', None, 'src', 'file', (), 0,
+                      'Date not found')
+    assert ArticleStore.article_key(undated) != ArticleStore.article_key(
+        Article('Title', 'Description', NOW, 'src', 'file', (), 0))
+
+
+def scrape_titles(browser: FakeBrowser, workers: int,
+                  start_date: datetime, end_date: datetime) -> list[str]:
+    return [article.title for article in Scraper(
+        browser, workers, None, None).scrape_articles_in_date_range(
+            start_date, end_date, 'phrase', 'topic')]
+
+
+def test_concurrent_pages_are_fetched_once_for_a_recent_window():
+    browser = ConcurrentFakeBrowser()
+    start_date: datetime = NOW - timedelta(days=7)
+    assert scrape_titles(browser, 3, start_date, NOW) == scrape_titles(
+        FakeBrowser(), 1, start_date, NOW)
+    assert sorted(browser.requested_pages) == sorted(
+        set(browser.requested_pages))
+
+
+def test_concurrent_pages_are_fetched_once_for_a_backfill():
+    browser = ConcurrentFakeBrowser()
+    start_date: datetime = NOW - timedelta(days=25)
+    end_date: datetime = NOW - timedelta(days=16)
+    titles: list[str] = scrape_titles(browser, 3, start_date, end_date)
+    assert titles
+    assert titles == scrape_titles(FakeBrowser(), 1, start_date, end_date)
+    assert sorted(browser.requested_pages) == sorted(
+        set(browser.requested_pages))
+    # The pages before the date range are skipped by the locator
+    assert 3 not in browser.requested_pages
+
+
+def test_stopped_scrape_keeps_its_journaled_pages(tmp_path):
+    journal = ScrapeJournal(str(tmp_path / 'journal.sqlite3'))
+    stop_event = threading.Event()
+    scraper = Scraper(FakeBrowser(), 1, None, journal, stop_event)
+    start_date: datetime = NOW - timedelta(days=100)
+    titles: list[str] = []
+    with pytest.raises(RuntimeError, match='stopped'):
+        for article in scraper.iter_articles_in_date_range(
+                start_date, NOW, 'phrase', 'topic'):
+            titles.append(article.title)
+            stop_event.set()
+    checkpoint: dict = journal.get_checkpoint(
+        ScrapeJournal.scrape_key('phrase', 'topic', start_date, NOW))
+    journal.close()
+    assert len(titles) == 3
+    assert checkpoint['next_page'] == 2
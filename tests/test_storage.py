@@ -0,0 +1,49 @@
+"""
+Tests of the TopicFilterCache, which keeps the filter of each topic
+used to deep link to the filtered results page.
+"""
+
+import pytest
+
+from news_bot.storage import TopicFilterCache
+
+POLITICS_FILTER: tuple[str, str] = ('f0', '00000168-8694-d8d4-a5ef')
+SPORTS_FILTER: tuple[str, str] = ('f0', '00000163-01e8-d567-ad67')
+
+
+@pytest.fixture
+def cache_path(tmp_path) -> str:
+    return str(tmp_path / 'state' / 'topic_filters.json')
+
+
+def test_topics_are_compared_case_insensitively():
+    topic_filters = TopicFilterCache()
+    topic_filters.update({'Politics': POLITICS_FILTER})
+    assert topic_filters.get('politics') == POLITICS_FILTER
+    assert topic_filters.get('POLITICS') == POLITICS_FILTER
+    assert topic_filters.get('Sports') is None
+
+
+def test_filters_are_shared_through_the_file(cache_path):
+    TopicFilterCache(cache_path).update({'Politics': POLITICS_FILTER,
+                                         'Sports': SPORTS_FILTER})
+    topic_filters = TopicFilterCache(cache_path)
+    assert topic_filters.get('Politics') == POLITICS_FILTER
+    topic_filters.remove('Sports')
+    # Removing a topic that is not cached leaves the file as it is
+    topic_filters.remove('Weather')
+    assert TopicFilterCache(cache_path).get('Sports') is None
+    assert TopicFilterCache(cache_path).get('Politics') == POLITICS_FILTER
+
+
+@pytest.mark.parametrize('content', ['{"politics": ', '[]', '{"a": 1}'])
+def test_unreadable_file_starts_an_empty_cache(cache_path, content):
+    topic_filters = TopicFilterCache(cache_path)
+    topic_filters.update({'Politics': POLITICS_FILTER})
+    with open(cache_path, 'w', encoding='utf-8') as cache_file:
+        cache_file.write(content)
+    topic_filters = TopicFilterCache(cache_path)
+    assert topic_filters.get('Politics') is None
+    # The next search caches the filters again
+    topic_filters.update({'Politics': POLITICS_FILTER})
+    assert TopicFilterCache(cache_path).get('Politics') == POLITICS_FILTER